@@ -108,9 +108,13 @@ class RunnerConfig(_BaseConfig):
     example environment variable setting:
     CORE_ORG_NAME=<core_org_name>
     CORE_SPACE_NAME=<core_space_name>
+    MAX_CONCURRENT_RUNS=<number_of_suites_run_at_the_same_time>
+    MAX_QUEUE_SIZE=<number_of_suites_waiting_for_a_free_worker>
     """
     CORE_ORG_NAME = "CORE_ORG_NAME"
     CORE_SPACE_NAME = "CORE_SPACE_NAME"
+    MAX_CONCURRENT_RUNS = "MAX_CONCURRENT_RUNS"
+    MAX_QUEUE_SIZE = "MAX_QUEUE_SIZE"
     _default_config = {
         "core_org_name": "trustedanalytics",
         "core_space_name": "platform",
@@ -118,6 +122,12 @@ class RunnerConfig(_BaseConfig):
         "cwd": "project",
         "suite_name": os.path.abspath("project/tests/test_smoke/test_functional.py"),
         "max_execution_time": 1800,  # 30 minutes
+        "max_concurrent_runs": 1,
+        "max_queue_size": 10,
+        "watchdog_interval": 10,  # seconds
+        "default_run_time": 1800,  # used for ETA when there are no finished runs
+        "progress_buffer_size": 1000,  # progress events kept per run
+        "progress_buffer_runs": 10,  # finished runs for which progress is kept
     }
 
     def _parse_environment_variables(self) -> dict:
@@ -129,6 +139,12 @@ class RunnerConfig(_BaseConfig):
         core_space_name = os.environ.get(self.CORE_SPACE_NAME)
         if core_space_name is not None:
             environment_config["core_space_name"] = core_space_name
+        max_concurrent_runs = os.environ.get(self.MAX_CONCURRENT_RUNS)
+        if max_concurrent_runs is not None:
+            environment_config["max_concurrent_runs"] = int(max_concurrent_runs)
+        max_queue_size = os.environ.get(self.MAX_QUEUE_SIZE)
+        if max_queue_size is not None:
+            environment_config["max_queue_size"] = int(max_queue_size)
 
         return environment_config
 
@@ -24,8 +24,8 @@ import pymongo
 
 from config import AppConfig
 from console_authenticator import AuthenticationException, ConsoleAuthenticator
-from model import TestSuiteModel
-from runner import Runner
+from model import TestResultModel, TestSuiteModel
+from runner import Runner, RunnerQueueFullException
 from suite_provider import SuiteProvider
 
 app = flask.Flask(__name__)
@@ -44,24 +44,32 @@ class ExceptionHandlingApi(flask_restful.Api):
         return self.make_response(response, code)
 
 
+def suite_to_dict(suite: TestSuiteModel, queue_info: dict):
+    """Return suite dict representation, extended with queue position and ETA if the suite is queued or running."""
+    result = suite.to_dict()
+    result.update(queue_info.get(suite.id, {}))
+    return result
+
+
 class Test(flask_restful.Resource):
     runner = Runner()
     console_authenticator = ConsoleAuthenticator(tap_domain=app_config.tap_domain)
 
     def get(self):
-        """Return a list of performed tests."""
-        all_suites = [s.to_dict() for s in TestSuiteModel.get_list()]
+        """Return a list of performed tests, queued and running tests include queue position and ETA."""
+        queue_info = self.runner.queue_info()
+        all_suites = [suite_to_dict(s, queue_info) for s in TestSuiteModel.get_list()]
         return flask.Response(json.dumps(all_suites), mimetype="application/json")
 
     def post(self):
         """
-        Check whether runner is busy
+        Check whether run queue is full
         if so, return 429
         else, call Runner.run
-        return test id from Runner.run
+        return test id, queue position and ETA of the new suite
         """
-        if self.runner.is_busy:
-            flask_restful.abort(429, message="Runner is busy")
+        if self.runner.is_full:
+            flask_restful.abort(429, message="Run queue is full")
 
         username = password = None
         try:
@@ -75,11 +83,16 @@ class Test(flask_restful.Resource):
         except AuthenticationException:
             flask_restful.abort(401, message="Incorrect credentials")
 
-        new_suite = self.runner.run(username=username, password=password)
-        return flask.jsonify(new_suite.to_dict())
+        try:
+            new_suite = self.runner.run(username=username, password=password)
+        except RunnerQueueFullException as e:
+            flask_restful.abort(429, message=str(e))
+        return flask.jsonify(suite_to_dict(new_suite, self.runner.queue_info()))
 
 
 class TestResult(flask_restful.Resource):
+    runner = Runner()
+
     def get(self, test_id):
         """Return detailed results of one test."""
         suite = None
@@ -87,13 +100,62 @@ class TestResult(flask_restful.Resource):
             suite = TestSuiteModel.get_by_id(suite_id=ObjectId(test_id))
         except (pymongo.errors.InvalidId, TypeError):
             flask_restful.abort(404, message="Not found")
-        return flask.jsonify(suite.to_dict())
+        return flask.jsonify(suite_to_dict(suite, self.runner.queue_info()))
+
+
+class TestProgress(flask_restful.Resource):
+    runner = Runner()
+    KEEP_ALIVE_INTERVAL = 15  # seconds
+
+    def get(self, test_id):
+        """
+        Stream progress of queued, running or recently finished test as server-sent events:
+        "log" for each line of output, "result" for each test result and "end" when the test ends.
+        Clients reconnecting with Last-Event-ID header receive only newer events.
+        """
+        progress = None
+        try:
+            progress = self.runner.progress(ObjectId(test_id))
+        except (pymongo.errors.InvalidId, TypeError):
+            flask_restful.abort(404, message="Not found")
+        if progress is None:
+            flask_restful.abort(404, message="No progress available for this test")
+        last_id = flask.request.headers.get("Last-Event-ID", -1, type=int)
+        return flask.Response(self._stream(progress, last_id), mimetype="text/event-stream",
+                              headers={"Cache-Control": "no-cache"})
+
+    @classmethod
+    def _stream(cls, progress, last_id):
+        while True:
+            events = progress.get_events(last_id, timeout=cls.KEEP_ALIVE_INTERVAL)
+            if len(events) == 0:
+                if progress.is_finished:
+                    break
+                yield ": keep-alive\n\n"
+            for event in events:
+                yield "id: {}\nevent: {}\ndata: {}\n\n".format(event.id, event.event, json.dumps(event.data))
+                last_id = event.id
+
+
+class TestCancel(flask_restful.Resource):
+    runner = Runner()
+
+    def delete(self, test_id):
+        """Cancel queued or running test, return 404 if the test is neither queued nor running."""
+        suite_id = None
+        try:
+            suite_id = ObjectId(test_id)
+        except (pymongo.errors.InvalidId, TypeError):
+            flask_restful.abort(404, message="Not found")
+        if not self.runner.cancel(suite_id):
+            flask_restful.abort(404, message="Test is not queued or running")
+        return flask.jsonify(TestSuiteModel.get_by_id(suite_id=suite_id).to_dict())
 
 
 class TestSuite(flask_restful.Resource):
     def get(self):
         """Return a list of available test suites."""
-        suites = SuiteProvider.get_list(TestSuiteModel)
+        suites = SuiteProvider.get_list(TestSuiteModel, TestResultModel)
         return flask.Response(json.dumps(suites), mimetype="application/json")
 
 
@@ -101,6 +163,11 @@ if __name__ == "__main__":
     api = ExceptionHandlingApi(app, catch_all_404s=True)
     api.add_resource(Test, "/rest/platform_tests/tests")
     api.add_resource(TestResult, "/rest/platform_tests/tests/<test_id>/results")
+    api.add_resource(TestProgress, "/rest/platform_tests/tests/<test_id>/stream")
+    api.add_resource(TestCancel, "/rest/platform_tests/tests/<test_id>")
     api.add_resource(TestSuite, "/rest/platform_tests/tests/suites")
 
-    app.run(host=app_config.hostname, port=app_config.port, debug=app_config.debug)
+    SuiteProvider.build_catalog()
+
+    # threaded, so that progress streams do not block other requests
+    app.run(host=app_config.hostname, port=app_config.port, debug=app_config.debug, threaded=True)
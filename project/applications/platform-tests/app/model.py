@@ -14,6 +14,8 @@
 # limitations under the License.
 #
 
+import datetime
+
 from bson.objectid import ObjectId
 import pymongo
 
@@ -52,6 +54,17 @@ class TestResultModel(object):
             test_results.append(cls(mongo_document=test_result_document))
         return test_results
 
+    @classmethod
+    def get_average_durations(cls, names: list) -> dict:
+        """
+        Aggregate results of tests with given names and return dict name -> average test duration in seconds.
+        """
+        results = cls._collection.aggregate([
+            {"$match": {"name": {"$in": list(names)}, "duration": {"$ne": None}}},
+            {"$group": {"_id": "$name", "duration": {"$avg": "$duration"}}}
+        ])
+        return {r["_id"]: r["duration"] for r in results}
+
     def to_dict(self):
         result = {
             "id": str(self.__id),
@@ -68,10 +81,12 @@ class TestResultModel(object):
 class TestSuiteModel(object):
     _collection = DatabaseClient.suite_collection
     INTERRUPTED_KEY = "interrupted"
+    CANCELLED_KEY = "cancelled"
 
     def __init__(self, mongo_document: dict, test_results: list=None):
         """Initialize based on mongo_document dict representation."""
         self.__id = mongo_document["_id"]
+        self.__suite = mongo_document.get("suite")
         self.__start_date = mongo_document.get("start_date")
         self.__end_date = mongo_document.get("end_date")
         self.__state = self.__determine_state(mongo_document)
@@ -86,7 +101,9 @@ class TestSuiteModel(object):
     @staticmethod
     def __determine_state(mongo_document):
         state = mongo_document.get("status")
-        if mongo_document.get("interrupted"):
+        if mongo_document.get("cancelled"):
+            suite_state = "CANCELLED"
+        elif mongo_document.get("interrupted"):
             suite_state = "FAIL"
         elif state is None:
             suite_state = None
@@ -101,13 +118,14 @@ class TestSuiteModel(object):
         return {"_id": suite_id}
 
     @classmethod
-    def initialize(cls):
+    def initialize(cls, suite=None):
         """
-        Insert new, empty document into suite collection.
+        Insert new document into suite collection, containing only id of the suite which is run.
         Return TestSuiteModel with newly-inserted object id.
         """
-        suite_id = cls._collection.insert_one({}).inserted_id
-        return cls(mongo_document={"_id": suite_id})
+        suite_document = {} if suite is None else {"suite": suite}
+        suite_id = cls._collection.insert_one(suite_document).inserted_id
+        return cls(mongo_document=dict(suite_document, _id=suite_id))
 
     def is_interrupted(self):
         """
@@ -123,6 +141,37 @@ class TestSuiteModel(object):
         update_field = {"$set": {self.INTERRUPTED_KEY: True}}
         self._collection.update_one(self._get_filter(self.id), update=update_field)
 
+    def set_cancelled(self):
+        """
+        Update test suite mongodb document, setting cancelled flag.
+        """
+        update_field = {"$set": {self.CANCELLED_KEY: True}}
+        self._collection.update_one(self._get_filter(self.id), update=update_field)
+
+    def set_run_time(self, start_time: datetime.datetime, end_time: datetime.datetime):
+        """
+        Update test suite mongodb document, setting start and end time of the subprocess which ran the tests.
+        """
+        update_field = {"$set": {"start_time": start_time, "end_time": end_time}}
+        self._collection.update_one(self._get_filter(self.id), update=update_field)
+
+    @classmethod
+    def get_average_run_time(cls, suite, last=5):
+        """
+        Aggregate last finished, not cancelled runs of the suite and return average run time in seconds.
+        Return None if there are no such runs.
+        """
+        results = list(cls._collection.aggregate([
+            {"$match": {"suite": suite, "start_time": {"$ne": None}, "end_time": {"$ne": None},
+                        cls.CANCELLED_KEY: {"$ne": True}}},
+            {"$sort": {"end_time": -1}},
+            {"$limit": last},
+            {"$group": {"_id": None, "run_time": {"$avg": {"$subtract": ["$end_time", "$start_time"]}}}}
+        ]))
+        if len(results) == 0 or results[0]["run_time"] is None:
+            return None
+        return results[0]["run_time"] / 1000  # subtracting dates gives milliseconds
+
     @classmethod
     def get_by_id(cls, suite_id: ObjectId):
         """
@@ -158,7 +207,7 @@ class TestSuiteModel(object):
             "endDate": self.__end_date,
             "testsAll": self.__tests_all,
             "testsFinished": self.__tests_finished,
-            "testName": SuiteProvider.SUITE_NAME
+            "testName": SuiteProvider.get_title(self.__suite)
         }
         if self.__test_results is not None:
             result["tests"] = [t.to_dict() for t in self.__test_results]
@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import collections
+import re
+import threading
+
+
+ProgressEvent = collections.namedtuple("ProgressEvent", ["id", "event", "data"])
+
+
+class RunProgress(object):
+    """
+    Ring buffer of progress events (log lines and test results) of one suite run.
+    Only max_size newest events are kept, so clients which fall behind miss the oldest events.
+    """
+    LOG = "log"
+    RESULT = "result"
+    END = "end"
+
+    # pytest -v reports each test as e.g. "project/tests/test_smoke/test_functional.py::test_login PASSED"
+    RESULT_PATTERN = re.compile(r"^(?P<name>\S+::\S+)\s+(?P<result>PASSED|FAILED|ERROR|SKIPPED|xfail|XPASS)\b")
+
+    def __init__(self, max_size):
+        self._events = collections.deque(maxlen=max_size)
+        self._next_id = 0
+        self._condition = threading.Condition()
+        self._is_finished = False
+
+    @property
+    def is_finished(self):
+        return self._is_finished
+
+    def append(self, event, data: dict):
+        with self._condition:
+            self._events.append(ProgressEvent(self._next_id, event, data))
+            self._next_id += 1
+            self._condition.notify_all()
+
+    def append_output(self, line):
+        """Add subprocess output line as a log event, and as a result event if it reports a test result."""
+        self.append(self.LOG, {"line": line})
+        match = self.RESULT_PATTERN.match(line)
+        if match is not None:
+            self.append(self.RESULT, {"name": match.group("name"), "result": match.group("result").upper()})
+
+    def finish(self, **data):
+        """Add end event and wake up all clients."""
+        with self._condition:
+            self._is_finished = True
+            self.append(self.END, data)
+
+    def get_events(self, last_id=-1, timeout=None) -> list:
+        """
+        Return events with id greater than last_id which are still in the buffer.
+        If there are none, wait at most timeout seconds for new events, unless the run is finished.
+        """
+        with self._condition:
+            if self._next_id - 1 <= last_id and not self._is_finished:
+                self._condition.wait(timeout)
+            return [e for e in self._events if e.id > last_id]
@@ -14,24 +14,44 @@
 # limitations under the License.
 #
 
-import ctypes
+import collections
+import datetime
+import heapq
 import logging
-import multiprocessing
 import os
-import signal
 import subprocess
 import sys
+import threading
 import time
 
 from config import RunnerConfig, DatabaseConfig
 from model import TestSuiteModel
+from progress import RunProgress
+from suite_provider import SuiteProvider
 
 logging.basicConfig(stream=sys.stdout)
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+class SuiteRun(object):
+    """Suite run requested by a user - waits in the queue, then tests are run in a subprocess."""
+
+    def __init__(self, suite: TestSuiteModel, username, password, progress: RunProgress):
+        self.suite = suite
+        self.username = username
+        self.password = password
+        self.progress = progress
+        self.process = None
+        self.start_time = None
+        self.cancelled = False
+
+
 class Runner(object):
+    """
+    Runs test suites in subprocesses, at most max_concurrent_runs at the same time.
+    Remaining runs wait in a FIFO queue of at most max_queue_size runs.
+    """
     _instance = None
     _config = RunnerConfig()
     _db_config = DatabaseConfig()
@@ -39,70 +59,171 @@ class Runner(object):
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._initialize()
         return cls._instance
 
-    def __init__(self):
-        self._is_busy = multiprocessing.Value(ctypes.c_bool, False)
-        self._pid = multiprocessing.Value(ctypes.c_int, -1)
+    def _initialize(self):
+        self._lock = threading.Lock()
+        self._queue = collections.deque()
+        self._running = collections.OrderedDict()  # suite id -> SuiteRun
+        self._progress = collections.OrderedDict()  # suite id -> RunProgress
         self._test_cwd = self._config.cwd
-        self._current_suite = None
-        self._username = None
-        self._password = None
-        self._start_time = 0
-        self.command = [self._config.pytest_command, self._config.suite_name]
+        self.command = [self._config.pytest_command, "-v", self._config.suite_name]
+        self.suite_id = SuiteProvider.get_suite_id(self._config.suite_name)
+        self._watchdog = threading.Thread(target=self._watch, name="runner-watchdog", daemon=True)
+        self._watchdog.start()
 
     @property
     def is_busy(self):
-        self._ensure_max_execution_time_not_exceeded()
-        return self._is_busy.value
+        """True if all workers are running suites, so that new runs have to wait in the queue."""
+        with self._lock:
+            return len(self._running) >= self._config.max_concurrent_runs
 
     @property
-    def env(self):
+    def is_full(self):
+        """True if no more runs can be queued."""
+        with self._lock:
+            return self._is_full()
+
+    def _is_full(self):
+        return (len(self._running) >= self._config.max_concurrent_runs and
+                len(self._queue) >= self._config.max_queue_size)
+
+    def env(self, suite_run: SuiteRun):
         return {
             "PT_TAP_DOMAIN": self._config.tap_domain,
-            "PT_ADMIN_USERNAME": self._username,
-            "PT_ADMIN_PASSWORD": self._password,
+            "PT_ADMIN_USERNAME": suite_run.username,
+            "PT_ADMIN_PASSWORD": suite_run.password,
             "PT_CORE_ORG_NAME": self._config.core_org_name,
             "PT_CORE_SPACE_NAME": self._config.core_space_name,
             "PT_DATABASE_URL": self._db_config.uri,
-            "PT_TEST_RUN_ID": str(self._current_suite.id),
+            "PT_TEST_RUN_ID": str(suite_run.suite.id),
             "PT_COLLECT_LOGSEARCH_LOGS": "False"  # environment variables must be strings
         }
 
     def run(self, username, password):
         """
-        Get new suite id, set current_suite_id. Start tests in a separate process.
-        Return suite id.
+        Create new suite and add it to the queue. Tests are started in a subprocess as soon as a worker is free.
+        Return the suite, raise RunnerQueueFullException if the queue is full.
         """
-        self._username = username
-        self._password = password
-        self._current_suite = TestSuiteModel.initialize()
-        self._is_busy.value = True
-        self._start_time = time.time()
-        multiprocessing.Process(target=self._worker).start()
-        return self._current_suite
-
-    def _ensure_max_execution_time_not_exceeded(self):
-        if self._is_busy.value and time.time() - self._start_time > self._config.max_execution_time:
-            logger.warning("Killing subprocess {}".format(self._pid.value))
-            os.kill(self._pid.value, signal.SIGKILL)
-            self._is_busy.value = False
-
-    def _worker(self):
+        with self._lock:
+            if self._is_full():
+                raise RunnerQueueFullException()
+            suite_run = SuiteRun(TestSuiteModel.initialize(suite=self.suite_id), username, password,
+                                 progress=self._create_progress())
+            self._progress[suite_run.suite.id] = suite_run.progress
+            self._queue.append(suite_run)
+            logger.info("Suite {} queued at position {}".format(suite_run.suite.id, len(self._queue)))
+            self._start_queued_runs()
+        return suite_run.suite
+
+    def cancel(self, suite_id):
+        """
+        Remove queued suite from the queue or kill the subprocess of a running suite.
+        Return False if the suite is neither queued nor running.
+        """
+        with self._lock:
+            suite_run = next((r for r in self._queue if r.suite.id == suite_id), None)
+            if suite_run is not None:
+                self._queue.remove(suite_run)
+            else:
+                suite_run = self._running.get(suite_id)
+                if suite_run is None:
+                    return False
+                self._kill(suite_run)
+            suite_run.cancelled = True
+        logger.info("Suite {} cancelled".format(suite_id))
+        suite_run.suite.set_cancelled()
+        if suite_run.process is None:
+            suite_run.progress.finish(cancelled=True)
+        return True
+
+    def progress(self, suite_id) -> RunProgress:
+        """Return progress of queued, running or recently finished suite, None for other suites."""
+        with self._lock:
+            return self._progress.get(suite_id)
+
+    def _create_progress(self):
+        """Create progress buffer for new run, drop the oldest finished ones. Must be called with lock acquired."""
+        finished = [suite_id for suite_id, p in self._progress.items() if p.is_finished]
+        for suite_id in finished[:max(len(finished) - self._config.progress_buffer_runs + 1, 0)]:
+            del self._progress[suite_id]
+        return RunProgress(self._config.progress_buffer_size)
+
+    def queue_info(self) -> dict:
+        """
+        Return dict suite id -> info for running and queued suites. Info contains queue position (0 for running
+        suites) and ETA - estimated number of seconds left until the suite ends, assuming each suite takes
+        average run time of recent suites.
+        """
+        run_time = (SuiteProvider.get_average_run_seconds(TestSuiteModel, self.suite_id) or
+                    self._config.default_run_time)
+        now = time.time()
+        with self._lock:
+            running = [(r.suite.id, r.start_time) for r in self._running.values()]
+            queued = [r.suite.id for r in self._queue]
+        info = {}
+        free_at = []  # seconds from now when each worker becomes free
+        for suite_id, start_time in running:
+            end = max(start_time + run_time - now, 0)
+            free_at.append(end)
+            info[suite_id] = {"queuePosition": 0, "eta": int(end)}
+        free_at.extend([0] * (self._config.max_concurrent_runs - len(free_at)))
+        heapq.heapify(free_at)
+        for position, suite_id in enumerate(queued, start=1):
+            end = heapq.heappop(free_at) + run_time
+            heapq.heappush(free_at, end)
+            info[suite_id] = {"state": "QUEUED", "queuePosition": position, "eta": int(end)}
+        return info
+
+    def _start_queued_runs(self):
+        """Start queued runs while there are free workers. Must be called with lock acquired."""
+        while self._queue and len(self._running) < self._config.max_concurrent_runs:
+            suite_run = self._queue.popleft()
+            suite_run.start_time = time.time()
+            self._running[suite_run.suite.id] = suite_run
+            threading.Thread(target=self._worker, args=(suite_run,), daemon=True).start()
+
+    def _finish(self, suite_run: SuiteRun):
+        with self._lock:
+            self._running.pop(suite_run.suite.id, None)
+            self._start_queued_runs()
+
+    def _kill(self, suite_run: SuiteRun):
+        """Kill subprocess of a running suite. Must be called with lock acquired."""
+        if suite_run.process is not None and suite_run.process.poll() is None:
+            logger.warning("Killing subprocess {}".format(suite_run.process.pid))
+            suite_run.process.kill()
+
+    def _watch(self):
+        """Periodically kill subprocesses which exceeded max execution time."""
+        while True:
+            time.sleep(self._config.watchdog_interval)
+            now = time.time()
+            with self._lock:
+                for suite_run in self._running.values():
+                    if now - suite_run.start_time > self._config.max_execution_time:
+                        logger.warning("Suite {} exceeded max execution time".format(suite_run.suite.id))
+                        self._kill(suite_run)
+
+    def _worker(self, suite_run: SuiteRun):
         """
         Run tests in a subprocess.
         If the subprocess' exit code is not 0, or the process failed to start,
         set suite status to interrupted.
-        Mark that the runner is not busy.
+        Free the worker for next queued suite.
         """
         try:
-            logger.info("Configuration:\n{}".format("\n".join(["{}={}".format(k, v) for k, v in self.env.items()])))
+            env = self.env(suite_run)
+            logger.info("Configuration:\n{}".format("\n".join(["{}={}".format(k, v) for k, v in env.items()])))
             logger.info("Running command {}".format(" ".join(self.command)))
-            env = dict(os.environ).copy()
-            env.update(self.env)
-            process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                       universal_newlines=True, env=env)
-            self._pid.value = process.pid
+            env = dict(os.environ, **env)
+            with self._lock:
+                if suite_run.cancelled:
+                    return
+                suite_run.process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                                     universal_newlines=True, env=env)
+            process = suite_run.process
             while True:
                 output = process.stdout.readline().strip()
                 if output == "" and process.poll() is not None:
@@ -110,13 +231,24 @@ class Runner(object):
                 if output != "":
                     logger.info(output)
                     sys.stdout.flush()
+                    suite_run.progress.append_output(output)
 
             return_code = process.poll()
+            suite_run.suite.set_run_time(datetime.datetime.utcfromtimestamp(suite_run.start_time),
+                                         datetime.datetime.utcnow())
             if return_code != 0:
-                self._current_suite.set_interrupted()
+                suite_run.suite.set_interrupted()
                 logger.error("Subprocess failed with exit code {}".format(return_code))
+            suite_run.progress.finish(returnCode=return_code, cancelled=suite_run.cancelled)
         except:
-            self._current_suite.set_interrupted()
+            suite_run.suite.set_interrupted()
             logger.error(sys.exc_info()[0])
+            suite_run.progress.finish(returnCode=None, cancelled=suite_run.cancelled)
         finally:
-            self._is_busy.value = False
+            self._finish(suite_run)
+
+
+class RunnerQueueFullException(Exception):
+
+    def __init__(self):
+        super().__init__("Run queue is full")
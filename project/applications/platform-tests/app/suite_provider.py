@@ -15,14 +15,17 @@
 #
 
 import ast
-import os
-
-import dateutil.parser
 import math
+import os
+import time
 
 
 class SuiteProvider(object):
-    """Available test suites provider"""
+    """
+    Available test suites provider.
+    Suite tests are parsed from suite source files once and parsed again only when a file is modified.
+    Run times, aggregated from test results database, are cached for CACHE_TTL seconds.
+    """
 
     TEST_PREFIX = "test_"
 
@@ -33,20 +36,65 @@ class SuiteProvider(object):
         "title": SUITE_NAME,
     }]
 
+    CACHE_TTL = 300  # seconds
+    LAST_RUNS_COUNT = 5  # number of latest runs used to compute suite average run time
+
+    _catalog = {}  # suite id -> (suite file modification time, list of suite tests)
+    _cache = {}  # key -> (expiry time, cached value)
+
     @classmethod
-    def get_list(cls, suite_model) -> list:
+    def build_catalog(cls):
+        """Parse tests of all suites, so that first request does not have to."""
+        for suite in cls.SUITES:
+            cls._get_tests(suite)
+
+    @classmethod
+    def get_list(cls, suite_model, result_model) -> list:
         """Return list of available test suites"""
         suites = []
         for s in cls.SUITES:
-            s["tests"] = cls._get_tests(s)
-            s["approxRunTime"] = cls._get_average_run_time(suite_model)
-            suites.append(s)
+            tests = cls._get_tests(s)
+            suites.append(dict(s, tests=tests,
+                               testDurations=cls._get_test_durations(s["id"], tests, result_model),
+                               approxRunTime=cls._format_run_time(cls.get_average_run_seconds(suite_model, s["id"]))))
         return suites
 
+    @classmethod
+    def get_suite_id(cls, file_name):
+        """Return id of suite defined in given file"""
+        return os.path.splitext(os.path.relpath(file_name))[0].replace(os.path.sep, ".")
+
+    @classmethod
+    def get_title(cls, suite_id):
+        """Return title of suite with given id, default suite title for unknown suites"""
+        return next((s["title"] for s in cls.SUITES if s["id"] == suite_id), cls.SUITE_NAME)
+
+    @classmethod
+    def get_average_run_seconds(cls, suite_model, suite_id):
+        """Get suite average run time in seconds, None if no suite was finished yet"""
+        return cls._cached(("run_time", suite_id),
+                           lambda: suite_model.get_average_run_time(suite_id, last=cls.LAST_RUNS_COUNT))
+
+    @classmethod
+    def _get_test_durations(cls, suite_id, tests, result_model):
+        """Get average duration in seconds of each suite test which was run before"""
+        return cls._cached(("test_durations", suite_id), lambda: result_model.get_average_durations(tests))
+
     @classmethod
     def _get_tests(cls, suite: dict):
-        """Get suite available tests"""
+        """Get suite available tests, parse the suite file only if it was modified"""
         suite_file_name = "{}.py".format(str(suite["id"]).replace('.', os.path.sep))
+        modification_time = os.path.getmtime(suite_file_name)
+        cached = cls._catalog.get(suite["id"])
+        if cached is None or cached[0] != modification_time:
+            cached = (modification_time, cls._parse_tests(suite_file_name))
+            cls._catalog[suite["id"]] = cached
+            cls._cache.pop(("test_durations", suite["id"]), None)
+        return cached[1]
+
+    @classmethod
+    def _parse_tests(cls, suite_file_name):
+        """Get docstrings of tests defined in suite file"""
         with open(suite_file_name) as f:
             file_contents = f.read()
         module = ast.parse(file_contents)
@@ -55,18 +103,18 @@ class SuiteProvider(object):
         return docs
 
     @classmethod
-    def _get_average_run_time(cls, suite_model):
-        """Get suite average run time"""
-        counter = 0
-        execution_time = 0.0
-        suite_documents = suite_model.get_last_five()
-        for suite_document in suite_documents:
-            counter += 1
-            start_date = dateutil.parser.parse(suite_document['start_date'])
-            end_date = dateutil.parser.parse(suite_document['end_date'])
-            time_taken = end_date - start_date
-            execution_time += time_taken.seconds
-        if counter == 0:
+    def _cached(cls, key, compute):
+        """Return cached value, compute it if it's not cached or expired"""
+        now = time.time()
+        expiry_time, value = cls._cache.get(key, (0, None))
+        if expiry_time < now:
+            value = compute()
+            cls._cache[key] = (now + cls.CACHE_TTL, value)
+        return value
+
+    @staticmethod
+    def _format_run_time(execution_time):
+        if execution_time is None:
             return "30 Minutes"
         minutes = math.floor(execution_time / 60)
         seconds = int(execution_time - (minutes * 60))
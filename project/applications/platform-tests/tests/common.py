@@ -24,7 +24,8 @@ def set_environment_for_config():
     os.environ["VCAP_APPLICATION"] = json.dumps({"uris": ["dummy.gotapaas.eu"]})
 
 
-def get_example_run_document(status="pass", end_date="2016-04-01T15:42:01.971197", interrupted=False):
+def get_example_run_document(status="pass", end_date="2016-04-01T15:42:01.971197", interrupted=False,
+                             cancelled=False):
     result = {
         "_id": ObjectId(),
         "environment_version": None,
@@ -43,6 +44,8 @@ def get_example_run_document(status="pass", end_date="2016-04-01T15:42:01.971197
     }
     if interrupted:
         result["interrupted"] = True
+    if cancelled:
+        result["cancelled"] = True
     return result
 
 def get_example_test_document(run_id, status="pass"):
@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 
+import datetime
 from unittest import mock
 
 from bson.objectid import ObjectId
@@ -32,7 +33,8 @@ mock_test_collection = mongomock.MongoClient().db.collection
                          [({}, "PASS"),
                           ({"status": "fail"}, "FAIL"),
                           ({"end_date": None}, "IN_PROGRESS"),
-                          ({"interrupted": True}, "FAIL")])
+                          ({"interrupted": True}, "FAIL"),
+                          ({"interrupted": True, "cancelled": True}, "CANCELLED")])
 def test_test_suite_model_init(document_params, expected_state):
     mock_document = common.get_example_run_document(**document_params)
     test_suite_model_dict = TestSuiteModel(mock_document).to_dict()
@@ -82,6 +84,13 @@ def test_interrupted_suite(single_suite_document_id):
     assert suite_model.is_interrupted()
 
 
+@mock.patch.object(TestSuiteModel, "_collection", mock_suite_collection)
+def test_cancelled_suite(single_suite_document_id):
+    suite_model = TestSuiteModel.get_list()[0]
+    suite_model.set_cancelled()
+    assert TestSuiteModel.get_list()[0].to_dict()["state"] == "CANCELLED"
+
+
 @pytest.mark.parametrize("document_status", ["pass", "fail", "error", "skip"])
 def test_test_result_init(document_status):
     mock_document = common.get_example_test_document(run_id=ObjectId(), status=document_status)
@@ -112,6 +121,29 @@ def test_test_result_by_suite_id():
     assert test_model_ids == inserted_data[0]["document_ids"]
 
 
+@mock.patch.object(TestResultModel, "_collection", mock_test_collection)
+def test_test_result_average_durations():
+    run_id = ObjectId()
+    for name, duration in [("test a", 1.0), ("test a", 3.0), ("test b", 5.0), ("test c", 7.0)]:
+        test_document = common.get_example_test_document(run_id)
+        test_document.update(name=name, duration=duration)
+        mock_test_collection.insert_one(test_document)
+    assert TestResultModel.get_average_durations(["test a", "test b"]) == {"test a": 2.0, "test b": 5.0}
+
+
+@mock.patch.object(TestSuiteModel, "_collection", mock_suite_collection)
+def test_suite_average_run_time():
+    start_time = datetime.datetime(2016, 4, 1, 15, 0, 0)
+    for minutes in (10, 20, 30):
+        suite_model = TestSuiteModel.initialize(suite="suite_a")
+        suite_model.set_run_time(start_time, start_time + datetime.timedelta(minutes=minutes))
+    suite_model = TestSuiteModel.initialize(suite="suite_b")
+    suite_model.set_run_time(start_time, start_time + datetime.timedelta(minutes=60))
+    assert TestSuiteModel.get_average_run_time("suite_a") == 20 * 60
+    assert TestSuiteModel.get_average_run_time("suite_a", last=1) == 30 * 60
+    assert TestSuiteModel.get_average_run_time("suite_c") is None
+
+
 @pytest.fixture(scope="function")
 def single_suite_document_id():
     run_document = common.get_example_run_document()
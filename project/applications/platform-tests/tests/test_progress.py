@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+
+from . import common
+
+common.set_environment_for_config()
+from app.main import TestProgress
+from app.progress import RunProgress
+
+
+def test_progress_reports_log_and_result_events():
+    progress = RunProgress(max_size=10)
+    progress.append_output("collecting ...")
+    progress.append_output("project/tests/test_smoke/test_functional.py::test_login PASSED")
+    events = progress.get_events()
+    assert [e.event for e in events] == [RunProgress.LOG, RunProgress.LOG, RunProgress.RESULT]
+    assert events[2].data == {"name": "project/tests/test_smoke/test_functional.py::test_login", "result": "PASSED"}
+    assert [e.id for e in events] == [0, 1, 2]
+
+
+def test_progress_keeps_only_newest_events():
+    progress = RunProgress(max_size=3)
+    for i in range(5):
+        progress.append_output("line {}".format(i))
+    assert [e.data["line"] for e in progress.get_events()] == ["line 2", "line 3", "line 4"]
+    assert [e.data["line"] for e in progress.get_events(last_id=3)] == ["line 4"]
+
+
+def test_progress_waits_for_new_events():
+    progress = RunProgress(max_size=10)
+    threading.Timer(0.2, progress.append_output, args=("line",)).start()
+    events = progress.get_events(timeout=3)
+    assert [e.data["line"] for e in events] == ["line"]
+
+
+def test_progress_does_not_wait_when_finished():
+    progress = RunProgress(max_size=10)
+    progress.finish(returnCode=0)
+    assert progress.get_events(last_id=0, timeout=10) == []
+
+
+def test_progress_stream():
+    progress = RunProgress(max_size=10)
+    progress.append_output("line")
+    progress.finish(returnCode=0)
+    stream = list(TestProgress._stream(progress, last_id=-1))
+    assert stream == ['id: 0\nevent: log\ndata: {"line": "line"}\n\n',
+                      'id: 1\nevent: end\ndata: {"returnCode": 0}\n\n']
+    assert list(TestProgress._stream(progress, last_id=1)) == []
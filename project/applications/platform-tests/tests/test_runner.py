@@ -19,54 +19,126 @@ from unittest import mock
 
 from bson.objectid import ObjectId
 import mongomock
+import pytest
 
 from . import common
 
 common.set_environment_for_config()
-from app.runner import Runner
+from app.runner import Runner, RunnerQueueFullException
 
 
-@mock.patch("runner.TestSuiteModel._collection", mongomock.MongoClient().db.collection)
-def test_runner_run_successful_command():
-    with mock.patch.object(Runner, "command") as mock_command:
-        mock_command.__get__ = mock.Mock(return_value=["pwd"])
-        suite = Runner().run("username", "password")
-        assert isinstance(suite.id, ObjectId)
-        assert suite.is_interrupted() is False
+@pytest.fixture(scope="function")
+def runner(request):
+    collection = mongomock.MongoClient().db.collection
+    patches = [mock.patch("runner.TestSuiteModel._collection", collection),
+               mock.patch.dict(Runner._config._config, {"max_concurrent_runs": 1, "max_queue_size": 1,
+                                                         "watchdog_interval": 0.1})]
+    for patch in patches:
+        patch.start()
+    Runner._instance = None
+    runner = Runner()
 
-
-@mock.patch("runner.TestSuiteModel._collection", mongomock.MongoClient().db.collection)
-def test_runner_run_unsuccessful_command():
-    with mock.patch.object(Runner, "command") as mock_command:
-        mock_command.__get__ = mock.Mock(return_value=["python", "-c", "[][0]"])
-        runner = Runner()
-        suite = runner.run("username", "password")
+    def fin():
+        for suite_run in list(runner._running.values()):
+            runner.cancel(suite_run.suite.id)
         wait_until_runner_is_not_busy(runner)
-        time.sleep(2)
-        assert suite.is_interrupted()
-
-mock_collection = mongomock.MongoClient().db.collection
-@mock.patch("runner.TestSuiteModel._collection", mock_collection)
-def test_runner_run_non_existing_command():
-    with mock.patch.object(Runner, "command") as mock_command:
-        mock_command.__get__ = mock.Mock(return_value=["idontexist"])
-        runner = Runner()
+        Runner._instance = None
+        for patch in patches:
+            patch.stop()
+    request.addfinalizer(fin)
+    return runner
+
+
+def test_runner_run_successful_command(runner):
+    runner.command = ["pwd"]
+    suite = runner.run("username", "password")
+    assert isinstance(suite.id, ObjectId)
+    wait_until_runner_is_not_busy(runner)
+    assert suite.is_interrupted() is False
+
+
+def test_runner_streams_progress(runner):
+    runner.command = ["echo", "test_a.py::test_b PASSED"]
+    suite = runner.run("username", "password")
+    wait_until_runner_is_not_busy(runner)
+    events = runner.progress(suite.id).get_events()
+    assert [e.event for e in events] == ["log", "result", "end"]
+    assert events[-1].data == {"returnCode": 0, "cancelled": False}
+
+
+def test_runner_run_unsuccessful_command(runner):
+    runner.command = ["python", "-c", "[][0]"]
+    suite = runner.run("username", "password")
+    wait_until_runner_is_not_busy(runner)
+    assert suite.is_interrupted()
+
+
+def test_runner_run_non_existing_command(runner):
+    runner.command = ["idontexist"]
+    suite = runner.run("username", "password")
+    wait_until_runner_is_not_busy(runner)
+    assert suite.is_interrupted()
+
+
+def test_runner_reports_it_is_busy(runner):
+    sleep_time = 2
+    runner.command = ["sleep", str(sleep_time)]
+    runner.run("username", "password")
+    assert runner.is_busy
+    time.sleep(sleep_time + 1)
+    assert not runner.is_busy
+
+
+def test_runner_queues_runs_in_order(runner):
+    runner.command = ["sleep", "10"]
+    running_suite = runner.run("username", "password")
+    queued_suite = runner.run("username", "password")
+    queue_info = runner.queue_info()
+    assert queue_info[running_suite.id]["queuePosition"] == 0
+    assert queue_info[queued_suite.id]["queuePosition"] == 1
+    assert queue_info[queued_suite.id]["state"] == "QUEUED"
+    assert queue_info[queued_suite.id]["eta"] > queue_info[running_suite.id]["eta"]
+    assert runner.is_full
+    with pytest.raises(RunnerQueueFullException):
+        runner.run("username", "password")
+
+
+def test_runner_cancels_queued_run(runner):
+    runner.command = ["sleep", "10"]
+    runner.run("username", "password")
+    queued_suite = runner.run("username", "password")
+    assert runner.cancel(queued_suite.id)
+    assert queued_suite.id not in runner.queue_info()
+    assert runner.progress(queued_suite.id).is_finished
+    assert not runner.is_full
+
+
+def test_runner_cancels_running_run(runner):
+    runner.command = ["sleep", "10"]
+    suite = runner.run("username", "password")
+    wait_until_process_started(runner, suite)
+    assert runner.cancel(suite.id)
+    wait_until_runner_is_not_busy(runner)
+    assert not runner.is_busy
+    assert not runner.cancel(suite.id)
+
+
+def test_runner_watchdog_kills_run_exceeding_max_execution_time(runner):
+    runner.command = ["sleep", "10"]
+    with mock.patch.dict(Runner._config._config, {"max_execution_time": 0.5}):
         suite = runner.run("username", "password")
         wait_until_runner_is_not_busy(runner)
-        time.sleep(3)
-        assert suite.is_interrupted()
+    assert not runner.is_busy
+    assert suite.is_interrupted()
 
 
-@mock.patch("runner.TestSuiteModel._collection", mongomock.MongoClient().db.collection)
-def test_runner_reports_it_is_busy():
-    sleep_time = 3
-    with mock.patch.object(Runner, "command") as mock_command:
-        mock_command.__get__ = mock.Mock(return_value=["sleep", str(sleep_time)])
-        runner = Runner()
-        runner.run("username", "password")
-        assert runner.is_busy
-        time.sleep(sleep_time + 1)
-        assert not runner.is_busy
+def wait_until_process_started(runner, suite, timeout=3):
+    start = time.time()
+    while time.time() - start < timeout:
+        suite_run = runner._running.get(suite.id)
+        if suite_run is not None and suite_run.process is not None:
+            break
+        time.sleep(0.1)
 
 
 def wait_until_runner_is_not_busy(runner, timeout=3):
@@ -74,4 +146,4 @@ def wait_until_runner_is_not_busy(runner, timeout=3):
     while time.time() - start < timeout:
         if not runner.is_busy:
             break
-        time.sleep(1)
+        time.sleep(0.1)
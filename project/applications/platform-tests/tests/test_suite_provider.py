@@ -0,0 +1,112 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+from unittest import mock
+
+import pytest
+
+from . import common
+
+common.set_environment_for_config()
+from app.suite_provider import SuiteProvider
+
+
+SUITE_SOURCE = '''
+def test_first():
+    """First test"""
+
+
+def test_second():
+    """Second test"""
+
+
+def helper():
+    """Not a test"""
+'''
+
+
+@pytest.fixture(scope="function")
+def suite(request, tmpdir):
+    tmpdir.join("suite.py").write(SUITE_SOURCE)
+    request.addfinalizer(tmpdir.chdir().chdir)
+    suite = {"id": "suite", "title": "Suite"}
+    patches = [mock.patch.object(SuiteProvider, "SUITES", [suite]),
+               mock.patch.object(SuiteProvider, "_catalog", {}),
+               mock.patch.object(SuiteProvider, "_cache", {})]
+    for patch in patches:
+        patch.start()
+        request.addfinalizer(patch.stop)
+    return suite
+
+
+@pytest.fixture(scope="function")
+def suite_model():
+    suite_model = mock.Mock()
+    suite_model.get_average_run_time.return_value = 125.0
+    return suite_model
+
+
+@pytest.fixture(scope="function")
+def result_model():
+    result_model = mock.Mock()
+    result_model.get_average_durations.return_value = {"First test": 2.5}
+    return result_model
+
+
+def test_get_list(suite, suite_model, result_model):
+    suites = SuiteProvider.get_list(suite_model, result_model)
+    assert suites == [{"id": "suite", "title": "Suite", "tests": ["First test", "Second test"],
+                       "testDurations": {"First test": 2.5}, "approxRunTime": "2 Minutes 5 Seconds"}]
+    assert "tests" not in suite
+    suite_model.get_average_run_time.assert_called_once_with("suite", last=SuiteProvider.LAST_RUNS_COUNT)
+    result_model.get_average_durations.assert_called_once_with(["First test", "Second test"])
+
+
+def test_get_list_without_finished_runs(suite, suite_model, result_model):
+    suite_model.get_average_run_time.return_value = None
+    assert SuiteProvider.get_list(suite_model, result_model)[0]["approxRunTime"] == "30 Minutes"
+
+
+def test_run_times_are_cached(suite, suite_model, result_model):
+    SuiteProvider.get_list(suite_model, result_model)
+    SuiteProvider.get_list(suite_model, result_model)
+    assert suite_model.get_average_run_time.call_count == 1
+    assert result_model.get_average_durations.call_count == 1
+    with mock.patch.object(SuiteProvider, "CACHE_TTL", -1):
+        SuiteProvider._cache.clear()
+        SuiteProvider.get_list(suite_model, result_model)
+        SuiteProvider.get_list(suite_model, result_model)
+    assert suite_model.get_average_run_time.call_count == 3
+
+
+def test_suite_file_is_parsed_only_when_modified(suite, suite_model, result_model):
+    SuiteProvider.build_catalog()
+    with mock.patch.object(SuiteProvider, "_parse_tests") as mock_parse_tests:
+        SuiteProvider.get_list(suite_model, result_model)
+        assert mock_parse_tests.call_count == 0
+        modification_time = os.path.getmtime("suite.py")
+        os.utime("suite.py", (modification_time + 10, modification_time + 10))
+        SuiteProvider.get_list(suite_model, result_model)
+        assert mock_parse_tests.call_count == 1
+
+
+def test_suite_id_and_title():
+    assert SuiteProvider.get_suite_id(os.path.abspath(os.path.join("project", "tests", "test_smoke",
+                                                                   "test_functional.py"))) == \
+        SuiteProvider.SUITES[0]["id"]
+    assert SuiteProvider.get_title(SuiteProvider.SUITES[0]["id"]) == SuiteProvider.SUITE_NAME
+    assert SuiteProvider.get_title("unknown") == SuiteProvider.SUITE_NAME
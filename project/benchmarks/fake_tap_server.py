@@ -0,0 +1,438 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Local stand-in for the subset of TAP apis used by tap_object_model, for client-side load and benchmark tests.
+Implements Cloud Foundry v2 apps, organizations and organization spaces lists (paginated, with q=name: filter),
+/oauth/token,
+console login page with csrf token and console REST service instances, data sets and transfers.
+Run from project directory: python -m benchmarks.fake_tap_server --help
+Configuration pointing platform tests at the server is printed on start (see FakeTapServer.environment).
+"""
+
+import argparse
+import json
+import random
+import re
+import socketserver
+import threading
+import time
+import uuid
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class FakeTapData(object):
+    """In-memory platform state, generated deterministically from seed."""
+
+    ORG_NAME_FORMAT = "org-{:06d}"
+    APP_NAME_FORMAT = "app-{:06d}"
+    SPACE_NAME_FORMAT = "space-{:06d}"
+    TARGET_URI_FORMAT = "hdfs://nameservice1/org/{}/brokers/userspace/{}/{}/000000_1"
+
+    def __init__(self, org_count=10, app_count=100, service_instance_count=20, data_set_count=50,
+                 transfer_count=50, provisioning_time=0.0, seed=0):
+        """provisioning_time -- seconds after which created service instances and transfers are finished"""
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.provisioning_time = provisioning_time
+        self.organizations = [self._cf_resource({"name": self.ORG_NAME_FORMAT.format(i), "status": "active",
+                                                 "billing_enabled": False}) for i in range(org_count)]
+        # one space in each organization, all apps and service instances are in the first one
+        self.spaces = [self._cf_resource({"name": self.SPACE_NAME_FORMAT.format(i),
+                                          "organization_guid": org["metadata"]["guid"]})
+                       for i, org in enumerate(self.organizations)]
+        self.space_guid = self.spaces[0]["metadata"]["guid"] if self.spaces else self._guid()
+        self.apps = [self._cf_resource({"name": self.APP_NAME_FORMAT.format(i), "state": "STARTED", "instances": 1,
+                                        "memory": 256, "space_guid": self.space_guid})
+                     for i in range(app_count)]
+        self.service_instances = {}
+        for i in range(service_instance_count):
+            self.create_service_instance("instance-{:06d}".format(i), self.space_guid, created_at=0)
+        self.data_sets = {}
+        self.transfers = {}
+        for i in range(transfer_count):
+            self.create_transfer({"title": "transfer-{:06d}".format(i), "category": "other",
+                                  "orgUUID": self._org_guid(i), "publicRequest": False,
+                                  "source": "http://fake/file-{}.csv".format(i)}, created_at=0)
+        for i in range(data_set_count):
+            self._create_data_set("data-set-{:06d}".format(i), self._org_guid(i))
+
+    def create_service_instance(self, name, space_guid, created_at=None):
+        guid = self._guid()
+        with self._lock:
+            self.service_instances[guid] = {"guid": guid, "name": name, "space_guid": space_guid,
+                                            "bound_apps": [], "service_plan": {"service": {"label": "fake"}},
+                                            "created_at": time.time() if created_at is None else created_at}
+        return self.service_instance(guid)
+
+    def service_instance(self, guid):
+        instance = dict(self.service_instances[guid])
+        created_at = instance.pop("created_at")
+        finished = time.time() - created_at >= self.provisioning_time
+        instance["last_operation"] = {"type": "create", "state": "succeeded" if finished else "in progress"}
+        return instance
+
+    def create_transfer(self, body, created_at=None):
+        with self._lock:
+            transfer_id = len(self.transfers) + 1
+            self.transfers[transfer_id] = {
+                "id": transfer_id, "idInObjectStore": None, "title": body.get("title"),
+                "category": body.get("category", "other"), "orgUUID": body.get("orgUUID"),
+                "publicRequest": body.get("publicRequest", False), "source": body.get("source"),
+                "userId": 1, "created_at": time.time() if created_at is None else created_at
+            }
+        return self.transfer(transfer_id)
+
+    def transfer(self, transfer_id):
+        transfer = dict(self.transfers[transfer_id])
+        created_at = transfer.pop("created_at")
+        finished = time.time() - created_at >= self.provisioning_time
+        if finished and transfer["idInObjectStore"] is None:
+            with self._lock:
+                self.transfers[transfer_id]["idInObjectStore"] = "{}/{}".format(transfer["orgUUID"], self._guid())
+                self._create_data_set(transfer["title"], transfer["orgUUID"], transfer["source"])
+            transfer = dict(self.transfers[transfer_id])
+            transfer.pop("created_at")
+        transfer["state"] = "FINISHED" if finished else "NEW"
+        transfer["timestamps"] = {"NEW": int(created_at), "FINISHED": int(created_at + self.provisioning_time)}
+        return transfer
+
+    def _create_data_set(self, title, org_guid, source="http://fake/file.csv"):
+        data_set_id = self._guid()
+        self.data_sets[data_set_id] = {
+            "id": data_set_id, "title": title, "category": "other", "format": "CSV", "creationTime": "2016-01-01",
+            "isPublic": False, "orgUUID": org_guid, "dataSample": "a,b,c", "recordCount": 100, "size": 1024,
+            "sourceUri": source, "targetUri": self.TARGET_URI_FORMAT.format(org_guid, self.space_guid, self._guid())
+        }
+
+    def _org_guid(self, i):
+        return self.organizations[i % len(self.organizations)]["metadata"]["guid"] if self.organizations else None
+
+    def _guid(self):
+        return str(uuid.UUID(int=self._random.getrandbits(128), version=4))
+
+    def _cf_resource(self, entity):
+        guid = self._guid()
+        return {"metadata": {"guid": guid, "url": "/v2/resources/{}".format(guid),
+                             "created_at": "2016-01-01T00:00:00Z", "updated_at": None},
+                "entity": entity}
+
+
+class FakeTapRequestHandler(BaseHTTPRequestHandler):
+    """Route requests to handler methods, inject latency and errors configured on server."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so that clients reuse connections as with real platform
+    CSRF_TOKEN = "fake-csrf-token"
+    SESSION_COOKIE = "JSESSIONID"
+    LOGIN_PAGE = ('<html><body><form action="/login.do" method="post">'
+                  '<input type="hidden" name="X-Uaa-Csrf" value="{}"/>'
+                  '<input name="username" type="email"/><input name="password" type="password"/>'
+                  '</form></body></html>').format(CSRF_TOKEN)
+    LOGIN_ERROR = "Unable to verify email or password. Please try again."
+
+    ROUTES = [
+        ("GET", r"/", "_get_root"),
+        ("GET", r"/login", "_get_login"),
+        ("POST", r"/login\.do", "_post_login"),
+        ("POST", r"/oauth/token", "_post_token"),
+        ("GET", r"/v2/info", "_get_cf_info"),
+        ("GET", r"/v2/apps", "_get_cf_apps"),
+        ("GET", r"/v2/organizations", "_get_cf_organizations"),
+        ("GET", r"/v2/organizations/(?P<org_guid>[^/]+)/spaces", "_get_cf_org_spaces"),
+        ("GET", r"/rest/service_instances", "_get_service_instances"),
+        ("POST", r"/rest/service_instances", "_post_service_instance"),
+        ("DELETE", r"/rest/service_instances/(?P<guid>[^/]+)", "_delete_service_instance"),
+        ("GET", r"/rest/datasets", "_get_data_sets"),
+        ("GET", r"/rest/datasets/(?P<data_set_id>[^/]+)", "_get_data_set"),
+        ("DELETE", r"/rest/datasets/(?P<data_set_id>[^/]+)", "_delete_data_set"),
+        ("GET", r"/rest/das/requests", "_get_transfers"),
+        ("POST", r"/rest/das/requests", "_post_transfer"),
+        ("GET", r"/rest/das/requests/(?P<transfer_id>\d+)", "_get_transfer"),
+        ("DELETE", r"/rest/das/requests/(?P<transfer_id>\d+)", "_delete_transfer"),
+    ]
+    COMPILED_ROUTES = [(method, re.compile(pattern + "$"), handler) for method, pattern, handler in ROUTES]
+    UNAUTHENTICATED = {"_get_root", "_get_login", "_post_login", "_post_token", "_get_cf_info"}
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def data(self) -> FakeTapData:
+        return self.server.data
+
+    def _handle(self):
+        url = urlsplit(self.path)
+        self.query = parse_qs(url.query)
+        length = int(self.headers.get("Content-Length", 0))
+        self.body = self.rfile.read(length) if length else b""
+        self.server.inject_latency()
+        for method, pattern, handler_name in self.COMPILED_ROUTES:
+            match = pattern.match(url.path)
+            if method == self.command and match is not None:
+                break
+        else:
+            return self._send_json({"description": "Not found"}, status=404)
+        if handler_name not in self.UNAUTHENTICATED:
+            if not self._authenticated():
+                return self._send_json({"description": "Unauthorized"}, status=401)
+            if self.server.inject_error():
+                return self._send_json({"description": "Injected error"}, status=self.server.error_status)
+        getattr(self, handler_name)(**match.groupdict())
+
+    def _authenticated(self):
+        if self.headers.get("Authorization", "").startswith("Bearer "):
+            return self.headers["Authorization"][len("Bearer "):] in self.server.tokens
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return self.SESSION_COOKIE in cookie and cookie[self.SESSION_COOKIE].value in self.server.sessions
+
+    def _json_body(self):
+        return json.loads(self.body.decode()) if self.body else {}
+
+    def _form_body(self):
+        return {key: values[0] for key, values in parse_qs(self.body.decode()).items()}
+
+    def _send(self, content: bytes, content_type, status=200, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _send_json(self, data, status=200):
+        self._send(json.dumps(data).encode(), "application/json;charset=UTF-8", status)
+
+    def _send_html(self, html, status=200, headers=None):
+        self._send(html.encode(), "text/html;charset=UTF-8", status, headers)
+
+    # ------------------------------------------------- auth ------------------------------------------------- #
+
+    def _get_root(self):
+        self._send_html("<html><body>Fake TAP console</body></html>")
+
+    def _get_login(self):
+        self._send_html(self.LOGIN_PAGE)
+
+    def _post_login(self):
+        form = self._form_body()
+        if form.get("X-Uaa-Csrf") != self.CSRF_TOKEN or form.get("password") != self.server.password:
+            return self._send_html(self.LOGIN_ERROR)
+        session_id = uuid.uuid4().hex
+        self.server.sessions.add(session_id)
+        self._send_html("<html><body>Logged in</body></html>",
+                        headers={"Set-Cookie": "{}={}; Path=/; HttpOnly".format(self.SESSION_COOKIE, session_id)})
+
+    def _post_token(self):
+        form = self._form_body()
+        if form.get("grant_type") == "refresh_token":
+            valid = form.get("refresh_token") in self.server.refresh_tokens
+        else:
+            valid = form.get("password") == self.server.password
+        if not valid:
+            return self._send_json({"error": "unauthorized"}, status=401)
+        token, refresh_token = uuid.uuid4().hex, uuid.uuid4().hex
+        self.server.tokens.add(token)
+        self.server.refresh_tokens.add(refresh_token)
+        self._send_json({"access_token": token, "token_type": "bearer", "refresh_token": refresh_token,
+                         "expires_in": self.server.token_life_time, "scope": "cloud_controller.admin"})
+
+    # -------------------------------------------------- cf -------------------------------------------------- #
+
+    def _get_cf_info(self):
+        self._send_json({"name": "fake-tap", "api_version": "2.54.0"})
+
+    def _get_cf_apps(self):
+        self._send_cf_page(self.data.apps)
+
+    def _get_cf_organizations(self):
+        self._send_cf_page(self.data.organizations)
+
+    def _get_cf_org_spaces(self, org_guid):
+        if not any(org["metadata"]["guid"] == org_guid for org in self.data.organizations):
+            return self._send_json({"description": "Not found"}, status=404)
+        self._send_cf_page([s for s in self.data.spaces if s["entity"]["organization_guid"] == org_guid])
+
+    def _send_cf_page(self, resources):
+        for query in self.query.get("q", []):
+            field, value = query.split(":", 1)
+            resources = [r for r in resources if str(r["entity"].get(field)) == value]
+        per_page = int(self.query.get("results-per-page", ["50"])[0])
+        page = int(self.query.get("page", ["1"])[0])
+        total_pages = max((len(resources) + per_page - 1) // per_page, 1)
+        self._send_json({"total_results": len(resources), "total_pages": total_pages, "prev_url": None,
+                         "next_url": None, "resources": resources[(page - 1) * per_page:page * per_page]})
+
+    # ------------------------------------------------ console ------------------------------------------------ #
+
+    def _get_service_instances(self):
+        space_guid = self.query.get("space", [None])[0]
+        instances = [self.data.service_instance(guid) for guid in list(self.data.service_instances)]
+        self._send_json([i for i in instances if space_guid is None or i["space_guid"] == space_guid])
+
+    def _post_service_instance(self):
+        body = self._json_body()
+        instance = self.data.create_service_instance(body["name"], body["space_guid"])
+        self._send_json({"metadata": {"guid": instance["guid"]},
+                         "entity": {"name": instance["name"], "last_operation": instance["last_operation"]}},
+                        status=202)
+
+    def _delete_service_instance(self, guid):
+        self._send_json({}, status=200 if self.data.service_instances.pop(guid, None) else 404)
+
+    def _get_data_sets(self):
+        query = json.loads(self.query.get("query", ["{}"])[0])
+        org_guids = self.query["orgs"][0].split(",") if "orgs" in self.query else None
+        hits = [d for d in self.data.data_sets.values() if org_guids is None or d["orgUUID"] in org_guids]
+        start = query.get("from", 0)
+        self._send_json({"total": len(hits), "hits": hits[start:start + query.get("size", 12)],
+                         "categories": ["other"], "formats": ["CSV"]})
+
+    def _get_data_set(self, data_set_id):
+        if data_set_id not in self.data.data_sets:
+            return self._send_json({"description": "Not found"}, status=404)
+        self._send_json(self.data.data_sets[data_set_id])
+
+    def _delete_data_set(self, data_set_id):
+        self._send_json({}, status=200 if self.data.data_sets.pop(data_set_id, None) else 404)
+
+    def _get_transfers(self):
+        org_guids = self.query["orgs"][0].split(",") if "orgs" in self.query else None
+        transfers = [self.data.transfer(i) for i in list(self.data.transfers)]
+        size = int(self.query.get("size", ["12"])[0])
+        self._send_json([t for t in transfers if org_guids is None or t["orgUUID"] in org_guids][:size])
+
+    def _post_transfer(self):
+        self._send_json(self.data.create_transfer(self._json_body()))
+
+    def _get_transfer(self, transfer_id):
+        if int(transfer_id) not in self.data.transfers:
+            return self._send_json({"description": "Not found"}, status=404)
+        self._send_json(self.data.transfer(int(transfer_id)))
+
+    def _delete_transfer(self, transfer_id):
+        self._send_json({}, status=200 if self.data.transfers.pop(int(transfer_id), None) else 404)
+
+
+class FakeTapServer(socketserver.ThreadingMixIn, HTTPServer):
+    """
+    Threaded fake TAP server, run in background thread.
+    latency -- seconds added to each response, or tuple (min, max) of uniformly distributed latency
+    error_rate -- probability of answering authenticated request with error_status instead of a response
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, data=None, password="password", latency=0, error_rate=0.0,
+                 error_status=500, token_life_time=599, seed=0):
+        super().__init__((host, port), FakeTapRequestHandler)
+        self.data = data or FakeTapData(seed=seed)
+        self.password = password
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.token_life_time = token_life_time
+        self.sessions = set()
+        self.tokens = set()
+        self.refresh_tokens = set()
+        self._random = random.Random(seed)
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    def environment(self) -> dict:
+        """Environment variables pointing platform tests configuration at this server."""
+        return {
+            "PT_TAP_DOMAIN": "fake.tap",
+            "PT_ADMIN_PASSWORD": self.password,
+            "PT_CONSOLE_URL": self.url,
+            "PT_CONSOLE_LOGIN_URL": self.url,
+            "PT_CF_API_URL": "{}/v2".format(self.url),
+            "PT_CF_OAUTH_TOKEN_URL": "{}/oauth/token".format(self.url),
+            "PT_UAA_OAUTH_TOKEN_URL": "{}/oauth/token".format(self.url),
+            "PT_SSL_VALIDATION": "False",
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-tap-server", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+    def inject_latency(self):
+        latency = self._random.uniform(*self.latency) if isinstance(self.latency, tuple) else self.latency
+        if latency > 0:
+            time.sleep(latency)
+
+    def inject_error(self) -> bool:
+        return self.error_rate > 0 and self._random.random() < self.error_rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake TAP server for client-side benchmarks.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--password", default="password", help="password accepted for any user")
+    parser.add_argument("--latency", type=float, nargs="+", default=[0], help="seconds, or min and max seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--orgs", type=int, default=10)
+    parser.add_argument("--apps", type=int, default=100)
+    parser.add_argument("--service-instances", type=int, default=20)
+    parser.add_argument("--data-sets", type=int, default=50)
+    parser.add_argument("--transfers", type=int, default=50)
+    parser.add_argument("--provisioning-time", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    data = FakeTapData(org_count=args.orgs, app_count=args.apps, service_instance_count=args.service_instances,
+                       data_set_count=args.data_sets, transfer_count=args.transfers,
+                       provisioning_time=args.provisioning_time, seed=args.seed)
+    latency = tuple(args.latency) if len(args.latency) == 2 else args.latency[0]
+    server = FakeTapServer(args.host, args.port, data=data, password=args.password, latency=latency,
+                           error_rate=args.error_rate, error_status=args.error_status, seed=args.seed)
+    for name, value in sorted(server.environment().items()):
+        print("export {}={}".format(name, value))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Microbenchmarks of client-side hot paths, run on canned responses without a platform.
+Results can be saved as JSON and compared with results saved on another commit:
+    python -m benchmarks.microbenchmarks --output before.json
+    (checkout other commit)
+    python -m benchmarks.microbenchmarks --output after.json --compare before.json
+Exit status is 1 if any benchmark is slower than in compared results by more than the threshold.
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+from unittest import mock
+
+os.environ.setdefault("PT_TAP_DOMAIN", "benchmark")
+os.environ.setdefault("PT_ADMIN_PASSWORD", "benchmark")
+
+from requests import Request, Response, Session
+
+from modules import file_utils
+from modules.gatling_runner.simulation.simulation_result_decoder import SimulationResultDecoder
+from modules.http_client.client_auth.http_method import HttpMethod
+from modules.http_client.client_auth.http_session import HttpSession
+from modules.remote_logger.elastic_search_response_converter import ElasticSearchResponseConverter
+from modules.tap_logger import log_http_request, log_http_response
+from modules.tap_object_model import Application, DataSet, ServiceInstance
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "modules", "gatling_runner",
+                            "unittests", "fixtures")
+LIST_SIZE = 500
+ROUNDS = 7
+MIN_ROUND_TIME = 0.05  # in seconds, number of calls in a round is increased until a round takes at least this long
+DEFAULT_THRESHOLD = 1.2
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(name):
+    """
+    Register benchmark - a generator function which prepares data, yields the measured callable
+    and cleans up after measurement.
+    """
+    def register(function):
+        BENCHMARKS[name] = contextlib.contextmanager(function)
+        return function
+    return register
+
+
+def _json_response(content):
+    response = Response()
+    response.status_code = 200
+    response.url = "http://console.benchmark/rest/resources"
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps(content).encode()
+    return response
+
+
+def _application(i):
+    return {"guid": "app-guid-{:06d}".format(i), "name": "app-{}".format(i), "state": "STARTED",
+            "urls": ["app-{}.benchmark".format(i)], "running_instances": 1}
+
+
+def _service_instance(i):
+    return {"guid": "instance-guid-{:06d}".format(i), "name": "instance-{}".format(i),
+            "bound_apps": [{"guid": "app-guid-{:06d}".format(i), "name": "app-{}".format(i)}],
+            "service_plan": {"service": {"label": "service-{}".format(i % 10)}},
+            "last_operation": {"type": "create", "state": "succeeded"}}
+
+
+def _data_set(i):
+    return {"id": "data-set-{:06d}".format(i), "category": "other", "title": "data set {}".format(i),
+            "format": "CSV", "creationTime": "2016-01-01T00:00:00", "isPublic": False, "orgUUID": "org-guid",
+            "dataSample": "a,b,c", "recordCount": 100, "size": 1024, "sourceUri": "http://source/file.csv",
+            "targetUri": "hdfs://nameservice1/org/org-guid/brokers/userspace/instance/{:06d}/000000_1".format(i)}
+
+
+@benchmark("http_session.request")
+def http_session_request():
+    response = _json_response([_application(i) for i in range(20)])
+    session = HttpSession("username", "password")
+    with mock.patch.object(Session, "send", return_value=response):
+        yield lambda: session.request(HttpMethod.GET, "http://console.benchmark/rest/apps",
+                                      params={"space": "space-guid"}, log_message="PLATFORM: get apps")
+
+
+@benchmark("tap_logger.log_http_request")
+def tap_logger_log_http_request():
+    request = Session().prepare_request(Request(method="POST", url="http://console.benchmark/rest/orgs",
+                                                json={"name": "org", "users": list(range(100))}))
+    yield lambda: log_http_request(request, "username", "password", description="PLATFORM: create org")
+
+
+@benchmark("tap_logger.log_http_response")
+def tap_logger_log_http_response():
+    response = _json_response([_application(i) for i in range(LIST_SIZE)])
+    yield lambda: log_http_response(response)
+
+
+@benchmark("Application.api_get_list")
+def application_api_get_list():
+    applications = [_application(i) for i in range(LIST_SIZE)]
+    with mock.patch("modules.http_calls.platform.service_catalog.api_get_filtered_applications",
+                    return_value=applications):
+        yield lambda: Application.api_get_list("space-guid")
+
+
+@benchmark("ServiceInstance.api_get_list")
+def service_instance_api_get_list():
+    instances = [_service_instance(i) for i in range(LIST_SIZE)]
+    with mock.patch("modules.http_calls.platform.service_catalog.api_get_service_instances", return_value=instances):
+        yield lambda: ServiceInstance.api_get_list(space_guid="space-guid")
+
+
+@benchmark("DataSet.api_get_list")
+def data_set_api_get_list():
+    response = {"hits": [_data_set(i) for i in range(LIST_SIZE)], "total": LIST_SIZE}
+    with mock.patch("modules.http_calls.platform.data_catalog.api_get_datasets", return_value=response):
+        yield lambda: DataSet.api_get_list()
+
+
+@benchmark("SimulationResultDecoder.decode")
+def simulation_result_decoder():
+    with open(os.path.join(FIXTURES_DIR, "global_stats.json")) as f:
+        content = f.read()
+    yield lambda: json.loads(content, cls=SimulationResultDecoder)
+
+
+@benchmark("ElasticSearchResponseConverter.convert")
+def elastic_search_response_converter():
+    response = {"hits": {"hits": [{"_source": {"@message": json.dumps({"msg": "log line {} ".format(i) * 5})}}
+                                  for i in range(LIST_SIZE)]}}
+    yield lambda: ElasticSearchResponseConverter.convert(response)
+
+
+@benchmark("file_utils.generate_csv_file")
+def generate_csv_file():
+    file_name = "benchmark_{}.csv".format(os.getpid())
+    yield lambda: file_utils.generate_csv_file(column_count=10, size=1024 * 1024, file_name=file_name, seed=1)
+    # the same file is overwritten by each call, so it is removed once
+    file_path = os.path.join(file_utils.TMP_FILE_DIR, file_name)
+    os.remove(file_path)
+    file_utils.TEST_FILES[:] = [path for path in file_utils.TEST_FILES if path != file_path]
+
+
+@contextlib.contextmanager
+def _logging_to_null():
+    """Format log records as usual, but don't spend time on writing them to terminal and log file."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    with open(os.devnull, "w") as null:
+        null_handler = logging.StreamHandler(null)
+        null_handler.setFormatter(handlers[0].formatter if handlers else None)
+        root.handlers = [null_handler]
+        try:
+            yield
+        finally:
+            root.handlers = handlers
+
+
+def _measure(function):
+    """Return dict of per-call time statistics in microseconds."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_ROUND_TIME:
+            break
+        loops *= 2
+    rounds = [elapsed / loops]
+    for _ in range(ROUNDS - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        rounds.append((time.perf_counter() - start) / loops)
+    return OrderedDict([("min", min(rounds) * 1e6), ("median", statistics.median(rounds) * 1e6),
+                        ("mean", statistics.mean(rounds) * 1e6), ("stdev", statistics.stdev(rounds) * 1e6),
+                        ("rounds", ROUNDS), ("loops", loops)])
+
+
+def _commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL,
+                                       universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(name_filter=None) -> dict:
+    """Run benchmarks whose name contains name_filter, return results in format saved as JSON."""
+    results = OrderedDict()
+    with _logging_to_null():
+        for name, prepare in BENCHMARKS.items():
+            if name_filter is not None and name_filter not in name:
+                continue
+            with prepare() as function:
+                results[name] = _measure(function)
+    return OrderedDict([("commit", _commit()), ("python", platform.python_version()),
+                        ("timestamp", time.strftime("%Y-%m-%dT%H:%M:%S")), ("results", results)])
+
+
+def compare(current: dict, baseline: dict, threshold=DEFAULT_THRESHOLD) -> list:
+    """Return list of tuples (name, baseline median, current median, ratio, regression) for common benchmarks."""
+    comparison = []
+    for name, result in current["results"].items():
+        if name in baseline["results"]:
+            baseline_median = baseline["results"][name]["median"]
+            ratio = result["median"] / baseline_median if baseline_median else float("inf")
+            comparison.append((name, baseline_median, result["median"], ratio, ratio > threshold))
+    return comparison
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks of client-side hot paths.")
+    parser.add_argument("--output", help="save results to JSON file")
+    parser.add_argument("--compare", help="compare with results saved in JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="median time ratio above which benchmark is reported as regression")
+    parser.add_argument("--filter", help="run only benchmarks whose name contains this string")
+    args = parser.parse_args()
+
+    current = run(args.filter)
+    print("commit {}, python {}".format(current["commit"], current["python"]))
+    print("{:<40} {:>12} {:>12} {:>10} {:>8}".format("benchmark", "median [us]", "min [us]", "stdev [us]", "loops"))
+    for name, result in current["results"].items():
+        print("{:<40} {:>12.1f} {:>12.1f} {:>10.1f} {:>8}".format(name, result["median"], result["min"],
+                                                                  result["stdev"], result["loops"]))
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.compare is None:
+        return 0
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    print("\ncompared with commit {}".format(baseline["commit"]))
+    print("{:<40} {:>12} {:>12} {:>8}".format("benchmark", "before [us]", "after [us]", "ratio"))
+    regressions = 0
+    for name, before, after, ratio, regression in compare(current, baseline, args.threshold):
+        regressions += regression
+        print("{:<40} {:>12.1f} {:>12.1f} {:>8.2f}{}".format(name, before, after, ratio,
+                                                             "  REGRESSION" if regression else ""))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
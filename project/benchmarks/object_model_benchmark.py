@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Measure construction time and memory of tap_object_model lists built from Cloud Foundry api responses.
+Run from project directory: python -m benchmarks.object_model_benchmark [resource count]
+"""
+
+import gc
+import inspect
+import sys
+import time
+import tracemalloc
+from unittest import mock
+
+from modules.tap_object_model import Application, Organization, ServiceInstance, ServiceType, Space, User
+
+
+def _resource(i, entity):
+    return {"metadata": {"guid": "guid-{:08d}".format(i), "url": "/v2/resources/guid-{:08d}".format(i),
+                         "created_at": "2016-01-01T00:00:00Z", "updated_at": None},
+            "entity": entity}
+
+
+def _responses(count):
+    return {
+        "cf_api_get_apps": [_resource(i, {"name": "app-{}".format(i), "state": "STARTED", "instances": 1,
+                                          "memory": 256, "disk_quota": 1024, "space_guid": "space",
+                                          "environment_json": {"VERSION": "1.0"}, "buildpack": None})
+                            for i in range(count)],
+        "cf_api_get_orgs": [_resource(i, {"name": "org-{}".format(i), "status": "active", "billing_enabled": False,
+                                          "quota_definition_guid": "quota"}) for i in range(count)],
+        "cf_api_get_spaces": [_resource(i, {"name": "space-{}".format(i), "organization_guid": "org",
+                                            "allow_ssh": True}) for i in range(count)],
+        "cf_api_get_service_instances": [_resource(i, {"name": "instance-{}".format(i), "space_guid": "space",
+                                                       "credentials": {"uri": "http://instance"}, "type": "managed"})
+                                         for i in range(count)],
+        "cf_api_get_users": [_resource(i, {"username": "user-{}".format(i), "admin": False, "active": True})
+                             for i in range(count)],
+        "cf_api_get_services": [_resource(i, {"label": "service-{}".format(i), "description": "description",
+                                              "tags": ["tag"], "active": True,
+                                              "extra": '{"displayName": "Service", "imageUrl": "data:image/png"}'})
+                                for i in range(count)],
+    }
+
+
+REPEAT = 5
+
+LIST_METHODS = [
+    (Application.cf_api_get_list, "cf_api_get_apps"),
+    (Organization.cf_api_get_list, "cf_api_get_orgs"),
+    (Space.cf_api_get_list, "cf_api_get_spaces"),
+    (ServiceInstance.cf_api_get_list, "cf_api_get_service_instances"),
+    (User.cf_api_get_all_users, "cf_api_get_users"),
+    (ServiceType.cf_api_get_list, "cf_api_get_services"),
+]
+
+
+def _measure(method, **kwargs):
+    """Return best construction time in seconds, memory in bytes and time of putting all objects in a set."""
+    construction_time = None
+    for _ in range(REPEAT):
+        gc.collect()
+        start = time.perf_counter()
+        objects = method(**kwargs)
+        elapsed = time.perf_counter() - start
+        construction_time = elapsed if construction_time is None else min(construction_time, elapsed)
+    hashing_time = None
+    if not kwargs.get("lazy"):
+        start = time.perf_counter()
+        try:
+            set(objects)
+            hashing_time = time.perf_counter() - start
+        except TypeError:  # unhashable
+            pass
+    del objects
+    tracemalloc.start()
+    objects = method(**kwargs)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return construction_time, memory, hashing_time
+
+
+def main(count):
+    responses = _responses(count)
+    print("{} resources per list".format(count))
+    print("{:<40} {:>6} {:>10} {:>12} {:>10}".format("method", "lazy", "time [ms]", "memory [kB]", "set [ms]"))
+    for method, cf_call in LIST_METHODS:
+        with mock.patch("modules.http_calls.cloud_foundry.{}".format(cf_call), return_value=responses[cf_call]):
+            variants = [False, True] if "lazy" in inspect.signature(method).parameters else [False]
+            for lazy in variants:
+                kwargs = {"lazy": True} if lazy else {}
+                construction_time, memory, hashing_time = _measure(method, **kwargs)
+                print("{:<40} {:>6} {:>10.1f} {:>12.0f} {:>10}".format(
+                    method.__qualname__, str(lazy), construction_time * 1000, memory / 1024,
+                    "-" if hashing_time is None else "{:.1f}".format(hashing_time * 1000)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,168 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Startup benchmark - time of importing test modules and collecting tests, which is paid before any test runs.
+Each measurement is a separate interpreter, import times come from python -X importtime on python 3.7+. Older
+interpreters don't support it, so only the whole import of each module is timed there:
+    python -m benchmarks.startup_benchmark --output before.json
+    (checkout other commit)
+    python -m benchmarks.startup_benchmark --output after.json --compare before.json
+Results use the format of benchmarks.microbenchmarks, so they are compared the same way.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+
+from benchmarks.microbenchmarks import DEFAULT_THRESHOLD, compare, _commit
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ("config", "modules.tap_logger", "modules.http_client.http_client_factory", "modules.tap_object_model",
+           "tests.fixtures.fixtures", "tests.conftest")
+ROUNDS = 5
+TOP_IMPORTS = 15
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+IMPORTTIME_SUPPORTED = sys.version_info >= (3, 7)
+TIMED_IMPORT = "import time; start = time.perf_counter(); import {}; print((time.perf_counter() - start) * 1000)"
+
+
+def _environment():
+    environment = dict(os.environ)
+    environment.setdefault("PT_TAP_DOMAIN", "benchmark")
+    environment.setdefault("PT_ADMIN_PASSWORD", "benchmark")
+    environment["PYTHONDONTWRITEBYTECODE"] = "1"
+    return environment
+
+
+def parse_importtime(output) -> list:
+    """Return list of tuples (module, self time, cumulative time, depth) from python -X importtime output, times in ms."""
+    imports = []
+    for line in output.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match is not None:
+            self_time, cumulative_time, indent, module = match.groups()
+            imports.append((module, int(self_time) / 1000, int(cumulative_time) / 1000, (len(indent) - 1) // 2))
+    return imports
+
+
+def profile_import(module) -> list:
+    """
+    Import module in a fresh interpreter, return its parsed import times.
+    Without -X importtime support, the list has only the module, with self time equal to the whole import time.
+    """
+    if not IMPORTTIME_SUPPORTED:
+        import_time = _timed_import(module)
+        return [(module, import_time, import_time, 0)]
+    process = subprocess.Popen([sys.executable, "-X", "importtime", "-c", "import {}".format(module)],
+                               cwd=PROJECT_DIR, env=_environment(), stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, universal_newlines=True)
+    _, output = process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, process.args, output)
+    return parse_importtime(output)
+
+
+def _timed_import(module) -> float:
+    """Return time in ms of importing module in a fresh interpreter."""
+    process = subprocess.Popen([sys.executable, "-c", TIMED_IMPORT.format(module)], cwd=PROJECT_DIR,
+                               env=_environment(), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               universal_newlines=True)
+    output, error = process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, process.args, error)
+    return float(output.strip().splitlines()[-1])
+
+
+def time_collection(path="tests") -> float:
+    """Return wall time in ms of collecting tests with pytest --collect-only in a fresh interpreter."""
+    start = time.perf_counter()
+    subprocess.call([sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", path],
+                    cwd=PROJECT_DIR, env=_environment(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def _statistics(times):
+    return OrderedDict([("min", min(times)), ("median", statistics.median(times)), ("mean", statistics.mean(times)),
+                        ("stdev", statistics.stdev(times) if len(times) > 1 else 0.0), ("rounds", len(times)),
+                        ("loops", 1)])
+
+
+def run(modules=MODULES, rounds=ROUNDS, collect=True) -> dict:
+    """Measure cumulative import time of modules and test collection time, times in ms."""
+    results = OrderedDict()
+    slowest = {}
+    for module in modules:
+        times = []
+        for _ in range(rounds):
+            imports = profile_import(module)
+            times.append(next(cumulative for name, _, cumulative, _ in reversed(imports) if name == module))
+            for name, self_time, _, _ in imports:
+                slowest[name] = max(slowest.get(name, 0), self_time)
+        results["import {}".format(module)] = _statistics(times)
+    if collect:
+        results["pytest --collect-only"] = _statistics([time_collection() for _ in range(rounds)])
+    top = sorted(slowest.items(), key=lambda item: item[1], reverse=True)[:TOP_IMPORTS]
+    return OrderedDict([("commit", _commit()), ("python", ".".join(str(v) for v in sys.version_info[:3])),
+                        ("timestamp", time.strftime("%Y-%m-%dT%H:%M:%S")), ("results", results),
+                        ("slowest_imports", OrderedDict(top))])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import and test collection time.")
+    parser.add_argument("--output", help="save results to JSON file")
+    parser.add_argument("--compare", help="compare with results saved in JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="median time ratio above which result is reported as regression")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="number of measurements of each result")
+    parser.add_argument("--no-collect", action="store_true", help="do not measure test collection")
+    args = parser.parse_args()
+
+    current = run(rounds=args.rounds, collect=not args.no_collect)
+    print("commit {}, python {}".format(current["commit"], current["python"]))
+    if not IMPORTTIME_SUPPORTED:
+        print("python -X importtime requires python 3.7+, only whole imports of modules are timed")
+    print("{:<60} {:>12} {:>12}".format("measurement", "median [ms]", "min [ms]"))
+    for name, result in current["results"].items():
+        print("{:<60} {:>12.1f} {:>12.1f}".format(name, result["median"], result["min"]))
+    print("\n{:<60} {:>12}".format("slowest imports", "self [ms]"))
+    for name, self_time in current["slowest_imports"].items():
+        print("{:<60} {:>12.1f}".format(name, self_time))
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.compare is None:
+        return 0
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    print("\ncompared with commit {}".format(baseline["commit"]))
+    print("{:<60} {:>12} {:>12} {:>8}".format("measurement", "before [ms]", "after [ms]", "ratio"))
+    regressions = 0
+    for name, before, after, ratio, regression in compare(current, baseline, args.threshold):
+        regressions += regression
+        print("{:<60} {:>12.1f} {:>12.1f} {:>8.2f}{}".format(name, before, after, ratio,
+                                                             "  REGRESSION" if regression else ""))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
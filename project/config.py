@@ -15,6 +15,7 @@
 #
 
 import os
+import tempfile
 
 try:
     # In user_config.py, user might export custom environment variables
@@ -46,6 +47,16 @@ def get_int(key_name, fallback=None):
     return value
 
 
+def get_float(key_name, fallback=None):
+    value = os.environ.get(key_name, fallback)
+    if value != fallback:
+        try:
+            value = float(value)
+        except ValueError:
+            raise ValueError("Value '{}' of {} env variable cannot be cast to float.".format(value, key_name))
+    return value
+
+
 def _delete_empty_env_variables():
     """
     Delete from os.environ items whose key starts with PT_ and whose values are empty.
@@ -134,6 +145,70 @@ database_url = os.environ.get("PT_DATABASE_URL", None)  # if specified, results
 # This config value is only used by the platform-test app
 test_run_id = os.environ.get("PT_TEST_RUN_ID", None)
 
+# Http client cache - unused clients which are least recently used or idle for longer than max idle time (in seconds)
+# are closed
+http_client_cache_size = get_int("PT_HTTP_CLIENT_CACHE_SIZE", 64)
+http_client_max_idle_time = get_int("PT_HTTP_CLIENT_MAX_IDLE_TIME", 1800)
+http_client_statistics_size = get_int("PT_HTTP_CLIENT_STATISTICS_SIZE", 256)  # statistics kept for evicted clients
+
+# Console client pool - users are logged in concurrently and their sessions are kept alive in background;
+# at session start admin and users from PT_CLIENT_POOL_USERS (comma separated username:password pairs) are logged in
+client_pool_workers = get_int("PT_CLIENT_POOL_WORKERS", 8)
+client_pool_keepalive_interval = get_int("PT_CLIENT_POOL_KEEPALIVE_INTERVAL", 60)  # in seconds
+client_pool_users = [tuple(user.split(":", 1)) for user in os.environ.get("PT_CLIENT_POOL_USERS", "").split(",")
+                     if user]
+
+# Request timing - if specified, timing of each http request is dumped to this file (JSON if it ends with .json, CSV otherwise)
+request_timing_file = os.environ.get("PT_REQUEST_TIMING_FILE", None)
+request_timing_summary_size = get_int("PT_REQUEST_TIMING_SUMMARY_SIZE", 20)
+
+# Http cassette - "record" saves all http interactions to cassette file, "replay" serves them without a platform
+cassette_mode = os.environ.get("PT_CASSETTE_MODE", None)
+cassette_path = os.environ.get("PT_CASSETTE_PATH", "cassette.json")
+
+# Test sharding - if shard count is specified, tests are split into shards of balanced duration (predicted from
+# durations of the last shard_history_size results of each test in database), and only the tests of shard_index are run
+shard_count = get_int("PT_SHARD_COUNT", None)
+shard_index = get_int("PT_SHARD_INDEX", None)
+shard_manifest = os.environ.get("PT_SHARD_MANIFEST", None)
+shard_history_size = get_int("PT_SHARD_HISTORY_SIZE", 10)
+shard_default_duration = get_int("PT_SHARD_DEFAULT_DURATION", 30)  # in seconds, for tests without results
+
+# Resource pool - test organizations with a space, sample python app and shared service instances, provisioned ahead
+# of time (python -m modules.resource_pool refill) and leased by test runs; pool is kept in database (database_url)
+resource_pool_size = get_int("PT_RESOURCE_POOL_SIZE", None)  # if None, test organization is created for each run
+resource_pool_sample_app = get_bool("PT_RESOURCE_POOL_SAMPLE_APP", True)
+resource_pool_service_instances = get_bool("PT_RESOURCE_POOL_SERVICE_INSTANCES", True)
+resource_pool_lease_timeout = get_int("PT_RESOURCE_POOL_LEASE_TIMEOUT", 6 * 3600)  # in seconds since last renewal
+resource_pool_lease_renew_interval = get_int("PT_RESOURCE_POOL_LEASE_RENEW_INTERVAL", 600)  # in seconds
+resource_pool_reaper_interval = get_int("PT_RESOURCE_POOL_REAPER_INTERVAL", 300)  # in seconds
+
+# Test impact selection - platform component versions (from platform snapshot) are saved with each run in database,
+# and only tests marked with components which changed since the previous run on the environment are run, together
+# with tests whose nodeid starts with one of the comma-separated impact_smoke_tests prefixes
+impact_selection = get_bool("PT_IMPACT_SELECTION", False)
+impact_smoke_tests = [p for p in os.environ.get("PT_IMPACT_SMOKE_TESTS", "tests/test_smoke").split(",") if p]
+
+# Environment health probe - at session start, configured endpoints and /health endpoints of core space applications
+# are checked concurrently; tests marked with components which are unhealthy are skipped
+health_probe = get_bool("PT_HEALTH_PROBE", True)  # if False, only console, cf api and uaa are checked
+health_probe_timeout = get_int("PT_HEALTH_PROBE_TIMEOUT", 10)  # in seconds, for each endpoint
+health_probe_skip_unhealthy = get_bool("PT_HEALTH_PROBE_SKIP_UNHEALTHY", True)
+
+# Service plan matrix - instance lifecycle of each (service, plan) pair is run concurrently, with at most
+# plan_matrix_broker_concurrency pairs of one broker at once; marketplace used to parametrize tests is cached in a file
+plan_matrix_max_workers = get_int("PT_PLAN_MATRIX_MAX_WORKERS", 8)
+plan_matrix_broker_concurrency = get_int("PT_PLAN_MATRIX_BROKER_CONCURRENCY", 2)
+marketplace_cache_path = os.environ.get("PT_MARKETPLACE_CACHE_PATH",
+                                        os.path.join(tempfile.gettempdir(), "pt_marketplace_{}.json".format(tap_domain)))
+marketplace_cache_max_age = get_int("PT_MARKETPLACE_CACHE_MAX_AGE", 600)  # in seconds
+
+# Resource profiling - resource usage of each test phase is saved in test result document; with profile_threshold
+# set (in seconds), phases are profiled with cProfile and profiles of slower ones are saved in profile_directory
+resource_profiling = get_bool("PT_RESOURCE_PROFILING", True)
+profile_threshold = get_float("PT_PROFILE_THRESHOLD", None)
+profile_directory = os.environ.get("PT_PROFILE_DIRECTORY", "profiles")
+
 # Logsearch
 collect_logsearch_logs = get_bool("PT_COLLECT_LOGSEARCH_LOGS", True)
 logsearch_collect_retry_count = get_int("PT_LOGSEARCH_COLLECT_RETRY_COUNT", 5)
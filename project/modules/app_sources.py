@@ -19,7 +19,6 @@ import json
 import os
 import subprocess
 
-from git import Repo
 import requests
 
 from .tap_logger import log_command, get_logger, log_http_request, log_http_response
@@ -27,6 +26,12 @@ from .tap_logger import log_command, get_logger, log_http_request, log_http_resp
 logger = get_logger(__name__)
 
 
+def _repo_class():
+    """GitPython is slow to import and only a few tests use it, so it's imported on first use."""
+    from git import Repo
+    return Repo
+
+
 class AppSources(object):
 
     def __init__(self, sources_directory):
@@ -57,14 +62,14 @@ class AppSources(object):
         repo_url = cls.__get_repo_url(repo_name, repo_owner, gh_auth)
         if os.path.exists(target_directory):
             logger.info("Pull from {}".format(repo_url))
-            repo = Repo(target_directory)
+            repo = _repo_class()(target_directory)
             repo.head.reset("--hard")
             origin = repo.remotes.origin
             origin.pull()
         else:
             logger.info("Clone from {} to {}".format(repo_url, target_directory))
             os.makedirs(target_directory, exist_ok=True)
-            Repo.clone_from(repo_url, target_directory)
+            _repo_class().clone_from(repo_url, target_directory)
 
     def compile_mvn(self, working_directory: str=None):
         logger.info("Compile with maven")
@@ -88,7 +93,7 @@ class AppSources(object):
         Create a branch which points to commit_id and switch to it or checkout and reset if the branch exists
         """
         branch_name = "branch_{}".format(commit_id)
-        repo = Repo(self.path)
+        repo = _repo_class()(self.path)
         if branch_name not in repo.branches:
             logger.info("Create branch {}".format(branch_name))
             repo.git.checkout(commit_id, b=branch_name)
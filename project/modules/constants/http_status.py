@@ -179,3 +179,4 @@ class KubernetesBrokerHttpStatus(HttpStatus):
 
 class PlatformTestsHttpStatus(HttpStatus):
     MSG_RUNNER_BUSY = "Runner is busy"
+    MSG_QUEUE_FULL = "Run queue is full"
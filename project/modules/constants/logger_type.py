@@ -25,5 +25,6 @@ class LoggerType(object):
     SHELL_COMMAND = "shell command"
     STEP_LOGGER = "STEP"
     GATLING_RUNNER = "gatling runner"
+    LOAD_GENERATOR = "load generator"
     FIXTURE_LOGGER = "FIXTURE"
     FINALIZER_LOGGER = "FINALIZER"
@@ -15,9 +15,12 @@
 #
 
 import csv
-from datetime import datetime
+from datetime import datetime, timedelta
 import io
+import mmap
 import os
+import random
+import string
 import xml.etree.ElementTree as ElementTree
 import zipfile
 
@@ -28,26 +31,113 @@ TMP_FILE_NAME = "test_file_{}.csv"
 TEST_FILES = []  # list of generated files - used for cleanup
 
 
-def generate_csv_file(column_count=10, size=None, row_count=10, file_name=None):
+class CsvColumn(object):
+    """
+    Column of generated csv file. Values are drawn from a pool of `cardinality` random values.
+    All values of a column have the same width, so that size of generated file can be computed up front.
+    """
+
+    INT = "int"
+    FLOAT = "float"
+    DATE = "date"
+    STRING = "string"
+    TYPES = (INT, FLOAT, DATE, STRING)
+
+    FLOAT_PRECISION = 3
+    DATE_FORMAT = "%Y-%m-%d"
+    FIRST_DATE = datetime(2000, 1, 1)
+    STRING_CHARACTERS = string.ascii_letters + string.digits
+
+    def __init__(self, column_type=STRING, cardinality=1000, width=10):
+        """
+        column_type -- one of CsvColumn.TYPES
+        cardinality -- number of distinct values in the column
+        width -- number of characters of each value, ignored for dates
+        """
+        if column_type not in self.TYPES:
+            raise ValueError("Unknown csv column type '{}'.".format(column_type))
+        if column_type == self.FLOAT and width < self.FLOAT_PRECISION + 2:
+            raise ValueError("Float column width has to be at least {}.".format(self.FLOAT_PRECISION + 2))
+        self.column_type = column_type
+        self.cardinality = cardinality
+        self.width = len(self.FIRST_DATE.strftime(self.DATE_FORMAT)) if column_type == self.DATE else width
+
+    def __repr__(self):
+        return "{} (type={}, cardinality={}, width={})".format(self.__class__.__name__, self.column_type,
+                                                             self.cardinality, self.width)
+
+    def value_pool(self, random_generator):
+        """Return list of distinct values rendered as strings."""
+        return [self._value(random_generator) for _ in range(self.cardinality)]
+
+    def _value(self, random_generator):
+        if self.column_type == self.INT:
+            return "{:0{}d}".format(random_generator.randrange(10 ** self.width), self.width)
+        if self.column_type == self.FLOAT:
+            digits = "{:0{}d}".format(random_generator.randrange(10 ** (self.width - 1)), self.width - 1)
+            return "{}.{}".format(digits[:-self.FLOAT_PRECISION], digits[-self.FLOAT_PRECISION:])
+        if self.column_type == self.DATE:
+            date = self.FIRST_DATE + timedelta(days=random_generator.randrange(10000))
+            return date.strftime(self.DATE_FORMAT)
+        return "".join(random_generator.choice(self.STRING_CHARACTERS) for _ in range(self.width))
+
+
+CSV_BLOCK_ROW_COUNT = 4096  # number of rows rendered and written at once
+CSV_BLOCK_COUNT = 8  # number of distinct pre-rendered blocks
+
+
+def generate_csv_chunks(column_count=10, size=None, row_count=10, seed=None, schema=None):
+    """
+    Yield generated csv file content in large bytes chunks, e.g. to stream it to an upload request.
+    Pass row_count or size (in bytes) - if both are passed, size takes precedence.
+    seed -- seed of random generator, the same seed and schema always produce the same content
+    schema -- list of CsvColumn, by default column_count string columns are generated
+    """
+    schema = [CsvColumn() for _ in range(column_count)] if schema is None else schema
+    if size == 0 or len(schema) == 0:
+        return
+    header = (",".join("COL_{}".format(i) for i in range(len(schema))) + "\n").encode()
+    row_length = sum(column.width for column in schema) + len(schema)
+    if size is not None:
+        row_count = max(0, -(-(size - len(header)) // row_length))
+    yield header
+    random_generator = random.Random(seed)
+    pools = [column.value_pool(random_generator) for column in schema]
+    blocks = []
+    for _ in range(min(CSV_BLOCK_COUNT, -(-row_count // CSV_BLOCK_ROW_COUNT))):
+        rows = (",".join(random_generator.choice(pool) for pool in pools) for _ in range(CSV_BLOCK_ROW_COUNT))
+        blocks.append(("\n".join(rows) + "\n").encode())
+    full_block_count, remaining_row_count = divmod(row_count, CSV_BLOCK_ROW_COUNT)
+    for i in range(full_block_count):
+        yield blocks[i % len(blocks)]
+    if remaining_row_count > 0:
+        yield blocks[full_block_count % len(blocks)][:remaining_row_count * row_length]
+
+
+def write_csv(stream, column_count=10, size=None, row_count=10, seed=None, schema=None):
+    """
+    Write generated csv content to a binary stream and return number of bytes written.
+    See generate_csv_chunks for description of parameters.
+    """
+    written = 0
+    for chunk in generate_csv_chunks(column_count=column_count, size=size, row_count=row_count, seed=seed,
+                                     schema=schema):
+        stream.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def generate_csv_file(column_count=10, size=None, row_count=10, file_name=None, seed=None, schema=None):
     """
     Return path to the new file.
     Pass row_count or size (in bytes) - if both are passed, size takes precedence.
+    See generate_csv_chunks for description of seed and schema.
     """
     os.makedirs(TMP_FILE_DIR, exist_ok=True)
     file_name = TMP_FILE_NAME.format(datetime.now().strftime('%Y%m%d_%H%M%S_%f')) if file_name is None else file_name
     file_path = os.path.join(TMP_FILE_DIR, file_name)
-    with open(file_path, "w", newline="") as csv_file:
-        if size == 0 or column_count == 0:
-            return _add_generated_file(file_path)
-        csv_writer = csv.writer(csv_file, lineterminator='\n')
-        csv_writer.writerow(["COL_{}".format(i) for i in range(column_count)])
-        row = ["0123456789" for _ in range(column_count)]
-        if size is not None:
-            while csv_file.tell() < size:
-                csv_writer.writerow(row)
-        else:
-            for i in range(row_count):
-                csv_writer.writerow(row)
+    with open(file_path, "wb") as csv_file:
+        write_csv(csv_file, column_count=column_count, size=size, row_count=row_count, seed=seed, schema=schema)
     return _add_generated_file(file_path)
 
 
@@ -57,14 +147,34 @@ def _add_generated_file(file_path):
     return file_path
 
 
+CSV_COUNT_BLOCK_SIZE = 16 * 1024 * 1024  # size of memory-mapped block scanned at once
+
+
 def get_csv_record_count(file_path):
     """
-    Return number of rows in chosen csv file
+    Return number of rows in chosen csv file.
+    Rows are counted by scanning memory-mapped file in large blocks. Newlines inside quoted values are skipped,
+    files without any quote character take a fast path which only counts newlines.
     """
-    with open(file_path, newline="") as csv_file:
-        csv_reader = csv.reader(csv_file)
-        row_count = sum(1 for _ in csv_reader)
-    return row_count
+    if os.path.getsize(file_path) == 0:
+        return 0
+    with open(file_path, "rb") as csv_file, \
+            mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        blocks = (content[start:start + CSV_COUNT_BLOCK_SIZE]
+                  for start in range(0, len(content), CSV_COUNT_BLOCK_SIZE))
+        if content.find(b'"') == -1:
+            newline_count = sum(block.count(b"\n") for block in blocks)
+        else:
+            newline_count = 0
+            in_quotes = False
+            for block in blocks:
+                # parts alternate between content outside and inside of quotes
+                parts = block.split(b'"')
+                first_outside = 1 if in_quotes else 0
+                newline_count += sum(part.count(b"\n") for part in parts[first_outside::2])
+                in_quotes = in_quotes != (len(parts) % 2 == 0)
+        last_row_not_terminated = content[-1:] != b"\n"
+    return newline_count + int(last_row_not_terminated)
 
 
 def get_csv_data(file_path):
@@ -77,17 +187,28 @@ def get_csv_data(file_path):
     return data
 
 
-def download_file(url, save_file_name=None):
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def download_file(url, save_file_name=None, checksum=None):
     """
-    Download a file from provided url and return its directory
+    Download a file from provided url and return its directory.
+    Response is streamed to the file in chunks, so it is never held in memory as a whole.
+    checksum -- optional hashlib object (e.g. hashlib.md5()), updated with downloaded content on the fly
     """
     os.makedirs(TMP_FILE_DIR, exist_ok=True)
     if save_file_name is None:
         save_file_name = "test_file_{}.csv".format(datetime.now().strftime('%Y%m%d_%H%M%S_%f'))
     file_path = os.path.join(TMP_FILE_DIR, save_file_name)
-    r = requests.get(url)
-    with open(file_path, "wb") as csv_file:
-        csv_file.write(r.content)
+    r = requests.get(url, stream=True)
+    try:
+        with open(file_path, "wb") as csv_file:
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                csv_file.write(chunk)
+                if checksum is not None:
+                    checksum.update(chunk)
+    finally:
+        r.close()
     TEST_FILES.append(file_path)
     return file_path
 
@@ -18,9 +18,6 @@ import base64
 import os
 import re
 
-from apiclient import discovery
-import httplib2
-import oauth2client
 from retry import retry
 
 from .tap_logger import get_logger
@@ -37,6 +34,10 @@ logger = get_logger(__name__)
 
 
 def _get_credentials():
+    # google api client libraries are slow to import and only invitation tests use them, so they're imported here
+    import oauth2client.client
+    import oauth2client.file
+    import oauth2client.tools
     credential_path = os.path.join("secrets", "gmail-code.json")
     store = oauth2client.file.Storage(credential_path)
     credentials = store.get()
@@ -49,6 +50,8 @@ def _get_credentials():
 
 
 def _get_service():
+    from apiclient import discovery
+    import httplib2
     credentials = _get_credentials()
     http = credentials.authorize(httplib2.Http())
     service = discovery.build('gmail', 'v1', http=http)
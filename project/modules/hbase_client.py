@@ -21,6 +21,7 @@ import requests
 from .exceptions import UnexpectedResponseError
 from .tap_logger import log_http_request, log_http_response
 from .http_calls import cloud_foundry as cf
+from .http_client.cassette import Cassette
 
 
 class HbaseClient(object):
@@ -94,7 +95,7 @@ class HbaseClient(object):
         )
         request = self.session.prepare_request(request)
         log_http_request(request, username=username)
-        response = self.session.send(request)
+        response = Cassette.send_request(self.session, request)
         log_http_response(response)
         if not response.ok:
             raise UnexpectedResponseError(status=response.status_code, error_message=message_on_error)
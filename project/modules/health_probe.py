@@ -0,0 +1,130 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Environment health probe - checks configured platform endpoints and /health endpoints of core space applications
+concurrently, so that tests of unhealthy components can be skipped instead of failing after long retries.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import socket
+import time
+
+import requests
+
+import config
+from .constants import TapComponent
+
+
+Probe = namedtuple("Probe", ["name", "kind", "target", "components", "critical"])
+ProbeResult = namedtuple("ProbeResult", ["probe", "is_healthy", "detail", "elapsed"])
+
+REACHABLE = "reachable"  # http endpoint is healthy if it responds without server error
+HEALTH = "health"  # http endpoint (e.g. /health) is healthy if it responds with success
+TCP = "tcp"  # healthy if connection can be opened, target is tuple (host, port)
+
+SSH_PORT = 22
+
+
+def endpoint_probes() -> list:
+    """
+    Return probes of platform endpoints from config. Critical probes cover endpoints which all tests need, they have
+    to respond with success. Brokers and other services only have to be reachable.
+    """
+    probes = [
+        Probe("console", HEALTH, config.console_url, ("console",), True),
+        Probe("cf api", HEALTH, "{}/info".format(config.cf_api_url_full), (), True),
+        Probe("uaa", HEALTH, "{}/healthz".format(config.uaa_url), (), True),
+        Probe("application broker", REACHABLE, config.application_broker_url, ("application_broker",), False),
+        Probe("demiurge", REACHABLE, config.demiurge_url, ("demiurge",), False),
+        Probe("kubernetes broker", REACHABLE, config.kubernetes_broker_url, ("kubernetes_broker",), False),
+        Probe("arcadia", REACHABLE, config.arcadia_url, (), False),
+    ]
+    if config.collect_logsearch_logs:
+        probes.append(Probe("logsearch ssh tunnel", TCP, (config.jumpbox_hostname, SSH_PORT), (), False))
+    return probes
+
+
+def application_probes(applications) -> tuple:
+    """
+    Return probes of /health endpoints of applications which are TapComponents, and results for applications which
+    have no running instances, so there is nothing to probe.
+    """
+    component_names = {c.value: c.name for c in TapComponent}
+    probes = []
+    results = []
+    for application in applications:
+        name = component_names.get(application.name)
+        if name is None:
+            continue
+        if not application.is_running or len(application.urls) == 0:
+            probe = Probe(application.name, HEALTH, None, (name,), False)
+            results.append(ProbeResult(probe, False, "no running instances", 0))
+        else:
+            probes.append(Probe(application.name, HEALTH, "http://{}/health".format(application.urls[0]),
+                                (name,), False))
+    return probes, results
+
+
+def check(probe: Probe, timeout) -> ProbeResult:
+    start_time = time.time()
+    try:
+        if probe.kind == TCP:
+            socket.create_connection(probe.target, timeout=timeout).close()
+            is_healthy, detail = True, "connected"
+        else:
+            response = requests.get(probe.target, verify=config.ssl_validation, timeout=timeout)
+            is_healthy = response.ok if probe.kind == HEALTH else response.status_code < 500
+            detail = str(response.status_code)
+    except (requests.RequestException, OSError) as e:
+        is_healthy, detail = False, e.__class__.__name__
+    return ProbeResult(probe, is_healthy, detail, time.time() - start_time)
+
+
+def run_probes(probes, timeout) -> list:
+    """Check all probes concurrently, return results in order of probes."""
+    if len(probes) == 0:
+        return []
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        return list(executor.map(lambda probe: check(probe, timeout), probes))
+
+
+def unhealthy_components(results) -> dict:
+    """Return dict TapComponent name -> description of failed probe."""
+    unhealthy = {}
+    for result in results:
+        if not result.is_healthy:
+            for name in result.probe.components:
+                unhealthy.setdefault(name, "{} is unhealthy ({})".format(result.probe.name, result.detail))
+    return unhealthy
+
+
+def format_matrix(results) -> list:
+    """Return lines of component health matrix."""
+    lines = ["{:<32} {:<9} {:>7}  {}".format("ENDPOINT", "HEALTH", "TIME", "DETAIL")]
+    for result in sorted(results, key=lambda r: (r.is_healthy, r.probe.name)):
+        lines.append("{:<32} {:<9} {:>6.2f}s  {}".format(result.probe.name,
+                                                         "OK" if result.is_healthy else "UNHEALTHY",
+                                                         result.elapsed, result.detail))
+    return lines
+
+
+class EnvironmentUnavailableException(Exception):
+    TEMPLATE = "Environment is unavailable: {}"
+
+    def __init__(self, message=None):
+        super().__init__(self.TEMPLATE.format(message))
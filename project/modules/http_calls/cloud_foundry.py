@@ -97,11 +97,49 @@ def __get_all_pages(endpoint, query_params=None, log_msg=""):
     return resources
 
 
+# entity fields which can be used in "q" filter, by last segment of list endpoint
+FILTERABLE_FIELDS = {
+    "apps": {"name", "space_guid", "organization_guid", "stack_guid", "diego"},
+    "buildpacks": {"name"},
+    "organizations": {"name", "space_guid", "user_guid", "manager_guid", "billing_manager_guid", "auditor_guid",
+                      "status"},
+    "service_brokers": {"name", "space_guid"},
+    "service_instances": {"name", "space_guid", "service_plan_guid", "service_binding_guid", "gateway_name",
+                          "organization_guid", "service_key_guid"},
+    "services": {"label", "active", "service_broker_guid"},
+    "spaces": {"name", "organization_guid", "developer_guid", "app_guid"},
+    "users": {"space_guid", "organization_guid", "managed_organization_guid", "billing_managed_organization_guid",
+              "audited_organization_guid", "managed_space_guid", "audited_space_guid"},
+}
+
+
+def __query(endpoint, filters=None, inline_relations_depth=None, query_params=None, log_msg=""):
+    """
+    Return resources from paginated list endpoint whose entity matches all filters (dict field name -> value).
+    Filters on fields supported by the endpoint are sent as q=field:value, so that CF returns only matching
+    resources. Filters on other fields (e.g. user's username) are applied client-side on all returned resources.
+    """
+    filters = filters or {}
+    query_params = dict(query_params or {})
+    filterable_fields = FILTERABLE_FIELDS.get(endpoint.rsplit("/", 1)[-1], set())
+    server_side = {field: value for field, value in filters.items() if field in filterable_fields}
+    client_side = {field: value for field, value in filters.items() if field not in filterable_fields}
+    if server_side:
+        query_params["q"] = ["{}:{}".format(field, value) for field, value in sorted(server_side.items())]
+    if inline_relations_depth is not None:
+        query_params["inline-relations-depth"] = inline_relations_depth
+    resources = __get_all_pages(endpoint=endpoint, query_params=query_params, log_msg=log_msg)
+    if client_side:
+        resources = [r for r in resources if all(r["entity"].get(f) == v for f, v in client_side.items())]
+    return resources
+
+
 # -------------------------------------------------- organizations --------------------------------------------------- #
 
-def cf_api_get_orgs():
+def cf_api_get_orgs(name=None):
     """GET /v2/organizations"""
-    return __get_all_pages(endpoint="organizations", log_msg="CF: get all organizations")
+    filters = {"name": name} if name is not None else None
+    return __query(endpoint="organizations", filters=filters, log_msg="CF: get all organizations")
 
 
 def cf_api_delete_org(org_guid):
@@ -117,9 +155,11 @@ def cf_api_delete_org(org_guid):
     )
 
 
-def cf_api_get_org_spaces(org_guid):
+def cf_api_get_org_spaces(org_guid, name=None):
     """GET /v2/organizations/{org_guid}/spaces"""
-    return __get_all_pages(endpoint="organizations/{}/spaces".format(org_guid), log_msg="CF: get spaces in org")
+    filters = {"name": name} if name is not None else None
+    return __query(endpoint="organizations/{}/spaces".format(org_guid), filters=filters,
+                   log_msg="CF: get spaces in org")
 
 
 def cf_api_get_org_users(org_guid, space_guid=None):
@@ -185,12 +225,11 @@ def cf_api_get_space_services(space_guid, label=None):
 # -------------------------------------------------- service --------------------------------------------------------- #
 
 
-def cf_api_get_services(service_name=None):
+def cf_api_get_services(service_name=None, inline_relations_depth=None):
     """GET /v2/services"""
-    params = {}
-    if service_name is not None:
-        params["q"] = "label:{}".format(service_name)
-    return __get_all_pages(endpoint="services", query_params=params, log_msg="CF: get all services")
+    filters = {"label": service_name} if service_name is not None else None
+    return __query(endpoint="services", filters=filters, inline_relations_depth=inline_relations_depth,
+                   log_msg="CF: get all services")
 
 
 # -------------------------------------------------- service plans --------------------------------------------------- #
@@ -221,9 +260,10 @@ def cf_api_update_service_access(service_guid, enable_service=True):
 
 # ------------------------------------------------------ users ------------------------------------------------------- #
 
-def cf_api_get_users():
-    """GET /v2/users"""
-    return __get_all_pages(endpoint="users", log_msg="CF: get all users")
+def cf_api_get_users(username=None):
+    """GET /v2/users - CF can't filter users by username, so they are filtered client-side"""
+    filters = {"username": username} if username is not None else None
+    return __query(endpoint="users", filters=filters, log_msg="CF: get all users")
 
 
 def cf_api_delete_user(user_guid):
@@ -281,9 +321,10 @@ def cf_api_get_buildpacks():
 # ------------------------------------------------------- apps ------------------------------------------------------- #
 
 
-def cf_api_get_apps():
+def cf_api_get_apps(name=None):
     """GET /v2/apps"""
-    return __get_all_pages("apps", log_msg="CF: get apps")
+    filters = {"name": name} if name is not None else None
+    return __query("apps", filters=filters, log_msg="CF: get apps")
 
 
 def cf_api_get_app_env(app_guid):
@@ -357,8 +398,8 @@ def cf_get_ref_org_and_space_guids():
     """Return tuple of org_guid and space_guid for core org and space (e.g. trustedanalytics, platform)."""
     global CORE_ORG_GUID, CORE_SPACE_GUID
     if CORE_ORG_GUID is None or CORE_SPACE_GUID is None:
-        orgs = cf_api_get_orgs()
-        CORE_ORG_GUID = next(o["metadata"]["guid"] for o in orgs if o["entity"]["name"] == config.core_org_name)
-        spaces = cf_api_get_org_spaces(CORE_ORG_GUID)
-        CORE_SPACE_GUID = next(s["metadata"]["guid"] for s in spaces if s["entity"]["name"] == config.core_space_name)
+        orgs = cf_api_get_orgs(name=config.core_org_name)
+        CORE_ORG_GUID = next(o["metadata"]["guid"] for o in orgs)
+        spaces = cf_api_get_org_spaces(CORE_ORG_GUID, name=config.core_space_name)
+        CORE_SPACE_GUID = next(s["metadata"]["guid"] for s in spaces)
     return CORE_ORG_GUID, CORE_SPACE_GUID
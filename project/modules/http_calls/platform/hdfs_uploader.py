@@ -16,23 +16,36 @@
 
 import os
 
+from ...constants import LoggerType
 from ...http_client.client_auth.http_method import HttpMethod
 from ...http_client.configuration_provider.console import ConsoleConfigurationProvider
 from ...http_client.http_client_factory import HttpClientFactory
+from ...http_client.streaming_multipart_encoder import StreamingMultipartEncoder
+from ...tap_logger import get_logger
 
+logger = get_logger(LoggerType.HTTP_REQUEST)
 
-def api_create_transfer_by_file_upload(org_guid, source, category=None, is_public=None, title=None, client=None):
-    """POST /rest/upload/{org_id}"""
+
+def api_create_transfer_by_file_upload(org_guid, source, category=None, is_public=None, title=None, client=None,
+                                       progress_callback=None):
+    """
+    POST /rest/upload/{org_id}
+    File is streamed, progress_callback is called with number of bytes sent and total number of bytes.
+    """
     body_keys = ["category", "publicRequest", "orgUUID", "title"]
     values = [category, is_public, org_guid, title]
     data = {key: val for key, val in zip(body_keys, values) if val is not None}
     _, file_name = os.path.split(source)
-    files = {"file": (file_name, open(source, "rb"), "application/vnd.ms-excel")}
+    files = {"file": (file_name, source, "application/vnd.ms-excel")}
     client = client or HttpClientFactory.get(ConsoleConfigurationProvider.get())
-    return client.request(
-        method=HttpMethod.POST,
-        path="rest/upload/{}".format(org_guid),
-        data=data,
-        files=files,
-        msg="PLATFORM: create a transfer"
-    )
+    with StreamingMultipartEncoder(fields=data, files=files, progress_callback=progress_callback) as body:
+        response = client.request(
+            method=HttpMethod.POST,
+            path="rest/upload/{}".format(org_guid),
+            headers={"Content-Type": body.content_type},
+            data=body,
+            msg="PLATFORM: create a transfer"
+        )
+    logger.info("Uploaded {} bytes in {:.2f}s ({:.2f} MB/s)".format(body.bytes_sent, body.elapsed_time,
+                                                                      body.throughput / 1024 / 1024))
+    return response
@@ -52,3 +52,13 @@ def api_create_test_suite(username, password, client=None):
         body=body,
         msg="PLATFORM: create test suite"
     )
+
+
+def api_cancel_test_suite(suite_id, client=None):
+    """DELETE /rest/platform_tests/tests/{suite_id}"""
+    client = client or HttpClientFactory.get(ConsoleConfigurationProvider.get())
+    return client.request(
+        method=HttpMethod.DELETE,
+        path="rest/platform_tests/tests/{}".format(suite_id),
+        msg="PLATFORM: cancel test suite"
+    )
@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+from unittest import mock
+
+from modules.http_calls import cloud_foundry as cf
+
+
+class TestCloudFoundryQuery(unittest.TestCase):
+    """Unit: cloud_foundry list queries."""
+
+    USERS = [{"metadata": {"guid": "guid-{}".format(i)}, "entity": {"username": "user-{}".format(i)}}
+             for i in range(3)]
+
+    def setUp(self):
+        patcher = mock.patch("modules.http_calls.cloud_foundry.HttpClientFactory")
+        self.mock_request = patcher.start().get.return_value.request
+        self.addCleanup(patcher.stop)
+
+    def test_filter_on_supported_field_should_be_sent_to_api(self):
+        # given
+        self.mock_request.return_value = {"resources": [{"entity": {"name": "app"}}], "total_pages": 1}
+        # when
+        apps = cf.cf_api_get_apps(name="app")
+        # then
+        self.assertEqual(1, len(apps))
+        params = self.mock_request.call_args[1]["params"]
+        self.assertEqual(["name:app"], params["q"])
+        self.assertEqual("apps", self.mock_request.call_args[1]["path"])
+
+    def test_inline_relations_depth_should_be_sent_to_api(self):
+        # given
+        self.mock_request.return_value = {"resources": [], "total_pages": 1}
+        # when
+        cf.cf_api_get_services(service_name="label", inline_relations_depth=1)
+        # then
+        params = self.mock_request.call_args[1]["params"]
+        self.assertEqual(["label:label"], params["q"])
+        self.assertEqual(1, params["inline-relations-depth"])
+
+    def test_filter_on_unsupported_field_should_be_applied_client_side(self):
+        # given
+        self.mock_request.return_value = {"resources": self.USERS, "total_pages": 1}
+        # when
+        users = cf.cf_api_get_users(username="user-1")
+        # then
+        self.assertEqual([self.USERS[1]], users)
+        self.assertNotIn("q", self.mock_request.call_args[1]["params"])
+
+    def test_no_filters_should_return_all_pages(self):
+        # given
+        self.mock_request.side_effect = [{"resources": self.USERS[:2], "total_pages": 2},
+                                         {"resources": self.USERS[2:], "total_pages": 2}]
+        # when
+        users = cf.cf_api_get_users()
+        # then
+        self.assertEqual(self.USERS, users)
+        self.assertEqual(2, self.mock_request.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,270 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ..tap_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Cassette(object):
+    """
+    Record http interactions to a file and replay them without a platform.
+    Interactions are indexed by request key - method, url and body with secrets redacted and test object name
+    timestamps normalized, so that names generated in a replayed run match the recorded ones. Body is canonicalized,
+    so that the key does not depend on order of JSON keys, form fields or multipart parts, nor on multipart boundary.
+    Repeated requests with the same key get recorded responses in order, the last one is repeated (e.g. when polling).
+    While a replaying cassette is active, time.sleep returns immediately, so that retry and polling delays are skipped.
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+    MODES = (RECORD, REPLAY)
+
+    REDACTED = "<redacted>"
+    SECRET_HEADERS = ("Authorization", "Cookie", "Set-Cookie")
+    SECRET_FIELDS = ("password", "access_token", "refresh_token", "client_secret", "X-Uaa-Csrf")
+    SECRET_JSON_PATTERN = re.compile(r'("(?:{})"\s*:\s*)"[^"]*"'.format("|".join(SECRET_FIELDS)))
+    SECRET_FORM_PATTERN = re.compile(r"(^|&)((?:{})=)[^&]*".format("|".join(SECRET_FIELDS)))
+    # whole generated test object name - hostname or prefix, worker id, counter and timestamp differ between runs
+    TEST_NAME_PATTERN = re.compile(r"[\w.]*\d{8}_\d{6}(?:_\d{6})?")
+    STREAMED_BODY = "<streamed body>"
+    MULTIPART_BOUNDARY_PATTERN = re.compile(r"multipart/[\w-]+;.*boundary=\"?([^\";]+)")
+    FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+    JSON_CONTENT_TYPE = "json"
+
+    _ACTIVE = None
+    _ORIGINAL_SLEEP = None
+
+    def __init__(self, path: str, mode: str):
+        if mode not in self.MODES:
+            raise CassetteInvalidModeException(mode)
+        self.path = path
+        self.mode = mode
+        self.unmatched = []
+        self._lock = threading.Lock()
+        self._interactions = {}  # request key -> list of recorded interactions
+        self._replay_positions = {}
+        if mode == self.REPLAY:
+            self._load()
+
+    @classmethod
+    def active(cls):
+        """Cassette used by http clients, None if requests are sent to the platform as usual."""
+        return cls._ACTIVE
+
+    @classmethod
+    def activate(cls, cassette):
+        cls._ACTIVE = cassette
+        if cassette.mode == cls.REPLAY and cls._ORIGINAL_SLEEP is None:
+            cls._ORIGINAL_SLEEP = time.sleep
+            time.sleep = cls._skip_sleep
+
+    @classmethod
+    def deactivate(cls):
+        cls._ACTIVE = None
+        if cls._ORIGINAL_SLEEP is not None:
+            time.sleep = cls._ORIGINAL_SLEEP
+            cls._ORIGINAL_SLEEP = None
+
+    @staticmethod
+    def _skip_sleep(seconds):
+        """Replayed responses don't change over time, so there is nothing to wait for."""
+
+    @classmethod
+    def send_request(cls, session, request, **kwargs):
+        """Send prepared request with requests session, through the active cassette if there is one."""
+        cassette = cls._ACTIVE
+        if cassette is None:
+            return session.send(request, **kwargs)
+        return cassette.send(session, request, **kwargs)
+
+    def send(self, session, request, **kwargs):
+        """Record response of request sent with session or return recorded response."""
+        key = self.request_key(request)
+        if self.mode == self.RECORD:
+            response = session.send(request, **kwargs)
+            self._record(key, request, response)
+            return response
+        return self._replay(key, request)
+
+    def save(self):
+        """Write recorded interactions to cassette file."""
+        with self._lock:
+            interactions = dict(self._interactions)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump({"interactions": interactions}, f, indent=1, sort_keys=True)
+        logger.info("Saved {} http interactions to {}".format(sum(len(i) for i in interactions.values()), self.path))
+
+    @classmethod
+    def request_key(cls, request) -> str:
+        """Key identifying request in the cassette index."""
+        body = cls._canonical_body(request.body, request.headers.get("Content-Type", ""))
+        body_hash = hashlib.sha1(body.encode()).hexdigest() if body else ""
+        return "{} {} {}".format(request.method, cls._normalize(cls._redact_url(request.url)), body_hash)
+
+    @classmethod
+    def _normalize(cls, text):
+        return cls.TEST_NAME_PATTERN.sub("{test_name}", text)
+
+    @classmethod
+    def _redact_url(cls, url):
+        parts = urlsplit(url)
+        query = [(name, cls.REDACTED if name in cls.SECRET_FIELDS else value)
+                 for name, value in parse_qsl(parts.query, keep_blank_values=True)]
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(sorted(query)), ""))
+
+    @classmethod
+    def _canonical_body(cls, body, content_type):
+        """Redacted body in a form which does not depend on dict ordering or multipart boundary."""
+        if body is None or hasattr(body, "read"):
+            return cls._redact_body(body)
+        boundary = cls.MULTIPART_BOUNDARY_PATTERN.search(content_type)
+        if boundary is not None:
+            body = body if isinstance(body, bytes) else body.encode()
+            parts = body.split(b"--" + boundary.group(1).encode())
+            return "\n--{boundary}\n".join(sorted(cls._redact_body(part.strip(b"\r\n-")) for part in parts))
+        if isinstance(body, bytes):
+            try:
+                body = body.decode()
+            except UnicodeDecodeError:
+                return cls._redact_body(body)
+        if cls.FORM_CONTENT_TYPE in content_type:
+            fields = [(name, cls.REDACTED if name in cls.SECRET_FIELDS else value)
+                      for name, value in parse_qsl(body, keep_blank_values=True)]
+            return cls._normalize(urlencode(sorted(fields)))
+        if cls.JSON_CONTENT_TYPE in content_type:
+            try:
+                return cls._normalize(json.dumps(cls._redact_json(json.loads(body)), sort_keys=True))
+            except ValueError:
+                pass
+        return cls._redact_body(body)
+
+    @classmethod
+    def _redact_json(cls, value):
+        if isinstance(value, dict):
+            return {key: cls.REDACTED if key in cls.SECRET_FIELDS else cls._redact_json(item)
+                    for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls._redact_json(item) for item in value]
+        return value
+
+    @classmethod
+    def _redact_body(cls, body):
+        if body is None:
+            return ""
+        if hasattr(body, "read"):
+            return cls.STREAMED_BODY
+        if isinstance(body, bytes):
+            try:
+                body = body.decode()
+            except UnicodeDecodeError:
+                return hashlib.sha1(body).hexdigest()
+        body = cls.SECRET_JSON_PATTERN.sub(r'\1"{}"'.format(cls.REDACTED), body)
+        body = cls.SECRET_FORM_PATTERN.sub(r"\1\2{}".format(cls.REDACTED), body)
+        return cls._normalize(body)
+
+    @classmethod
+    def _redact_headers(cls, headers):
+        return {name: cls.REDACTED if name in cls.SECRET_HEADERS else value for name, value in headers.items()}
+
+    @classmethod
+    def _encode_content(cls, content):
+        try:
+            text = content.decode()
+        except UnicodeDecodeError:
+            return {"base64": base64.b64encode(content).decode()}
+        return {"text": cls.SECRET_JSON_PATTERN.sub(r'\1"{}"'.format(cls.REDACTED), text)}
+
+    @staticmethod
+    def _decode_content(body):
+        if "base64" in body:
+            return base64.b64decode(body["base64"])
+        return body["text"].encode()
+
+    def _record(self, key, request, response):
+        interaction = {
+            "request": {
+                "method": request.method,
+                "url": self._redact_url(request.url),
+                "headers": self._redact_headers(request.headers),
+                "body": self._redact_body(request.body),
+            },
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "url": response.url,
+                "headers": self._redact_headers(response.headers),
+                "body": self._encode_content(response.content or b""),
+            }
+        }
+        with self._lock:
+            self._interactions.setdefault(key, []).append(interaction)
+
+    def _replay(self, key, request):
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if not interactions:
+                self.unmatched.append(key)
+                raise CassetteRequestNotFoundException(key)
+            position = self._replay_positions.get(key, 0)
+            self._replay_positions[key] = position + 1
+        recorded = interactions[min(position, len(interactions) - 1)]["response"]
+        response = Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded["reason"]
+        response.url = recorded["url"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self._decode_content(recorded["body"])
+        response.request = request
+        response.elapsed = timedelta(0)
+        return response
+
+    def _load(self):
+        with open(self.path) as f:
+            self._interactions = json.load(f)["interactions"]
+        logger.info("Loaded {} http interactions from {}".format(sum(len(i) for i in self._interactions.values()),
+                                                                 self.path))
+
+
+class CassetteInvalidModeException(Exception):
+    TEMPLATE = "Cassette mode {} is not one of: record, replay."
+
+    def __init__(self, message=None):
+        super().__init__(self.TEMPLATE.format(message))
+
+
+class CassetteRequestNotFoundException(Exception):
+    TEMPLATE = "Request '{}' was not recorded in cassette."
+
+    def __init__(self, message=None):
+        super().__init__(self.TEMPLATE.format(message))
@@ -41,3 +41,11 @@ class ClientAuthBase(object, metaclass=ABCMeta):
     @abstractmethod
     def authenticate(self) -> AuthBase:
         """Use session credentials to authenticate."""
+
+    def refresh(self, rejected_auth=None) -> bool:
+        """Renew authentication rejected by the server, return True if request can be retried."""
+        return False
+
+    def close(self):
+        """Release session resources, e.g. when the client is evicted from cache."""
+        self.session.close()
@@ -14,10 +14,14 @@
 # limitations under the License.
 #
 
+import html
+import re
+import threading
+
 from requests.auth import AuthBase
-from bs4 import BeautifulSoup
 
 from .client_auth_base import ClientAuthBase
+from .http_session import HttpSession
 from modules.exceptions import UnexpectedResponseError
 from modules.http_client.client_auth.http_method import HttpMethod
 
@@ -25,8 +29,22 @@ from modules.http_client.client_auth.http_method import HttpMethod
 class ClientAuthLoginPage(ClientAuthBase):
     """Login page based http client authentication."""
 
+    CSRF_TOKEN_NAME = "X-Uaa-Csrf"
+    SESSION_COOKIE_NAMES = frozenset({"JSESSIONID"})
+    INPUT_TAG_PATTERN = re.compile(r"<input\b([^>]*)>", re.IGNORECASE)
+    ATTRIBUTE_PATTERN = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))""")
+
+    def __init__(self, url: str, session: HttpSession):
+        self._lock = threading.RLock()
+        self._login_cookie_names = frozenset()
+        super().__init__(url, session)
+
     def authenticate(self) -> AuthBase:
-        """Use session credentials to authenticate."""
+        """Use session credentials to authenticate, concurrent calls log in one after another."""
+        with self._lock:
+            self._log_in()
+
+    def _log_in(self):
         response = self.session.request(
             method=HttpMethod.POST,
             url="{}/login.do".format(self._url),
@@ -37,10 +55,26 @@ class ClientAuthLoginPage(ClientAuthBase):
         )
         if not response.ok or "Unable to verify email or password. Please try again." in response.text:
             raise UnexpectedResponseError(response.status_code, response.text)
+        self._login_cookie_names = self._session_cookie_names()
+
+    def _session_cookie_names(self):
+        """
+        Return names of cookies which identify server side session - known session cookies, or if there are none,
+        cookies without expiry date. Other cookies, e.g. csrf cookie, can expire while the session is still valid.
+        """
+        names = frozenset(cookie.name for cookie in self.session.cookies if cookie.name in self.SESSION_COOKIE_NAMES)
+        return names or frozenset(cookie.name for cookie in self.session.cookies if cookie.expires is None)
 
     @property
     def authenticated(self) -> bool:
-        return True
+        """Session cookies without expiry date are valid until server side session ends."""
+        return not self.cookies_expired
+
+    @property
+    def cookies_expired(self) -> bool:
+        """Check if any of the session cookies recorded at login has expired or was dropped from the cookie jar."""
+        cookies = {cookie.name: cookie for cookie in self.session.cookies}
+        return any(name not in cookies or cookies[name].is_expired() for name in self._login_cookie_names)
 
     @staticmethod
     def _request_headers():
@@ -68,15 +102,16 @@ class ClientAuthLoginPage(ClientAuthBase):
         token = self._get_csrf_token(response)
         data = {}
         if token is not None:
-            data["X-Uaa-Csrf"] = token
+            data[self.CSRF_TOKEN_NAME] = token
         return data
 
-    @staticmethod
-    def _get_csrf_token(content):
-        """Get csrf token from login page html response."""
-        soup = BeautifulSoup(content, 'html.parser')
-        input_tag = soup.find("input", attrs={"name": "X-Uaa-Csrf"})
-        token = None
-        if input_tag is not None:
-            token = input_tag["value"]
-        return token
+    @classmethod
+    def _get_csrf_token(cls, content):
+        """Get csrf token from login page html response, without parsing the whole document."""
+        for input_tag in cls.INPUT_TAG_PATTERN.finditer(content):
+            attributes = {}
+            for name, double_quoted, single_quoted, unquoted in cls.ATTRIBUTE_PATTERN.findall(input_tag.group(1)):
+                attributes[name.lower()] = double_quoted or single_quoted or unquoted
+            if attributes.get("name") == cls.CSRF_TOKEN_NAME:
+                return html.unescape(attributes.get("value", ""))
+        return None
@@ -14,20 +14,30 @@
 # limitations under the License.
 #
 
+import threading
 import time
 
 from requests.auth import AuthBase
 
+from ...tap_logger import get_logger
 from .client_auth_base import ClientAuthBase
 from .http_method import HttpMethod
 from .http_session import HttpSession
 from .http_token_auth import HTTPTokenAuth
 
+logger = get_logger(__name__)
+
 
 class ClientAuthToken(ClientAuthBase):
-    """Base class that all token based http client authentication implementations derive from."""
+    """
+    Base class that all token based http client authentication implementations derive from.
+    Token is refreshed in background before it expires, using refresh token if it was provided.
+    Background refresh stops if the token was not used since it was obtained - an idle client authenticates again
+    on its next request.
+    """
     request_headers = {"Accept": "application/json"}
-    token_life_time = 298
+    token_life_time = 298  # used when token response does not contain expires_in
+    token_refresh_margin = 30  # how many seconds before expiry the token is refreshed
     token_name = "access_token"
     token_header_format = "Bearer {}"
 
@@ -35,7 +45,11 @@ class ClientAuthToken(ClientAuthBase):
         self._token = None
         self._token_header = None
         self._token_timestamp = None
+        self._token_expiry = None
+        self._refresh_token = None
+        self._refresh_timer = None
         self._response = None
+        self._lock = threading.RLock()
         super().__init__(url, session)
 
     @property
@@ -48,27 +62,90 @@ class ClientAuthToken(ClientAuthBase):
         return self._token and not self._is_token_expired()
 
     def authenticate(self) -> AuthBase:
-        """Use session credentials to authenticate."""
+        """
+        Use session credentials to authenticate.
+        Concurrent calls wait for a single token request, if it succeeds they don't request another one.
+        """
+        with self._lock:
+            if self.authenticated:
+                return self._http_auth
+            return self._request_token(self.request_data)
+
+    def refresh(self, rejected_auth=None) -> bool:
+        """
+        Get a new token, e.g. after the current one was rejected by the server.
+        If rejected_auth was already replaced by another thread, the token is not requested again.
+        """
+        with self._lock:
+            if rejected_auth is not None and rejected_auth is not self._http_auth:
+                return True
+            self._request_token(self.request_data)
+            return True
+
+    def close(self):
+        """Stop background token refresh and release session resources."""
+        with self._lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+        super().close()
+
+    def _request_token(self, request_data) -> AuthBase:
+        """Request token with given grant, set it and schedule its refresh."""
+        request_time = time.time()
         self._response = self.session.request(
             HttpMethod.POST, self._url,
             headers=self.request_headers,
-            data=self.request_data,
+            data=request_data,
             auth=("cf", ""),
             log_message="Retrieve token."
         )
-        self._set_token()
+        self._set_token(request_time)
         self._http_auth = HTTPTokenAuth(self._token_header)
+        self._schedule_refresh()
         return self._http_auth
 
+    def _refresh_in_background(self):
+        """Refresh token before it expires, so that requests never wait for it."""
+        with self._lock:
+            self._refresh_timer = None
+            if not self._http_auth.used:
+                logger.debug("Token of {} was not used, background refresh stopped".format(self.session.username))
+                return
+            grants = [self.request_data]
+            if self._refresh_token is not None:
+                grants.insert(0, {"grant_type": "refresh_token", "refresh_token": self._refresh_token})
+            for request_data in grants:
+                try:
+                    self._request_token(request_data)
+                    return
+                except Exception as e:
+                    # if all grants fail, the first request after expiry authenticates again
+                    logger.warning("Token refresh ({}) for {} failed: {}".format(request_data["grant_type"],
+                                                                                self.session.username, e))
+
+    def _schedule_refresh(self):
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        life_time = self._token_expiry - time.time()
+        self._refresh_timer = threading.Timer(max(life_time - self.token_refresh_margin, life_time / 2),
+                                              self._refresh_in_background)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
     def _is_token_expired(self):
         """Check if token has been expired."""
-        return time.time() - self._token_timestamp > self.token_life_time
+        return time.time() > self._token_expiry
 
-    def _set_token(self):
+    def _set_token(self, request_time=None):
         """Set token taken from token request response."""
         if self.token_name not in self._response:
             raise ClientAuthTokenMissingResponseTokenKeyException()
         self._token_timestamp = time.time()
+        # expiry is counted from the moment of request, to stay on the safe side
+        request_time = self._token_timestamp if request_time is None else request_time
+        self._token_expiry = request_time + self._response.get("expires_in", self.token_life_time)
+        self._refresh_token = self._response.get("refresh_token", self._refresh_token)
         self._token = self._response[self.token_name]
         self._token_header = self.token_header_format.format(self._token)
 
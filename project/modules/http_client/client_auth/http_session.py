@@ -15,23 +15,35 @@
 #
 
 import json
+import time
 
 from requests import Session, Request
 
 import config
-from modules.tap_logger import log_http_request, log_http_response
+from modules.tap_logger import get_logger, log_http_request, log_http_response
 from modules.exceptions import UnexpectedResponseError
+from ..cassette import Cassette
+from ..http_client_statistics import HttpClientStatistics
+from ..request_timing import RequestTiming
 from .http_method import HttpMethod
 
+logger = get_logger(__name__)
+
 
 class HttpSession(object):
-    """User http session."""
+    """
+    User http session.
+    Request hooks are called with RequestTiming of each request sent by any session.
+    """
+
+    _REQUEST_HOOKS = []
 
     def __init__(self, username: str, password: str):
         self._username = username
         self._password = password
         self._session = Session()
         self._session.verify = config.ssl_validation
+        self.statistics = HttpClientStatistics()
 
     @property
     def username(self) -> str:
@@ -48,11 +60,24 @@ class HttpSession(object):
         """Session cookies."""
         return self._session.cookies
 
+    @classmethod
+    def add_request_hook(cls, hook):
+        """Register callable called with RequestTiming after each request."""
+        cls._REQUEST_HOOKS = cls._REQUEST_HOOKS + [hook]
+
+    @classmethod
+    def remove_request_hook(cls, hook):
+        cls._REQUEST_HOOKS = [h for h in cls._REQUEST_HOOKS if h is not hook]
+
+    def close(self):
+        """Close connections kept in the session connection pool."""
+        self._session.close()
+
     def request(self, method: HttpMethod, url, headers=None, files=None, data=None, params=None, auth=None, body=None,
                 log_message="", raw_response=False):
         """Perform request and return response."""
         request = self._request_prepare(method, url, headers, files, data, params, auth, body, log_message)
-        return self._request_perform(request, raw_response)
+        return self._request_perform(request, raw_response, log_message)
 
     def _request_prepare(self, method, url, headers, files, data, params, auth, body, log_message):
         """Prepare request to perform."""
@@ -70,9 +95,9 @@ class HttpSession(object):
         log_http_request(prepared_request, self._username, self._password, description=log_message, data=data)
         return prepared_request
 
-    def _request_perform(self, request: Request, raw_response: bool):
+    def _request_perform(self, request: Request, raw_response: bool, log_message=""):
         """Perform request and return response."""
-        response = self._session.send(request)
+        response = self._send(request, log_message)
         log_http_response(response)
         if raw_response is True:
             return response
@@ -82,3 +107,44 @@ class HttpSession(object):
             return json.loads(response.text)
         except ValueError:
             return response.text
+
+    def _send(self, request: Request, log_message="", **kwargs):
+        """Send request, record it in session statistics and pass its timing to request hooks."""
+        timestamp = time.time()
+        start_time = time.perf_counter()
+        response = None
+        try:
+            response = Cassette.send_request(self._session, request, **kwargs)
+        finally:
+            total_time = time.perf_counter() - start_time
+            response_size = len(response.content or b"") if response is not None else 0
+            self.statistics.record(total_time, self._body_size(request), response_size,
+                                   error=response is None or not response.ok)
+            if self._REQUEST_HOOKS:
+                self._call_request_hooks(request, response, response_size, log_message, timestamp, total_time)
+        return response
+
+    def _call_request_hooks(self, request, response, response_size, log_message, timestamp, total_time):
+        timing = RequestTiming(
+            method=request.method,
+            url=request.url,
+            endpoint=RequestTiming.endpoint_template(request.url),
+            label=log_message,
+            status=response.status_code if response is not None else None,
+            response_size=response_size,
+            time_to_first_byte=response.elapsed.total_seconds() if response is not None else total_time,
+            total_time=total_time,
+            timestamp=timestamp
+        )
+        for hook in self._REQUEST_HOOKS:
+            try:
+                hook(timing)
+            except Exception as e:
+                logger.warning("Request hook {} failed: {}".format(hook, e))
+
+    @staticmethod
+    def _body_size(request):
+        """Size of request body, streamed bodies report it in Content-Length header."""
+        if isinstance(request.body, (str, bytes)):
+            return len(request.body)
+        return int(request.headers.get("Content-Length", 0))
@@ -22,7 +22,9 @@ class HTTPTokenAuth(AuthBase):
 
     def __init__(self, token):
         self._token = token
+        self.used = False
 
     def __call__(self, request):
         request.headers['Authorization'] = self._token
+        self.used = True
         return request
@@ -39,9 +39,9 @@ def counted(func):
 
 class WebhdfsSession(HttpSession):
 
-    def _request_perform(self, request: Request, raw_response: bool):
+    def _request_perform(self, request: Request, raw_response: bool, log_message=""):
         """Perform request and return response."""
-        response = self._session.send(request, allow_redirects=False)
+        response = self._send(request, log_message, allow_redirects=False)
         log_http_response(response)
         if raw_response is True:
             return response
@@ -57,9 +57,8 @@ class BrokerConfigurationProvider(object):
     @classmethod
     def _get_environment(cls, broker_component: TapComponent):
         """Provide environment variables."""
-        response = cf.cf_api_get_apps()
-        app_guid = next((app["metadata"]["guid"] for app in response
-                         if app["entity"]["name"] == broker_component.value), None)
+        response = cf.cf_api_get_apps(name=broker_component.value)
+        app_guid = next((app["metadata"]["guid"] for app in response), None)
         assert app_guid is not None, "No such app {}".format(broker_component.value)
         return cf.cf_api_get_app_env(app_guid)
 
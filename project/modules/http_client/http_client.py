@@ -14,6 +14,8 @@
 # limitations under the License.
 #
 
+from ..constants import HttpStatus
+from ..exceptions import UnexpectedResponseError
 from .client_auth.http_method import HttpMethod
 from .client_auth.client_auth_base import ClientAuthBase
 
@@ -43,11 +45,37 @@ class HttpClient(object):
     def session(self, session):
         self._auth.session = session
 
+    @property
+    def statistics(self):
+        """Request count, transferred bytes and latency of requests sent by this client."""
+        return self._auth.session.statistics
+
+    def close(self):
+        """Release client resources, the client should not be used afterwards."""
+        self._auth.close()
+
     def request(self, method: HttpMethod, path, headers=None, files=None, params=None, data=None, body=None, msg="",
                 raw_response=False):
-        """Perform request and return response."""
+        """
+        Perform request and return response.
+        If the server rejects authentication (401), authenticate again and retry the request once.
+        """
         if not self._auth.authenticated:
             self._auth.authenticate()
+        http_auth = self._auth.http_auth
+        file_positions = self._file_positions(files)
+        try:
+            response = self._request(method, path, headers, files, params, data, body, msg, raw_response, http_auth)
+        except UnexpectedResponseError as e:
+            if not self._should_retry(e.status, data, file_positions, http_auth):
+                raise
+        else:
+            if not (raw_response and self._should_retry(response.status_code, data, file_positions, http_auth)):
+                return response
+        return self._request(method, path, headers, files, params, data, body, msg, raw_response,
+                             self._auth.http_auth)
+
+    def _request(self, method, path, headers, files, params, data, body, msg, raw_response, http_auth):
         return self._auth.session.request(
             method=method,
             url="{}/{}".format(self.url, path),
@@ -56,7 +84,36 @@ class HttpClient(object):
             params=params,
             data=data,
             body=body,
-            auth=self._auth.http_auth,
+            auth=http_auth,
             log_message=msg,
             raw_response=raw_response
         )
+
+    def _should_retry(self, status, data, file_positions, http_auth):
+        """
+        Retry unauthorized request if authentication was renewed - streamed data and files which can't be rewound
+        can't be sent again.
+        """
+        if status != HttpStatus.CODE_UNAUTHORIZED or hasattr(data, "read") or file_positions is None:
+            return False
+        if not self._auth.refresh(rejected_auth=http_auth):
+            return False
+        for handle, position in file_positions:
+            handle.seek(position)
+        return True
+
+    @staticmethod
+    def _file_positions(files):
+        """Return list of (file handle, position) of files to be uploaded, None if some handle can't be rewound."""
+        if files is None:
+            return []
+        values = files.values() if isinstance(files, dict) else [value for _, value in files]
+        positions = []
+        for value in values:
+            handle = value[1] if isinstance(value, (tuple, list)) else value
+            if not hasattr(handle, "read"):
+                continue
+            if not (hasattr(handle, "seekable") and handle.seekable()):
+                return None
+            positions.append((handle, handle.tell()))
+        return positions
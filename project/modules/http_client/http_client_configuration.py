@@ -36,6 +36,10 @@ class HttpClientConfiguration(object):
     def __hash__(self):
         return hash(tuple(getattr(self, a) for a in self.identity_attribtues))
 
+    def __repr__(self):
+        return "{} (client_type={}, url={}, username={})".format(self.__class__.__name__, self._client_type.name,
+                                                                 self._url, self._username)
+
     @property
     def client_type(self):
         """Client type."""
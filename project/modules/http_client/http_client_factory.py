@@ -14,17 +14,38 @@
 # limitations under the License.
 #
 
+import threading
+import time
+from collections import OrderedDict
+
+import config
+from ..tap_logger import get_logger
 from .http_client import HttpClient
 from .http_client_type import HttpClientType
 from .client_auth.client_auth_type import ClientAuthType
 from .client_auth.client_auth_factory import ClientAuthFactory
 from .http_client_configuration import HttpClientConfiguration
 
+logger = get_logger(__name__)
 
-class HttpClientFactory(object):
-    """Http client factory with implemented singleton behaviour for each generated client."""
 
-    _INSTANCES = {}
+class HttpClientFactory(object):
+    """
+    Http client factory with implemented singleton behaviour for each generated client.
+    Cached clients are bounded: least recently used clients above MAX_INSTANCES and clients which were not used for
+    MAX_IDLE_TIME seconds are evicted and their sessions closed. Clients acquired (e.g. by HttpClientPool) are in use
+    and are not evicted until released. Statistics are kept for evicted clients too, for at most MAX_STATISTICS most
+    recently used configurations.
+    """
+
+    MAX_INSTANCES = config.http_client_cache_size
+    MAX_IDLE_TIME = config.http_client_max_idle_time
+    MAX_STATISTICS = config.http_client_statistics_size
+
+    _INSTANCES = OrderedDict()
+    _STATISTICS = OrderedDict()
+    _ACQUIRED = {}  # configuration -> number of users of the client which did not release it yet
+    _LOCK = threading.RLock()
 
     @classmethod
     def get(cls, configuration: HttpClientConfiguration) -> HttpClient:
@@ -64,15 +85,61 @@ class HttpClientFactory(object):
     @classmethod
     def remove(cls, configuration: HttpClientConfiguration):
         """Remove client instance from cached instances."""
-        if configuration in cls._INSTANCES:
-            del cls._INSTANCES[configuration]
+        with cls._LOCK:
+            if configuration in cls._INSTANCES:
+                del cls._INSTANCES[configuration]
+
+    @classmethod
+    def acquire(cls, configuration: HttpClientConfiguration):
+        """Mark client for configuration as in use, so that it is not evicted until released."""
+        with cls._LOCK:
+            cls._ACQUIRED[configuration] = cls._ACQUIRED.get(configuration, 0) + 1
+
+    @classmethod
+    def release(cls, configuration: HttpClientConfiguration):
+        """Release client acquired for configuration, it is evicted as other clients when no longer in use."""
+        with cls._LOCK:
+            count = cls._ACQUIRED.get(configuration, 0) - 1
+            if count > 0:
+                cls._ACQUIRED[configuration] = count
+            else:
+                cls._ACQUIRED.pop(configuration, None)
+
+    @classmethod
+    def is_cached(cls, configuration: HttpClientConfiguration) -> bool:
+        """Check if client for configuration was created and was not evicted or removed since."""
+        with cls._LOCK:
+            return configuration in cls._INSTANCES
+
+    @classmethod
+    def statistics(cls) -> dict:
+        """Return dict of statistics of requests sent by clients created so far, keyed by client configuration."""
+        with cls._LOCK:
+            return dict(cls._STATISTICS)
 
     @classmethod
     def _get_instance(cls, configuration, auth_type):
         """Check if there is already created requested client type and return it otherwise create new instance."""
-        if configuration in cls._INSTANCES:
-            return cls._INSTANCES[configuration]
-        return cls._create_instance(configuration, auth_type)
+        with cls._LOCK:
+            instance = cls._INSTANCES.get(configuration)
+            if instance is not None:
+                cls._INSTANCES.move_to_end(configuration)
+                return instance
+        # authentication can take a while, so other clients are not blocked meanwhile
+        instance = cls._create_instance(configuration, auth_type)
+        with cls._LOCK:
+            existing = cls._INSTANCES.get(configuration)
+            if existing is not None:
+                instance.close()
+                return existing
+            statistics = cls._STATISTICS.setdefault(configuration, instance.statistics)
+            if statistics is not instance.statistics:
+                statistics.merge(instance.statistics)
+                instance.session.statistics = statistics
+            cls._STATISTICS.move_to_end(configuration)
+            cls._INSTANCES[configuration] = instance
+            cls._evict()
+        return instance
 
     @classmethod
     def _create_instance(cls, configuration, auth_type):
@@ -82,9 +149,31 @@ class HttpClientFactory(object):
             password=configuration.password,
             auth_type=auth_type
         )
-        instance = HttpClient(configuration.url, auth)
-        cls._INSTANCES[configuration] = instance
-        return instance
+        return HttpClient(configuration.url, auth)
+
+    @classmethod
+    def _evict(cls):
+        """Close unused clients which are idle or least recently used above size limit, drop oldest statistics."""
+        idle_time_limit = time.time() - cls.MAX_IDLE_TIME
+        over_limit = len(cls._INSTANCES) - cls.MAX_INSTANCES
+        for configuration in list(cls._INSTANCES)[:-1]:  # the last one was just used
+            if cls._is_used(configuration):
+                continue
+            if over_limit > 0 or cls._INSTANCES[configuration].statistics.last_used < idle_time_limit:
+                cls._close(configuration)
+                over_limit -= 1
+        evicted = [c for c in cls._STATISTICS if c not in cls._INSTANCES]
+        for configuration in evicted[:max(len(cls._STATISTICS) - cls.MAX_STATISTICS, 0)]:
+            del cls._STATISTICS[configuration]
+
+    @classmethod
+    def _is_used(cls, configuration):
+        return cls._ACQUIRED.get(configuration, 0) > 0
+
+    @classmethod
+    def _close(cls, configuration):
+        logger.debug("Closing http client for {}".format(configuration))
+        cls._INSTANCES.pop(configuration).close()
 
 
 class HttpClientFactoryInvalidClientTypeException(Exception):
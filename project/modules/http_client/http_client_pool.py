@@ -0,0 +1,138 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+from ..tap_logger import get_logger
+from .http_client import HttpClient
+from .http_client_configuration import HttpClientConfiguration
+from .http_client_factory import HttpClientFactory
+
+logger = get_logger(__name__)
+
+
+class HttpClientPool(object):
+    """
+    Pool of authenticated http clients, e.g. for per-user console clients used by tests.
+    Clients are logged in concurrently on warm up and kept alive by a background thread, which logs them in again
+    when their session cookies expire. Clients are checked on checkout, so tests always get an authenticated client.
+    Pooled clients are acquired from HttpClientFactory, so they are not evicted from its cache until removed from the
+    pool. Clients removed from HttpClientFactory cache are no longer kept alive, checkout logs them in again.
+    """
+
+    _CONFIGURATIONS = []
+    _LOCK = threading.Lock()
+    _KEEPALIVE_THREAD = None
+    _KEEPALIVE_STOP = None
+
+    @classmethod
+    def warm_up(cls, configurations, max_workers=None) -> list:
+        """
+        Log in clients for all configurations concurrently and return the clients in the same order.
+        max_workers -- number of concurrent logins, config.client_pool_workers by default
+        """
+        max_workers = config.client_pool_workers if max_workers is None else max_workers
+        configurations = list(configurations)
+        if not configurations:
+            return []
+        logger.info("Logging in {} http clients".format(len(configurations)))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(configurations))) as executor:
+            clients = list(executor.map(cls._get_client, configurations))
+        with cls._LOCK:
+            for configuration in configurations:
+                if configuration not in cls._CONFIGURATIONS:
+                    cls._CONFIGURATIONS.append(configuration)
+                    HttpClientFactory.acquire(configuration)
+        return clients
+
+    @classmethod
+    def checkout(cls, configuration: HttpClientConfiguration) -> HttpClient:
+        """Return authenticated client for configuration, log it in if it was not warmed up or session expired."""
+        with cls._LOCK:
+            pooled = configuration in cls._CONFIGURATIONS
+        if not pooled:
+            return cls.warm_up([configuration])[0]
+        client = HttpClientFactory.get(configuration)
+        cls._ensure_authenticated(client)
+        return client
+
+    @classmethod
+    def remove(cls, configuration: HttpClientConfiguration):
+        """Stop keeping client alive and remove it from cached instances."""
+        cls._drop(configuration)
+        HttpClientFactory.remove(configuration)
+
+    @classmethod
+    def start_keepalive(cls, interval=None, ping=None):
+        """
+        Start background thread which every interval seconds logs in clients with expired session.
+        interval -- in seconds, config.client_pool_keepalive_interval by default
+        ping -- optional callable, called with each client to keep server side session from timing out
+        """
+        interval = config.client_pool_keepalive_interval if interval is None else interval
+        with cls._LOCK:
+            if cls._KEEPALIVE_THREAD is not None:
+                return
+            cls._KEEPALIVE_STOP = threading.Event()
+            cls._KEEPALIVE_THREAD = threading.Thread(target=cls._keepalive, args=(cls._KEEPALIVE_STOP, interval, ping),
+                                                     name="http-client-pool-keepalive", daemon=True)
+            cls._KEEPALIVE_THREAD.start()
+
+    @classmethod
+    def stop_keepalive(cls):
+        """Stop background keepalive thread."""
+        with cls._LOCK:
+            thread, stop = cls._KEEPALIVE_THREAD, cls._KEEPALIVE_STOP
+            cls._KEEPALIVE_THREAD = cls._KEEPALIVE_STOP = None
+        if thread is not None:
+            stop.set()
+            thread.join()
+
+    @classmethod
+    def _get_client(cls, configuration):
+        client = HttpClientFactory.get(configuration)
+        cls._ensure_authenticated(client)
+        return client
+
+    @classmethod
+    def _drop(cls, configuration):
+        """Remove configuration from the pool and release its client."""
+        with cls._LOCK:
+            if configuration in cls._CONFIGURATIONS:
+                cls._CONFIGURATIONS.remove(configuration)
+                HttpClientFactory.release(configuration)
+
+    @staticmethod
+    def _ensure_authenticated(client):
+        if not client.auth.authenticated:
+            client.auth.authenticate()
+
+    @classmethod
+    def _keepalive(cls, stop, interval, ping):
+        while not stop.wait(interval):
+            with cls._LOCK:
+                configurations = list(cls._CONFIGURATIONS)
+            for configuration in configurations:
+                if not HttpClientFactory.is_cached(configuration):
+                    cls._drop(configuration)
+                    continue
+                try:
+                    client = cls._get_client(configuration)
+                    if ping is not None:
+                        ping(client)
+                except Exception as e:
+                    logger.warning("Keepalive of http client for {} failed: {}".format(configuration.username, e))
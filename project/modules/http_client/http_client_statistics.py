@@ -0,0 +1,69 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+
+
+class HttpClientStatistics(object):
+    """Request count, transferred bytes and latency of requests sent by one http client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.request_count = 0
+        self.error_count = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_used = time.time()
+
+    @property
+    def mean_time(self) -> float:
+        """Mean request time in seconds."""
+        return self.total_time / self.request_count if self.request_count else 0.0
+
+    def record(self, elapsed_time: float, bytes_sent=0, bytes_received=0, error=False):
+        """Add one request, elapsed_time in seconds."""
+        with self._lock:
+            self.request_count += 1
+            self.error_count += int(error)
+            self.bytes_sent += bytes_sent
+            self.bytes_received += bytes_received
+            self.total_time += elapsed_time
+            self.max_time = max(self.max_time, elapsed_time)
+            self.last_used = time.time()
+
+    def merge(self, other):
+        """Add requests recorded by other statistics."""
+        with self._lock:
+            self.request_count += other.request_count
+            self.error_count += other.error_count
+            self.bytes_sent += other.bytes_sent
+            self.bytes_received += other.bytes_received
+            self.total_time += other.total_time
+            self.max_time = max(self.max_time, other.max_time)
+            self.last_used = max(self.last_used, other.last_used)
+
+    def to_dict(self) -> dict:
+        return {
+            "request_count": self.request_count,
+            "error_count": self.error_count,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "total_time": self.total_time,
+            "mean_time": self.mean_time,
+            "max_time": self.max_time,
+        }
@@ -0,0 +1,143 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import csv
+import json
+import math
+import re
+import threading
+from collections import namedtuple, OrderedDict
+
+
+class RequestTiming(namedtuple("RequestTiming", ["method", "url", "endpoint", "label", "status", "response_size",
+                                                 "time_to_first_byte", "total_time", "timestamp"])):
+    """
+    Timing of one request sent by HttpSession, times in seconds.
+    time_to_first_byte -- from sending the request (including connection setup) until response headers were parsed
+    total_time -- including download of response body, status is None if no response was received
+    """
+    __slots__ = ()
+
+    GUID_PATTERN = re.compile(r"(?<=/)[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)")
+    ID_PATTERN = re.compile(r"(?<=/)\d+(?=/|$)")
+
+    @classmethod
+    def endpoint_template(cls, url: str) -> str:
+        """Return url without query, with guids and numeric ids replaced by placeholders."""
+        path = url.split("?", 1)[0]
+        return cls.ID_PATTERN.sub("{id}", cls.GUID_PATTERN.sub("{guid}", path))
+
+
+def percentile(values, p):
+    """Return p-th percentile of sorted values using nearest-rank method."""
+    if not values:
+        return 0
+    rank = max(int(math.ceil(p / 100 * len(values))), 1)
+    return values[rank - 1]
+
+
+class EndpointHistogramSink(object):
+    """Collect request durations in memory, grouped by method and endpoint template."""
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._durations = OrderedDict()
+
+    def __call__(self, timing: RequestTiming):
+        with self._lock:
+            self._durations.setdefault((timing.method, timing.endpoint), []).append(timing.total_time)
+
+    def summary(self) -> list:
+        """Return list of dicts with request count and duration statistics for each endpoint, slowest first."""
+        with self._lock:
+            durations = [(key, sorted(values)) for key, values in self._durations.items()]
+        summary = []
+        for (method, endpoint), values in durations:
+            endpoint_summary = OrderedDict([("method", method), ("endpoint", endpoint), ("count", len(values)),
+                                            ("total_time", sum(values))])
+            for p in self.PERCENTILES:
+                endpoint_summary["p{}".format(p)] = percentile(values, p)
+            endpoint_summary["max_time"] = values[-1]
+            summary.append(endpoint_summary)
+        return sorted(summary, key=lambda s: s["total_time"], reverse=True)
+
+
+class RequestCollectorSink(object):
+    """
+    Collect requests sent between start and stop by the thread which called start, e.g. during one test, and
+    summarize them per endpoint. Requests sent meanwhile by background threads (e.g. client pool keepalive or token
+    refresh) are not collected.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings = None
+        self._thread_id = None
+
+    def __call__(self, timing: RequestTiming):
+        with self._lock:
+            if self._timings is not None and threading.get_ident() == self._thread_id:
+                self._timings.append(timing)
+
+    def start(self):
+        with self._lock:
+            self._timings = []
+            self._thread_id = threading.get_ident()
+
+    def stop(self) -> list:
+        """Stop collecting, return list of dicts with count and total time of requests per endpoint and label."""
+        with self._lock:
+            timings, self._timings = self._timings or [], None
+        summary = OrderedDict()
+        for timing in timings:
+            key = (timing.method, timing.endpoint, timing.label)
+            endpoint_summary = summary.setdefault(key, {"method": timing.method, "endpoint": timing.endpoint,
+                                                        "label": timing.label, "count": 0, "total_time": 0.0,
+                                                        "max_time": 0.0})
+            endpoint_summary["count"] += 1
+            endpoint_summary["total_time"] += timing.total_time
+            endpoint_summary["max_time"] = max(endpoint_summary["max_time"], timing.total_time)
+        return list(summary.values())
+
+
+class RequestTimingFileSink(object):
+    """Dump all request timings to a file - JSON list if path ends with .json, CSV otherwise."""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._path = path
+        self._json = path.endswith(".json")
+        self._timings = []
+        if not self._json:
+            self._file = open(path, "w", newline="")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(RequestTiming._fields)
+
+    def __call__(self, timing: RequestTiming):
+        with self._lock:
+            if self._json:
+                self._timings.append(timing._asdict())
+            else:
+                self._writer.writerow(timing)
+
+    def close(self):
+        with self._lock:
+            if self._json:
+                with open(self._path, "w") as f:
+                    json.dump(self._timings, f, indent=2)
+            else:
+                self._file.close()
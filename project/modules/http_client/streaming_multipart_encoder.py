@@ -0,0 +1,143 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import time
+import uuid
+
+
+class StreamingMultipartEncoder(object):
+    """
+    File-like multipart/form-data request body.
+    Uploaded files are read in chunks while the request is sent, so memory use does not depend on file size.
+    Pass it as request data together with Content-Type header set to content_type.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, fields=None, files=None, progress_callback=None):
+        """
+        fields -- dict of form field names and values
+        files -- dict of form field names and tuples (file name, file path, content type)
+        progress_callback -- called with number of bytes sent so far and total number of bytes after each read
+        """
+        self._boundary = uuid.uuid4().hex
+        self._progress_callback = progress_callback
+        self._parts = []  # bytes are sent as they are, str are paths of files to stream
+        for name, value in sorted((fields or {}).items()):
+            self._parts.append(self._part_header(name) + str(value).encode() + b"\r\n")
+        for name, (file_name, file_path, content_type) in sorted((files or {}).items()):
+            self._parts.append(self._part_header(name, file_name, content_type))
+            self._parts.append(file_path)
+            self._parts.append(b"\r\n")
+        self._parts.append("--{}--\r\n".format(self._boundary).encode())
+        self._length = sum(len(part) if isinstance(part, bytes) else os.path.getsize(part) for part in self._parts)
+        self._part_index = 0
+        self._part_offset = 0
+        self._file = None
+        self._bytes_sent = 0
+        self._start_time = None
+        self._end_time = None
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        chunk = self.read(self.CHUNK_SIZE)
+        while chunk:
+            yield chunk
+            chunk = self.read(self.CHUNK_SIZE)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return "{} (boundary={}, length={})".format(self.__class__.__name__, self._boundary, self._length)
+
+    @property
+    def content_type(self):
+        """Value of Content-Type header for the request."""
+        return "multipart/form-data; boundary={}".format(self._boundary)
+
+    @property
+    def bytes_sent(self):
+        """Number of bytes read from the body so far."""
+        return self._bytes_sent
+
+    @property
+    def elapsed_time(self):
+        """Seconds between first and last read of the body."""
+        if self._start_time is None:
+            return 0
+        return (self._end_time or time.time()) - self._start_time
+
+    @property
+    def throughput(self):
+        """Upload throughput in bytes per second."""
+        elapsed_time = self.elapsed_time
+        return self._bytes_sent / elapsed_time if elapsed_time > 0 else 0
+
+    def read(self, size=-1):
+        """Return next chunk of the body, at most size bytes long."""
+        if self._start_time is None:
+            self._start_time = time.time()
+        remaining = self._length if size is None or size < 0 else size
+        chunks = []
+        while remaining > 0 and self._part_index < len(self._parts):
+            part = self._parts[self._part_index]
+            if isinstance(part, bytes):
+                chunk = part[self._part_offset:self._part_offset + remaining]
+                self._part_offset += len(chunk)
+                part_finished = self._part_offset >= len(part)
+            else:
+                if self._file is None:
+                    self._file = open(part, "rb")
+                chunk = self._file.read(remaining)
+                part_finished = len(chunk) < remaining
+            if part_finished:
+                self._close_file()
+                self._part_index += 1
+                self._part_offset = 0
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        data = b"".join(chunks)
+        self._bytes_sent += len(data)
+        if self._part_index == len(self._parts) and self._end_time is None:
+            self._end_time = time.time()
+        if self._progress_callback is not None and data:
+            self._progress_callback(self._bytes_sent, self._length)
+        return data
+
+    def close(self):
+        """Close currently streamed file, if any."""
+        self._close_file()
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _part_header(self, name, file_name=None, content_type=None):
+        disposition = 'form-data; name="{}"'.format(name)
+        if file_name is not None:
+            disposition += '; filename="{}"'.format(file_name)
+        lines = ["--{}".format(self._boundary), "Content-Disposition: {}".format(disposition)]
+        if content_type is not None:
+            lines.append("Content-Type: {}".format(content_type))
+        return ("\r\n".join(lines) + "\r\n\r\n").encode()
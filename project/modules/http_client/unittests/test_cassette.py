@@ -0,0 +1,159 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import ANY, MagicMock
+
+from requests import Request, Response, Session
+
+from modules.http_client.cassette import Cassette, CassetteInvalidModeException, CassetteRequestNotFoundException
+
+
+class TestCassette(unittest.TestCase):
+    """Unit: Cassette."""
+
+    URL = "http://api.test/v2/organizations"
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cassette.json")
+        self.session = MagicMock(spec=Session)
+        self.session.send.side_effect = lambda request, **kwargs: self._response(request)
+        self.responses = []
+
+    def _response(self, request):
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        response.headers["Set-Cookie"] = "JSESSIONID=secret"
+        response._content = json.dumps({"access_token": "secret", "number": len(self.responses)}).encode()
+        self.responses.append(response)
+        return response
+
+    @staticmethod
+    def _request(method="GET", url=URL, **kwargs):
+        return Request(method=method, url=url, **kwargs).prepare()
+
+    def _record(self, *requests):
+        cassette = Cassette(self.path, Cassette.RECORD)
+        for request in requests:
+            cassette.send(self.session, request)
+        cassette.save()
+        return cassette
+
+    def test_replay_should_return_recorded_responses_in_order(self):
+        # given
+        self._record(self._request(), self._request())
+        cassette = Cassette(self.path, Cassette.REPLAY)
+        # when
+        numbers = [cassette.send(self.session, self._request()).json()["number"] for _ in range(3)]
+        # then
+        self.assertEqual([0, 1, 1], numbers)
+        self.assertEqual(2, self.session.send.call_count)
+
+    def test_replay_should_match_test_names_generated_at_other_time(self):
+        # given
+        self._record(self._request("POST", json={"name": "host_20160901_101010_123456"}))
+        cassette = Cassette(self.path, Cassette.REPLAY)
+        # when
+        response = cassette.send(self.session, self._request("POST", json={"name": "host_20161012_121212_654321"}))
+        # then
+        self.assertEqual(200, response.status_code)
+
+    def test_replay_should_match_test_names_generated_on_other_agent(self):
+        # given
+        self._record(self._request("GET", url="http://api.test/orgs/agent_1_gw0_3_20160901_101010_123456"))
+        cassette = Cassette(self.path, Cassette.REPLAY)
+        # when
+        request = self._request("GET", url="http://api.test/orgs/ci.host_12_20161012_121212")
+        response = cassette.send(self.session, request)
+        # then
+        self.assertEqual(200, response.status_code)
+
+    def test_replay_should_report_unmatched_request(self):
+        # given
+        self._record(self._request())
+        cassette = Cassette(self.path, Cassette.REPLAY)
+        request = self._request("DELETE")
+        # then
+        self.assertRaises(CassetteRequestNotFoundException, cassette.send, self.session, request)
+        self.assertEqual([Cassette.request_key(request)], cassette.unmatched)
+
+    def test_record_should_redact_secrets(self):
+        # given
+        self._record(self._request("POST", data={"username": "user", "password": "secret"},
+                                   headers={"Authorization": "Bearer secret"}))
+        # when
+        with open(self.path) as f:
+            content = f.read()
+        # then
+        self.assertNotIn("secret", content)
+
+    def test_request_key_should_not_depend_on_secrets(self):
+        first = self._request("POST", data={"username": "user", "password": "first"})
+        second = self._request("POST", data={"username": "user", "password": "second"})
+        self.assertEqual(Cassette.request_key(first), Cassette.request_key(second))
+
+    def test_request_key_should_not_depend_on_json_key_order(self):
+        first = self._request("POST", data='{"name": "org", "guid": "1"}', headers={"Content-Type": "application/json"})
+        second = self._request("POST", data='{"guid": "1", "name": "org"}', headers={"Content-Type": "application/json"})
+        self.assertEqual(Cassette.request_key(first), Cassette.request_key(second))
+
+    def test_request_key_should_not_depend_on_form_field_order(self):
+        first = self._request("POST", data=[("username", "user"), ("grant_type", "password")])
+        second = self._request("POST", data=[("grant_type", "password"), ("username", "user")])
+        self.assertEqual(Cassette.request_key(first), Cassette.request_key(second))
+
+    def test_request_key_should_not_depend_on_multipart_boundary_and_part_order(self):
+        first = self._request("POST", files=[("a", ("a.csv", b"1,2")), ("b", ("b.csv", b"3,4"))])
+        second = self._request("POST", files=[("b", ("b.csv", b"3,4")), ("a", ("a.csv", b"1,2"))])
+        self.assertNotEqual(first.headers["Content-Type"], second.headers["Content-Type"])
+        self.assertEqual(Cassette.request_key(first), Cassette.request_key(second))
+        other = self._request("POST", files=[("a", ("a.csv", b"1,3")), ("b", ("b.csv", b"3,4"))])
+        self.assertNotEqual(Cassette.request_key(first), Cassette.request_key(other))
+
+    def test_sleep_should_be_skipped_while_replaying(self):
+        # given
+        self._record(self._request())
+        original_sleep = time.sleep
+        # when
+        Cassette.activate(Cassette(self.path, Cassette.REPLAY))
+        try:
+            start = time.perf_counter()
+            time.sleep(1)
+            elapsed = time.perf_counter() - start
+        finally:
+            Cassette.deactivate()
+        # then
+        self.assertLess(elapsed, 0.5)
+        self.assertIs(original_sleep, time.sleep)
+
+    def test_send_request_should_use_session_without_active_cassette(self):
+        # given
+        Cassette.deactivate()
+        # when
+        Cassette.send_request(self.session, self._request())
+        # then
+        self.session.send.assert_called_once_with(ANY)
+
+    def test_invalid_mode_should_raise_exception(self):
+        self.assertRaises(CassetteInvalidModeException, Cassette, self.path, "rewind")
@@ -0,0 +1,115 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from modules.http_client.client_auth.client_auth_login_page import ClientAuthLoginPage
+from modules.http_client.client_auth.http_method import HttpMethod
+from modules.http_client.client_auth.http_session import HttpSession
+
+
+class TestClientAuthLoginPage(unittest.TestCase):
+    """Unit: ClientAuthLoginPage."""
+
+    URL = "http://login.url"
+    LOGIN_PAGE = """<html><body><form action="/login.do" method="post">
+        <input type="hidden" name="X-Uaa-Csrf" value="csrf&amp;token"/>
+        <input name='username' type='email'>
+    </form></body></html>"""
+
+    def setUp(self):
+        self.login_requests = []
+        self.cookie_expiry = None
+        patcher = patch("modules.http_client.client_auth.http_session.HttpSession.request",
+                        side_effect=self._response)
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _response(self, method, url, **kwargs):
+        if method == HttpMethod.GET:
+            return self.LOGIN_PAGE
+        self.login_requests.append(kwargs["data"])
+        self.session.cookies.set(ClientAuthLoginPage.CSRF_TOKEN_NAME, "csrf", expires=int(time.time()) + 60)
+        self.session.cookies.set("JSESSIONID", "session-{}".format(len(self.login_requests)),
+                                 expires=self.cookie_expiry)
+        return MagicMock(ok=True, text="")
+
+    def _create_auth(self):
+        self.session = HttpSession("username", "password")
+        return ClientAuthLoginPage(self.URL, self.session)
+
+    def test_get_csrf_token_should_return_unescaped_value(self):
+        self.assertEqual("csrf&token", ClientAuthLoginPage._get_csrf_token(self.LOGIN_PAGE))
+
+    def test_get_csrf_token_should_accept_attributes_in_any_order_and_quoting(self):
+        # given
+        content = "<INPUT value=abc-123 type='hidden' NAME=\"X-Uaa-Csrf\">"
+        # then
+        self.assertEqual("abc-123", ClientAuthLoginPage._get_csrf_token(content))
+
+    def test_get_csrf_token_should_return_none_without_token_input(self):
+        self.assertIsNone(ClientAuthLoginPage._get_csrf_token("<form><input name='username'></form>"))
+
+    def test_authenticate_should_send_csrf_token(self):
+        # when
+        self._create_auth()
+        # then
+        self.assertEqual([{"username": "username", "password": "password", "X-Uaa-Csrf": "csrf&token"}],
+                         self.login_requests)
+
+    def test_authenticated_should_be_true_for_session_cookie(self):
+        # when
+        auth = self._create_auth()
+        # then
+        self.assertTrue(auth.authenticated)
+
+    def test_authenticated_should_be_false_when_login_cookie_expired(self):
+        # given
+        self.cookie_expiry = int(time.time()) + 60
+        auth = self._create_auth()
+        self.assertTrue(auth.authenticated)
+        # when
+        self.session.cookies.set("JSESSIONID", "session-1", expires=int(time.time()) - 1)
+        # then
+        self.assertTrue(auth.cookies_expired)
+        self.assertFalse(auth.authenticated)
+
+    def test_authenticated_should_be_false_when_login_cookie_was_removed(self):
+        # given
+        auth = self._create_auth()
+        # when
+        self.session.cookies.clear()
+        # then
+        self.assertFalse(auth.authenticated)
+
+    def test_authenticated_should_ignore_expired_non_session_cookie(self):
+        # given
+        auth = self._create_auth()
+        # when
+        self.session.cookies.set(ClientAuthLoginPage.CSRF_TOKEN_NAME, "csrf", expires=int(time.time()) - 1)
+        # then
+        self.assertTrue(auth.authenticated)
+
+    def test_cookies_without_expiry_should_be_session_cookies_without_known_session_cookie(self):
+        # given
+        auth = self._create_auth()
+        self.session.cookies.clear(domain="", path="/", name="JSESSIONID")
+        self.session.cookies.set("SESSION", "session")
+        # when
+        names = auth._session_cookie_names()
+        # then
+        self.assertEqual(frozenset({"SESSION"}), names)
@@ -0,0 +1,217 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import io
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from requests import Response
+
+from modules.constants import HttpStatus
+from modules.exceptions import UnexpectedResponseError
+from modules.http_client.client_auth.client_auth_token import ClientAuthToken
+from modules.http_client.client_auth.http_method import HttpMethod
+from modules.http_client.client_auth.http_session import HttpSession
+from modules.http_client.http_client import HttpClient
+
+
+class TestClientAuthToken(unittest.TestCase):
+    """Unit: ClientAuthToken."""
+
+    URL = "http://auth.url"
+    TIME = 1000.0
+
+    def setUp(self):
+        self.token_responses = []
+        patcher = patch("modules.http_client.client_auth.http_session.HttpSession.request",
+                        side_effect=self._token_response)
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        time_patcher = patch("modules.http_client.client_auth.client_auth_token.time.time", return_value=self.TIME)
+        self.mock_time = time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+        timer_patcher = patch("modules.http_client.client_auth.client_auth_token.threading.Timer")
+        self.mock_timer = timer_patcher.start()
+        self.addCleanup(timer_patcher.stop)
+
+    def _token_response(self, *args, **kwargs):
+        number = len(self.token_responses)
+        response = {"access_token": "token-{}".format(number), "refresh_token": "refresh-{}".format(number),
+                    "expires_in": 600}
+        self.token_responses.append(kwargs.get("data"))
+        return response
+
+    def _create_auth(self):
+        return ClientAuthToken(self.URL, HttpSession("username", "password"))
+
+    def test_expiry_should_be_read_from_token_response(self):
+        # given
+        auth = self._create_auth()
+        # then
+        self.assertTrue(auth.authenticated)
+        self.mock_time.return_value = self.TIME + 599
+        self.assertTrue(auth.authenticated)
+        self.mock_time.return_value = self.TIME + 601
+        self.assertFalse(auth.authenticated)
+
+    def test_refresh_should_be_scheduled_before_expiry(self):
+        # when
+        auth = self._create_auth()
+        # then
+        self.mock_timer.assert_called_once_with(600 - auth.token_refresh_margin, auth._refresh_in_background)
+        self.assertTrue(self.mock_timer.return_value.start.called)
+
+    def _create_used_auth(self):
+        auth = self._create_auth()
+        auth.http_auth(Mock(headers={}))
+        return auth
+
+    def test_background_refresh_should_use_refresh_token(self):
+        # given
+        auth = self._create_used_auth()
+        # when
+        auth._refresh_in_background()
+        # then
+        self.assertEqual({"grant_type": "refresh_token", "refresh_token": "refresh-0"}, self.token_responses[-1])
+        self.assertEqual("token-1", auth.token)
+        self.assertEqual(2, self.mock_timer.call_count)
+
+    def test_background_refresh_should_fall_back_to_password_grant(self):
+        # given
+        auth = self._create_used_auth()
+        self.mock_request.side_effect = [UnexpectedResponseError(HttpStatus.CODE_UNAUTHORIZED, "invalid token"),
+                                         {"access_token": "new-token", "expires_in": 600}]
+        # when
+        auth._refresh_in_background()
+        # then
+        self.assertEqual("password", self.mock_request.call_args[1]["data"]["grant_type"])
+        self.assertEqual("new-token", auth.token)
+
+    def test_background_refresh_should_stop_if_token_was_not_used(self):
+        # given
+        auth = self._create_used_auth()
+        auth._refresh_in_background()
+        self.mock_timer.reset_mock()
+        # when
+        auth._refresh_in_background()
+        # then
+        self.assertEqual(2, len(self.token_responses))
+        self.assertFalse(self.mock_timer.called)
+        self.assertEqual("token-1", auth.token)
+        self.mock_time.return_value = self.TIME + 601
+        self.assertFalse(auth.authenticated)
+
+    def test_refresh_should_not_request_token_if_rejected_auth_was_already_replaced(self):
+        # given
+        auth = self._create_auth()
+        rejected_auth = auth.http_auth
+        auth.refresh(rejected_auth)
+        # when
+        auth.refresh(rejected_auth)
+        # then
+        self.assertEqual(2, len(self.token_responses))
+
+    def test_concurrent_authentication_should_request_single_token(self):
+        # given
+        auth = self._create_auth()
+        self.mock_time.return_value = self.TIME + 601
+        # when
+        threads = [threading.Thread(target=auth.authenticate) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # then
+        self.assertEqual(2, len(self.token_responses))
+
+
+class TestHttpClientUnauthorizedRetry(unittest.TestCase):
+    """Unit: HttpClient retry after 401."""
+
+    def setUp(self):
+        timer_patcher = patch("modules.http_client.client_auth.client_auth_token.threading.Timer")
+        timer_patcher.start()
+        self.addCleanup(timer_patcher.stop)
+        patcher = patch("modules.http_client.client_auth.http_session.HttpSession.request",
+                        return_value={"access_token": "token", "expires_in": 600})
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.http_client = HttpClient("http://some.url", ClientAuthToken("http://auth.url",
+                                                                          HttpSession("username", "password")))
+
+    def test_unauthorized_request_should_be_retried_once_with_new_token(self):
+        # given
+        self.mock_request.side_effect = [UnexpectedResponseError(HttpStatus.CODE_UNAUTHORIZED, "expired"),
+                                         {"access_token": "new-token", "expires_in": 600},
+                                         {"status": "ok"}]
+        # when
+        response = self.http_client.request(HttpMethod.GET, "some/path")
+        # then
+        self.assertEqual({"status": "ok"}, response)
+        self.assertEqual("Bearer new-token", self.mock_request.call_args[1]["auth"]._token)
+
+    def test_unauthorized_raw_response_should_be_retried_once(self):
+        # given
+        unauthorized = Response()
+        unauthorized.status_code = HttpStatus.CODE_UNAUTHORIZED
+        self.mock_request.side_effect = [unauthorized, {"access_token": "new-token", "expires_in": 600},
+                                         unauthorized]
+        # when
+        response = self.http_client.request(HttpMethod.GET, "some/path", raw_response=True)
+        # then
+        self.assertIs(unauthorized, response)
+        self.assertEqual(4, self.mock_request.call_count)
+
+    def test_unauthorized_file_upload_should_be_retried_with_rewound_file(self):
+        # given
+        upload = io.BytesIO(b"content")
+        uploaded = []
+
+        def request(*args, **kwargs):
+            if kwargs.get("files") is None:
+                return {"access_token": "new-token", "expires_in": 600}
+            uploaded.append(kwargs["files"]["file"][1].read())
+            if len(uploaded) == 1:
+                raise UnexpectedResponseError(HttpStatus.CODE_UNAUTHORIZED, "expired")
+            return {"status": "ok"}
+        self.mock_request.side_effect = request
+        # when
+        response = self.http_client.request(HttpMethod.POST, "some/path", files={"file": ("name", upload)})
+        # then
+        self.assertEqual({"status": "ok"}, response)
+        self.assertEqual([b"content", b"content"], uploaded)
+
+    def test_unauthorized_file_upload_should_not_be_retried_if_file_cant_be_rewound(self):
+        # given
+        upload = Mock(spec=["read", "seekable"])
+        upload.seekable.return_value = False
+        self.mock_request.side_effect = [UnexpectedResponseError(HttpStatus.CODE_UNAUTHORIZED, "expired")]
+        # then
+        self.assertRaises(UnexpectedResponseError, self.http_client.request, HttpMethod.POST, "some/path",
+                          files={"file": upload})
+        self.assertEqual(2, self.mock_request.call_count)
+
+    def test_other_errors_should_not_be_retried(self):
+        # given
+        self.mock_request.side_effect = [UnexpectedResponseError(HttpStatus.CODE_FORBIDDEN, "forbidden")]
+        # then
+        self.assertRaises(UnexpectedResponseError, self.http_client.request, HttpMethod.GET, "some/path")
+        self.assertEqual(2, self.mock_request.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,8 @@
 #
 
 import unittest
+from collections import OrderedDict
+from unittest.mock import patch
 
 from modules.http_client.client_auth.client_auth_http_basic import ClientAuthHttpBasic
 from modules.http_client.client_auth.client_auth_no_auth import ClientAuthNoAuth
@@ -35,7 +37,9 @@ class TestHttpClientFactory(MockHttpSession):
     URL = "api.test.platform.eu"
 
     def setUp(self):
-        HttpClientFactory._INSTANCES = {}
+        HttpClientFactory._INSTANCES = OrderedDict()
+        HttpClientFactory._STATISTICS = OrderedDict()
+        HttpClientFactory._ACQUIRED = {}
         self.mock_http_session()
         super().setUp()
 
@@ -98,6 +102,90 @@ class TestHttpClientFactory(MockHttpSession):
         self.assertNotEqual(client_first.url, client_second.url)
         self.assertEqual(2, len(HttpClientFactory._INSTANCES), "Invalid number of instances.")
 
+    def test_get_should_close_least_recently_used_client_above_limit(self):
+        # given
+        configurations = [self._get_configuration(HttpClientType.BROKER, "{}.url".format(i)) for i in range(3)]
+        with patch.object(HttpClientFactory, "MAX_INSTANCES", 2):
+            for configuration in configurations[:2]:
+                HttpClientFactory.get(configuration)
+            HttpClientFactory.get(configurations[0])
+            # when
+            with patch.object(HttpClient, "close") as mock_close:
+                HttpClientFactory.get(configurations[2])
+        # then
+        self.assertEqual([configurations[0], configurations[2]], list(HttpClientFactory._INSTANCES))
+        mock_close.assert_called_once_with()
+
+    def test_get_should_close_idle_clients(self):
+        # given
+        configuration = self._get_configuration(HttpClientType.BROKER, "first.url")
+        HttpClientFactory.get(configuration).statistics.last_used -= HttpClientFactory.MAX_IDLE_TIME + 1
+        # when
+        with patch.object(HttpClient, "close") as mock_close:
+            HttpClientFactory.get(self._get_configuration(HttpClientType.BROKER, "second.url"))
+        # then
+        self.assertNotIn(configuration, HttpClientFactory._INSTANCES)
+        mock_close.assert_called_once_with()
+
+    def test_get_should_not_close_clients_in_use(self):
+        # given
+        configurations = [self._get_configuration(HttpClientType.BROKER, "{}.url".format(i)) for i in range(3)]
+        with patch.object(HttpClientFactory, "MAX_INSTANCES", 1):
+            HttpClientFactory.acquire(configurations[0])
+            client_in_use = HttpClientFactory.get(configurations[0])
+            client_in_use.statistics.last_used -= HttpClientFactory.MAX_IDLE_TIME + 1
+            HttpClientFactory.get(configurations[1])
+            # when
+            with patch.object(HttpClient, "close") as mock_close:
+                HttpClientFactory.get(configurations[2])
+        # then
+        self.assertEqual([configurations[0], configurations[2]], list(HttpClientFactory._INSTANCES))
+        self.assertIs(client_in_use, HttpClientFactory.get(configurations[0]))
+        mock_close.assert_called_once_with()
+
+    def test_get_should_close_released_clients(self):
+        # given
+        configurations = [self._get_configuration(HttpClientType.BROKER, "{}.url".format(i)) for i in range(4)]
+        with patch.object(HttpClientFactory, "MAX_INSTANCES", 2):
+            HttpClientFactory.acquire(configurations[0])
+            HttpClientFactory.acquire(configurations[0])
+            for configuration in configurations[:3]:
+                HttpClientFactory.get(configuration)
+            HttpClientFactory.release(configurations[0])
+            self.assertEqual([configurations[0], configurations[2]], list(HttpClientFactory._INSTANCES))
+            # when
+            HttpClientFactory.release(configurations[0])
+            with patch.object(HttpClient, "close") as mock_close:
+                HttpClientFactory.get(configurations[3])
+        # then
+        self.assertEqual(configurations[2:], list(HttpClientFactory._INSTANCES))
+        self.assertEqual({}, HttpClientFactory._ACQUIRED)
+        mock_close.assert_called_once_with()
+
+    def test_statistics_of_evicted_clients_should_be_bounded(self):
+        # given
+        configurations = [self._get_configuration(HttpClientType.BROKER, "{}.url".format(i)) for i in range(4)]
+        # when
+        with patch.object(HttpClientFactory, "MAX_INSTANCES", 1), patch.object(HttpClientFactory, "MAX_STATISTICS", 2):
+            for configuration in configurations:
+                HttpClientFactory.get(configuration)
+        # then
+        self.assertEqual(configurations[2:], list(HttpClientFactory.statistics()))
+
+    def test_statistics_should_be_kept_after_eviction(self):
+        # given
+        configuration = self._get_configuration(HttpClientType.BROKER)
+        HttpClientFactory.get(configuration).statistics.record(0.5, bytes_sent=10, bytes_received=100)
+        HttpClientFactory.remove(configuration)
+        # when
+        client = HttpClientFactory.get(configuration)
+        client.statistics.record(1.5, bytes_sent=20, bytes_received=200, error=True)
+        # then
+        statistics = HttpClientFactory.statistics()[configuration]
+        self.assertIs(client.statistics, statistics)
+        self.assertEqual({"request_count": 2, "error_count": 1, "bytes_sent": 30, "bytes_received": 300,
+                          "total_time": 2.0, "mean_time": 1.0, "max_time": 1.5}, statistics.to_dict())
+
     def _assertHttpClientInstance(self, client_type, auth: ClientAuthBase):
         configuration = self._get_configuration(client_type)
         client = HttpClientFactory.get(configuration)
@@ -0,0 +1,120 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from modules.http_client.http_client_configuration import HttpClientConfiguration
+from modules.http_client.http_client_pool import HttpClientPool
+from modules.http_client.http_client_type import HttpClientType
+
+
+class TestHttpClientPool(unittest.TestCase):
+    """Unit: HttpClientPool."""
+
+    URL = "console.test.platform.eu"
+
+    def setUp(self):
+        HttpClientPool._CONFIGURATIONS = []
+        self.clients = {}
+        self.threads = set()
+        patcher = patch("modules.http_client.http_client_pool.HttpClientFactory")
+        self.mock_factory = patcher.start()
+        self.mock_factory.get.side_effect = self._get_client
+        self.addCleanup(patcher.stop)
+        self.addCleanup(HttpClientPool.stop_keepalive)
+
+    def _get_client(self, configuration):
+        self.threads.add(threading.current_thread().name)
+        if configuration not in self.clients:
+            self.clients[configuration] = MagicMock(auth=MagicMock(authenticated=True))
+        return self.clients[configuration]
+
+    def _configuration(self, username):
+        return HttpClientConfiguration(HttpClientType.CONSOLE, self.URL, username, "password")
+
+    def test_warm_up_should_return_clients_in_order(self):
+        # given
+        configurations = [self._configuration("user-{}".format(i)) for i in range(5)]
+        # when
+        clients = HttpClientPool.warm_up(configurations, max_workers=3)
+        # then
+        self.assertEqual([self.clients[c] for c in configurations], clients)
+        self.assertEqual(configurations, HttpClientPool._CONFIGURATIONS)
+        self.assertNotIn(threading.current_thread().name, self.threads)
+        self.assertEqual(configurations, [c[0][0] for c in self.mock_factory.acquire.call_args_list])
+
+    def test_checkout_should_log_in_client_with_expired_session(self):
+        # given
+        configuration = self._configuration("user")
+        client = HttpClientPool.warm_up([configuration])[0]
+        client.auth.authenticated = False
+        # when
+        checked_out = HttpClientPool.checkout(configuration)
+        # then
+        self.assertIs(client, checked_out)
+        client.auth.authenticate.assert_called_once_with()
+
+    def test_checkout_should_add_client_to_pool(self):
+        # given
+        configuration = self._configuration("user")
+        # when
+        client = HttpClientPool.checkout(configuration)
+        # then
+        self.assertIs(self.clients[configuration], client)
+        self.assertEqual([configuration], HttpClientPool._CONFIGURATIONS)
+
+    def test_remove_should_remove_client_from_pool_and_factory(self):
+        # given
+        configuration = self._configuration("user")
+        HttpClientPool.warm_up([configuration])
+        # when
+        HttpClientPool.remove(configuration)
+        # then
+        self.assertEqual([], HttpClientPool._CONFIGURATIONS)
+        self.mock_factory.release.assert_called_once_with(configuration)
+        self.mock_factory.remove.assert_called_once_with(configuration)
+
+    def test_keepalive_should_log_in_expired_clients_and_ping(self):
+        # given
+        configuration = self._configuration("user")
+        client = HttpClientPool.warm_up([configuration])[0]
+        client.auth.authenticated = False
+        pinged = threading.Event()
+        # when
+        HttpClientPool.start_keepalive(interval=0.01, ping=lambda c: pinged.set())
+        # then
+        self.assertTrue(pinged.wait(5))
+        HttpClientPool.stop_keepalive()
+        client.auth.authenticate.assert_called_with()
+
+    def test_keepalive_should_drop_clients_evicted_from_factory(self):
+        # given
+        configuration = self._configuration("user")
+        HttpClientPool.warm_up([configuration])
+        self.mock_factory.is_cached.return_value = False
+        self.mock_factory.get.reset_mock()
+        pinged = threading.Event()
+        # when
+        HttpClientPool.start_keepalive(interval=0.01, ping=lambda c: pinged.set())
+        time.sleep(0.1)
+        HttpClientPool.stop_keepalive()
+        # then
+        self.assertFalse(pinged.is_set())
+        self.assertFalse(self.mock_factory.get.called)
+        self.assertEqual([], HttpClientPool._CONFIGURATIONS)
+        self.mock_factory.release.assert_called_once_with(configuration)
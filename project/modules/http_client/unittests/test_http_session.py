@@ -65,6 +65,29 @@ class TestHttpSession(unittest.TestCase):
         # then
         self.assertRaises(UnexpectedResponseError, self.http_session.request, HttpMethod.GET, self.URL)
 
+    @patch("requests.Session.send")
+    def test_request_should_record_statistics(self, mock_session_send_call):
+        # given
+        response = Response()
+        response.status_code = HttpStatus.CODE_OK
+        response._content = b'{"status":"ok"}'
+        mock_session_send_call.return_value = response
+        # when
+        self.http_session.request(HttpMethod.POST, self.URL, body={"a": 1})
+        # then
+        statistics = self.http_session.statistics
+        self.assertEqual(1, statistics.request_count)
+        self.assertEqual(0, statistics.error_count)
+        self.assertEqual(len(b'{"a": 1}'), statistics.bytes_sent)
+        self.assertEqual(len(response.content), statistics.bytes_received)
+
+    @patch("requests.Session.send", side_effect=ConnectionError)
+    def test_request_should_record_failed_request(self, mock_session_send_call):
+        # then
+        self.assertRaises(ConnectionError, self.http_session.request, HttpMethod.GET, self.URL)
+        self.assertEqual(1, self.http_session.statistics.request_count)
+        self.assertEqual(1, self.http_session.statistics.error_count)
+
     def _create_http_session(self):
         self.http_session = HttpSession(
             self.USERNAME,
@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import csv
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from requests import Response
+
+from modules.constants.http_status import HttpStatus
+from modules.http_client.client_auth.http_method import HttpMethod
+from modules.http_client.client_auth.http_session import HttpSession
+from modules.http_client.request_timing import EndpointHistogramSink, RequestCollectorSink, RequestTiming, \
+    RequestTimingFileSink
+
+
+class TestRequestTiming(unittest.TestCase):
+    """Unit: RequestTiming."""
+
+    GUID = "0d6a9ad3-3f5c-4f4b-9a3c-0b0e2e1d4f11"
+
+    def _timing(self, url="http://api.test/v2/apps", total_time=1.0, label="CF: get apps"):
+        return RequestTiming(method="GET", url=url, endpoint=RequestTiming.endpoint_template(url), label=label,
+                             status=200, response_size=10, time_to_first_byte=total_time / 2, total_time=total_time,
+                             timestamp=1000.0)
+
+    def test_endpoint_template_should_replace_guids_and_ids(self):
+        url = "http://api.test/v2/apps/{}/instances/12?inline-relations-depth=1".format(self.GUID)
+        self.assertEqual("http://api.test/v2/apps/{guid}/instances/{id}", RequestTiming.endpoint_template(url))
+
+    def test_endpoint_template_should_keep_names_with_digits(self):
+        url = "http://api.test/v2/apps/app2/kafka2hdfs"
+        self.assertEqual(url, RequestTiming.endpoint_template(url))
+
+    def test_histogram_should_summarize_endpoints_slowest_first(self):
+        # given
+        histogram = EndpointHistogramSink()
+        for i in range(1, 101):
+            histogram(self._timing("http://api.test/v2/apps/{}".format(self.GUID), total_time=i / 100))
+        histogram(self._timing("http://api.test/v2/info", total_time=0.5))
+        # when
+        summary = histogram.summary()
+        # then
+        self.assertEqual(["http://api.test/v2/apps/{guid}", "http://api.test/v2/info"],
+                         [s["endpoint"] for s in summary])
+        self.assertEqual(100, summary[0]["count"])
+        self.assertEqual((0.5, 0.95, 0.99, 1.0), (summary[0]["p50"], summary[0]["p95"], summary[0]["p99"],
+                                                  summary[0]["max_time"]))
+
+    def test_collector_should_summarize_requests_sent_after_start(self):
+        # given
+        collector = RequestCollectorSink()
+        collector(self._timing())
+        collector.start()
+        collector(self._timing(total_time=1.0))
+        collector(self._timing(total_time=3.0))
+        # when
+        summary = collector.stop()
+        collector(self._timing())
+        # then
+        self.assertEqual([{"method": "GET", "endpoint": "http://api.test/v2/apps", "label": "CF: get apps",
+                           "count": 2, "total_time": 4.0, "max_time": 3.0}], summary)
+        self.assertEqual([], collector.stop())
+
+    def test_collector_should_ignore_requests_of_other_threads(self):
+        # given
+        collector = RequestCollectorSink()
+        collector.start()
+        collector(self._timing(total_time=1.0))
+        # when
+        thread = threading.Thread(target=collector, args=(self._timing(total_time=3.0),))
+        thread.start()
+        thread.join()
+        # then
+        self.assertEqual([1], [s["count"] for s in collector.stop()])
+
+    def test_file_sink_should_write_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "timing.csv")
+            sink = RequestTimingFileSink(path)
+            sink(self._timing())
+            sink.close()
+            with open(path) as f:
+                rows = list(csv.reader(f))
+        self.assertEqual(list(RequestTiming._fields), rows[0])
+        self.assertEqual(2, len(rows))
+
+    def test_file_sink_should_write_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "timing.json")
+            sink = RequestTimingFileSink(path)
+            sink(self._timing())
+            sink.close()
+            with open(path) as f:
+                timings = json.load(f)
+        self.assertEqual([self._timing()._asdict()], timings)
+
+    @patch("requests.Session.send")
+    def test_http_session_should_call_request_hooks(self, mock_session_send_call):
+        # given
+        response = Response()
+        response.status_code = HttpStatus.CODE_OK
+        response._content = b"{}"
+        mock_session_send_call.return_value = response
+        timings = []
+        HttpSession.add_request_hook(timings.append)
+        self.addCleanup(HttpSession.remove_request_hook, timings.append)
+        # when
+        HttpSession("username", "password").request(HttpMethod.GET, "http://api.test/v2/apps/{}".format(self.GUID),
+                                                    log_message="CF: get app")
+        # then
+        self.assertEqual(1, len(timings))
+        self.assertEqual(("GET", "http://api.test/v2/apps/{guid}", "CF: get app", 200, 2),
+                         (timings[0].method, timings[0].endpoint, timings[0].label, timings[0].status,
+                          timings[0].response_size))
@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from requests import Request, Session
+
+from modules.http_client.streaming_multipart_encoder import StreamingMultipartEncoder
+from modules.tap_logger import log_http_request
+
+
+class TestStreamingMultipartEncoder(unittest.TestCase):
+    """Unit: StreamingMultipartEncoder."""
+
+    FIELDS = {"title": "test title", "publicRequest": False}
+    FILE_CONTENT = b"a,b\n" + b"1,2\n" * 1000
+
+    def setUp(self):
+        file_descriptor, self.file_path = tempfile.mkstemp()
+        with os.fdopen(file_descriptor, "wb") as f:
+            f.write(self.FILE_CONTENT)
+        self.addCleanup(os.remove, self.file_path)
+        self.files = {"file": ("test.csv", self.file_path, "text/csv")}
+
+    def test_read_should_return_multipart_body(self):
+        # given
+        encoder = StreamingMultipartEncoder(fields=self.FIELDS, files=self.files)
+        # when
+        body = encoder.read()
+        # then
+        self.assertEqual(len(encoder), len(body))
+        self.assertIn(b'Content-Disposition: form-data; name="title"\r\n\r\ntest title\r\n', body)
+        self.assertIn(b'name="file"; filename="test.csv"\r\nContent-Type: text/csv\r\n\r\n' + self.FILE_CONTENT, body)
+        self.assertTrue(body.endswith("--{}--\r\n".format(encoder._boundary).encode()))
+        self.assertIn(encoder._boundary, encoder.content_type)
+
+    def test_read_in_chunks_should_report_progress_and_close_file(self):
+        # given
+        progress = []
+        encoder = StreamingMultipartEncoder(fields=self.FIELDS, files=self.files,
+                                            progress_callback=lambda sent, total: progress.append((sent, total)))
+        # when
+        chunks = []
+        chunk = encoder.read(100)
+        while chunk:
+            self.assertLessEqual(len(chunk), 100)
+            chunks.append(chunk)
+            chunk = encoder.read(100)
+        # then
+        self.assertEqual(encoder.read(), b"")
+        self.assertIsNone(encoder._file)
+        self.assertEqual(len(encoder), sum(len(c) for c in chunks))
+        self.assertEqual((len(encoder), len(encoder)), progress[-1])
+        self.assertEqual(len(chunks), len(progress))
+        self.assertEqual(len(encoder), encoder.bytes_sent)
+
+    def test_close_should_close_streamed_file(self):
+        # given
+        with StreamingMultipartEncoder(files=self.files) as encoder:
+            encoder.read(200)
+            opened_file = encoder._file
+            self.assertFalse(opened_file.closed)
+        # then
+        self.assertTrue(opened_file.closed)
+
+    @patch("modules.tap_logger.get_logger")
+    def test_prepared_request_should_stream_body_without_logging_it(self, mock_get_logger):
+        # given
+        encoder = StreamingMultipartEncoder(fields=self.FIELDS, files=self.files)
+        request = Request(method="POST", url="http://some/path", headers={"Content-Type": encoder.content_type},
+                          data=encoder)
+        # when
+        prepared_request = Session().prepare_request(request)
+        log_http_request(prepared_request, "username", description="upload", data=encoder)
+        # then
+        self.assertIs(encoder, prepared_request.body)
+        self.assertEqual(str(len(encoder)), prepared_request.headers["Content-Length"])
+        logged_message = mock_get_logger.return_value.debug.call_args[0][0]
+        self.assertIn("[streamed body, {} bytes]".format(len(encoder)), logged_message)
+        self.assertEqual(0, encoder.bytes_sent)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import re
+import time
+import uuid
+
+import websockets
+
+from modules.constants import LoggerType
+from modules.tap_logger import get_logger
+from modules.websocket_client import WebsocketClient
+from ..gatling_runner.simulation.simulation_result import SimulationResult
+from .load_generator_parameters import LoadGeneratorParameters
+from .load_generator_result import LoadGeneratorResultBuilder
+
+logger = get_logger(LoggerType.LOAD_GENERATOR)
+
+
+class LoadGenerator(object):
+    """
+    Websocket load generator for ws2kafka based ingestion pipelines.
+    Each message starts with an id, so that messages reported later by kafka2hdfs or hbase can be correlated
+    with the time they were sent.
+    """
+
+    LOG_CONNECT = "Opening {} websocket connections to {}"
+    LOG_START = "Sending {} messages of {} bytes, ramp-up {}s, steady state {}s at {} msg/s"
+    LOG_DELIVERY = "Delivered {} of {} messages"
+    MESSAGE_ID_FORMAT = "{}-{:010d}"
+    PADDING_CHARACTER = "x"
+
+    def __init__(self, parameters: LoadGeneratorParameters, certificate_requirement=None):
+        self._parameters = parameters
+        self._certificate_requirement = certificate_requirement
+        self._message_prefix = "load-{}".format(uuid.uuid4().hex[:8])
+        self._message_id_pattern = re.compile(r"{}-\d{{10}}".format(re.escape(self._message_prefix)))
+        min_message_size = len(self._message(0, size=0))
+        if parameters.message_size < min_message_size:
+            raise LoadGeneratorMessageSizeException(parameters.message_size, min_message_size)
+        self._send_times = {}  # message id -> send timestamp
+        self._send_samples = []
+        self._delivery_times = {}  # message id -> timestamp of first delivery report
+        self._elapsed_time = 0
+
+    @property
+    def sent_message_ids(self):
+        """Ids of messages sent successfully."""
+        return set(self._send_times.keys())
+
+    @property
+    def delivered_message_ids(self):
+        """Ids of sent messages which were reported as delivered."""
+        return set(self._delivery_times.keys())
+
+    def run(self) -> SimulationResult:
+        """Send messages according to parameters and return websocket send results."""
+        clients = self._connect()
+        logger.info(self.LOG_START.format(self._parameters.message_count, self._parameters.message_size,
+                                          self._parameters.ramp_up, self._parameters.duration,
+                                          self._parameters.rate))
+        schedule = list(self._parameters.send_schedule())
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
+        try:
+            loop.run_until_complete(asyncio.gather(*[
+                self._send_messages(client, schedule[i::len(clients)], start_time)
+                for i, client in enumerate(clients)
+            ]))
+        finally:
+            self._elapsed_time = loop.time() - start_time
+            for client in clients:
+                client.close()
+        return self.send_result()
+
+    def send_result(self) -> SimulationResult:
+        """Return results of sending messages through websockets."""
+        return LoadGeneratorResultBuilder(self._send_samples, self._elapsed_time).build()
+
+    def record_delivered(self, messages, delivery_time=None):
+        """
+        Mark messages found in iterable of reported messages (e.g. hdfs file lines or hbase rows) as delivered.
+        Only the first report of each message is taken into account.
+        """
+        delivery_time = time.time() if delivery_time is None else delivery_time
+        for message in messages:
+            for message_id in self._message_id_pattern.findall(message):
+                if message_id in self._send_times and message_id not in self._delivery_times:
+                    self._delivery_times[message_id] = delivery_time
+
+    def wait_for_delivery(self, fetch_messages, timeout=300, interval=5) -> SimulationResult:
+        """
+        Call fetch_messages every interval seconds until all sent messages are reported or timeout is reached.
+        fetch_messages -- callable returning iterable of messages stored by the pipeline, e.g. for ws2kafka2hbase
+        pipeline which reverses messages: lambda: [row[::-1] for row in hbase_client.get_first_rows_from_table(t)]
+        Latency is measured when message is first seen, so it is rounded up to the polling interval.
+        """
+        deadline = time.time() + timeout
+        while True:
+            self.record_delivered(fetch_messages())
+            logger.info(self.LOG_DELIVERY.format(len(self._delivery_times), len(self._send_times)))
+            if len(self._delivery_times) == len(self._send_times) or time.time() > deadline:
+                break
+            time.sleep(interval)
+        return self.end_to_end_result()
+
+    def end_to_end_result(self) -> SimulationResult:
+        """Return end-to-end latency results, messages which were not delivered are reported as failed."""
+        samples = []
+        for message_id, send_time in self._send_times.items():
+            delivery_time = self._delivery_times.get(message_id)
+            if delivery_time is None:
+                samples.append((None, False))
+            else:
+                samples.append(((delivery_time - send_time) * 1000, True))
+        return LoadGeneratorResultBuilder(samples, self._elapsed_time).build()
+
+    def _connect(self):
+        """Open websocket connections."""
+        logger.info(self.LOG_CONNECT.format(self._parameters.connection_count, self._parameters.url))
+        return [WebsocketClient(self._parameters.url, certificate_requirement=self._certificate_requirement)
+                for _ in range(self._parameters.connection_count)]
+
+    def _message(self, sequence_number, size=None):
+        """Return message with given sequence number padded to configured message size."""
+        size = self._parameters.message_size if size is None else size
+        message = "{} ".format(self.MESSAGE_ID_FORMAT.format(self._message_prefix, sequence_number))
+        return message.ljust(size, self.PADDING_CHARACTER)
+
+    @asyncio.coroutine
+    def _send_messages(self, client, schedule, start_time):
+        """Send scheduled messages through one websocket connection."""
+        loop = asyncio.get_event_loop()
+        for sequence_number, offset in schedule:
+            delay = start_time + offset - loop.time()
+            if delay > 0:
+                yield from asyncio.sleep(delay)
+            message_id = self.MESSAGE_ID_FORMAT.format(self._message_prefix, sequence_number)
+            send_time = time.time()
+            try:
+                yield from client.send_async(self._message(sequence_number))
+            except (asyncio.TimeoutError, websockets.exceptions.ConnectionClosed) as e:
+                logger.warning("Failed to send message {}: {}".format(message_id, e))
+                self._send_samples.append(((time.time() - send_time) * 1000, False))
+            else:
+                self._send_times[message_id] = send_time
+                self._send_samples.append(((time.time() - send_time) * 1000, True))
+
+
+class LoadGeneratorMessageSizeException(Exception):
+    def __init__(self, message_size, min_message_size):
+        super().__init__("Message size {} is smaller than message id, use at least {}.".format(message_size,
+                                                                                               min_message_size))
@@ -0,0 +1,106 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import math
+
+
+class LoadGeneratorParameters(object):
+    """Ingestion load generator - run parameters."""
+
+    def __init__(self, url: str, connection_count=1, message_size=64, rate=10, ramp_up=0, duration=60):
+        self._validate("url", str, url)
+        self._validate("connection_count", int, connection_count)
+        self._validate("message_size", int, message_size)
+        self._validate("rate", (int, float), rate)
+        self._validate("duration", (int, float), duration)
+        if not isinstance(ramp_up, (int, float)) or ramp_up < 0:
+            raise LoadGeneratorParametersInvalidPropertyTypeException("ramp_up")
+        self.__url = url
+        self.__connection_count = connection_count
+        self.__message_size = message_size
+        self.__rate = rate
+        self.__ramp_up = ramp_up
+        self.__duration = duration
+
+    @property
+    def url(self):
+        """Websocket url of ws2kafka application, including kafka topic."""
+        return self.__url
+
+    @property
+    def connection_count(self):
+        """Number of concurrent websocket connections."""
+        return self.__connection_count
+
+    @property
+    def message_size(self):
+        """Size of each generated message in bytes."""
+        return self.__message_size
+
+    @property
+    def rate(self):
+        """Target number of messages sent per second (summed over all connections) in steady state."""
+        return self.__rate
+
+    @property
+    def ramp_up(self):
+        """How many seconds it takes to linearly increase the sending rate from zero to target rate."""
+        return self.__ramp_up
+
+    @property
+    def duration(self):
+        """How many seconds to send messages at target rate after ramp-up."""
+        return self.__duration
+
+    @property
+    def ramp_up_message_count(self):
+        """Number of messages sent during ramp-up phase."""
+        return int(self.rate * self.ramp_up / 2)
+
+    @property
+    def message_count(self):
+        """Number of messages sent during whole run."""
+        return self.ramp_up_message_count + int(self.rate * self.duration)
+
+    def send_schedule(self):
+        """
+        Yield tuples of message sequence number and time offset (in seconds, counted from start of the run)
+        at which the message should be sent.
+        During ramp-up, rate grows linearly, so n-th message is sent at sqrt(2 * ramp_up * n / rate).
+        """
+        ramp_up_message_count = self.ramp_up_message_count
+        for sequence_number in range(ramp_up_message_count):
+            yield sequence_number, math.sqrt(2 * self.ramp_up * sequence_number / self.rate)
+        for n in range(self.message_count - ramp_up_message_count):
+            yield ramp_up_message_count + n, self.ramp_up + n / self.rate
+
+    @staticmethod
+    def _validate(property_name, property_type, property_value):
+        """Validate if given property has valid type and value."""
+        if not property_value:
+            raise LoadGeneratorParametersEmptyPropertyException(property_name)
+        if not isinstance(property_value, property_type):
+            raise LoadGeneratorParametersInvalidPropertyTypeException(property_name)
+
+
+class LoadGeneratorParametersEmptyPropertyException(Exception):
+    def __init__(self, message=None):
+        super().__init__("Property '{}' can not be empty.".format(message))
+
+
+class LoadGeneratorParametersInvalidPropertyTypeException(Exception):
+    def __init__(self, message=None):
+        super().__init__("Property '{}' has invalid type.".format(message))
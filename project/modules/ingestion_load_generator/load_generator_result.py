@@ -0,0 +1,105 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import math
+
+from ..gatling_runner.simulation.simulation_result import SimulationResult
+from ..gatling_runner.simulation.simulation_result_group import SimulationResultGroup
+from ..gatling_runner.simulation.simulation_result_execution import SimulationResultExecution
+
+
+class LoadGeneratorResultBuilder(object):
+    """Build gatling-like simulation results from load generator samples."""
+
+    PERCENTILES = (50, 75, 95, 99)
+    FAST_RESPONSE_TIME = 800  # in milliseconds
+    SLOW_RESPONSE_TIME = 1200  # in milliseconds
+
+    def __init__(self, samples: list, elapsed_time: float):
+        """
+        samples -- list of tuples (response time in milliseconds, ok), response time can be None for failed samples
+        elapsed_time -- duration of the run in seconds, used to compute throughput
+        """
+        self._samples = samples
+        self._elapsed_time = elapsed_time
+
+    def build(self) -> SimulationResult:
+        """Return SimulationResult representation of collected samples."""
+        total = [t for t, _ in self._samples if t is not None]
+        ok = [t for t, is_ok in self._samples if is_ok and t is not None]
+        ko = [t for t, is_ok in self._samples if not is_ok and t is not None]
+        ok_count = sum(1 for _, is_ok in self._samples if is_ok)
+        ko_count = len(self._samples) - ok_count
+        percentiles = [self._execution(total, ok, ko, lambda times, p=p: self._percentile(times, p))
+                       for p in self.PERCENTILES]
+        return SimulationResult(
+            number_of_requests=SimulationResultExecution(total=len(self._samples), ok=ok_count, ko=ko_count),
+            min_response_time=self._execution(total, ok, ko, lambda times: min(times, default=0)),
+            max_response_time=self._execution(total, ok, ko, lambda times: max(times, default=0)),
+            mean_response_time=self._execution(total, ok, ko, self._mean),
+            standard_deviation=self._execution(total, ok, ko, self._standard_deviation),
+            percentiles1=percentiles[0],
+            percentiles2=percentiles[1],
+            percentiles3=percentiles[2],
+            percentiles4=percentiles[3],
+            group1=self._group("t < {} ms".format(self.FAST_RESPONSE_TIME),
+                               sum(1 for t in ok if t < self.FAST_RESPONSE_TIME)),
+            group2=self._group("{} ms < t < {} ms".format(self.FAST_RESPONSE_TIME, self.SLOW_RESPONSE_TIME),
+                               sum(1 for t in ok if self.FAST_RESPONSE_TIME <= t < self.SLOW_RESPONSE_TIME)),
+            group3=self._group("t > {} ms".format(self.SLOW_RESPONSE_TIME),
+                               sum(1 for t in ok if t >= self.SLOW_RESPONSE_TIME)),
+            group4=self._group("failed", ko_count),
+            mean_number_of_requests_per_second=SimulationResultExecution(
+                total=self._per_second(len(self._samples)),
+                ok=self._per_second(ok_count),
+                ko=self._per_second(ko_count)
+            )
+        )
+
+    @staticmethod
+    def _execution(total, ok, ko, statistic):
+        """Return SimulationResultExecution with statistic computed for all, ok and ko response times."""
+        return SimulationResultExecution(total=int(round(statistic(total))), ok=int(round(statistic(ok))),
+                                         ko=int(round(statistic(ko))))
+
+    def _group(self, name, count):
+        """Return SimulationResultGroup with percentage of all samples."""
+        percentage = int(round(count * 100 / len(self._samples))) if self._samples else 0
+        return SimulationResultGroup(name=name, count=count, percentage=percentage)
+
+    def _per_second(self, count):
+        """Return count divided by elapsed time."""
+        return count / self._elapsed_time if self._elapsed_time > 0 else 0
+
+    @staticmethod
+    def _mean(times):
+        return sum(times) / len(times) if times else 0
+
+    @classmethod
+    def _standard_deviation(cls, times):
+        if not times:
+            return 0
+        mean = cls._mean(times)
+        return math.sqrt(sum((t - mean) ** 2 for t in times) / len(times))
+
+    @staticmethod
+    def _percentile(times, percentile):
+        """Return percentile of response times using nearest-rank method."""
+        if not times:
+            return 0
+        ordered = sorted(times)
+        rank = max(int(math.ceil(percentile / 100 * len(ordered))), 1)
+        return ordered[rank - 1]
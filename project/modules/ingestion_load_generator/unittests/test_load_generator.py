@@ -0,0 +1,46 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from modules.ingestion_load_generator.load_generator import LoadGenerator, LoadGeneratorMessageSizeException
+from modules.ingestion_load_generator.load_generator_parameters import LoadGeneratorParameters
+
+
+class TestLoadGenerator(unittest.TestCase):
+    """Unit: LoadGenerator."""
+
+    URL = "ws://ws2kafka.test.platform.org/test_topic"
+
+    def test_message_should_have_configured_size(self):
+        # given
+        generator = LoadGenerator(LoadGeneratorParameters(url=self.URL, message_size=64))
+
+        # when
+        messages = [generator._message(sequence_number) for sequence_number in (0, 123, 9999999999)]
+
+        # then
+        self.assertEqual([64, 64, 64], [len(message.encode()) for message in messages])
+        self.assertEqual(generator._message_id_pattern.findall(messages[1]),
+                         [LoadGenerator.MESSAGE_ID_FORMAT.format(generator._message_prefix, 123)])
+
+    def test_init_should_raise_exception_for_message_size_smaller_than_message_id(self):
+        # given
+        parameters = LoadGeneratorParameters(url=self.URL, message_size=10)
+
+        # when
+        self.assertRaisesRegex(LoadGeneratorMessageSizeException, "Message size 10 is smaller than message id",
+                               LoadGenerator, parameters)
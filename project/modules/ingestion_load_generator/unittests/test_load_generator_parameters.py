@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from modules.ingestion_load_generator.load_generator_parameters import LoadGeneratorParameters, \
+    LoadGeneratorParametersEmptyPropertyException, LoadGeneratorParametersInvalidPropertyTypeException
+
+
+class TestLoadGeneratorParameters(unittest.TestCase):
+    """Unit: LoadGeneratorParameters."""
+
+    URL = "ws://ws2kafka.test.platform.org/test_topic"
+
+    def test_init_should_raise_exception_for_empty_url(self):
+        # when
+        self.assertRaisesRegex(LoadGeneratorParametersEmptyPropertyException, "Property 'url' can not be empty.",
+                               LoadGeneratorParameters, url="")
+
+    def test_init_should_raise_exception_for_invalid_connection_count(self):
+        # when
+        self.assertRaisesRegex(LoadGeneratorParametersInvalidPropertyTypeException,
+                               "Property 'connection_count' has invalid type.",
+                               LoadGeneratorParameters, url=self.URL, connection_count="2")
+
+    def test_init_should_raise_exception_for_negative_ramp_up(self):
+        # when
+        self.assertRaisesRegex(LoadGeneratorParametersInvalidPropertyTypeException,
+                               "Property 'ramp_up' has invalid type.",
+                               LoadGeneratorParameters, url=self.URL, ramp_up=-1)
+
+    def test_message_count_should_include_ramp_up(self):
+        # given
+        parameters = LoadGeneratorParameters(url=self.URL, rate=10, ramp_up=4, duration=3)
+
+        # then
+        self.assertEqual(20, parameters.ramp_up_message_count)
+        self.assertEqual(50, parameters.message_count)
+
+    def test_send_schedule_should_keep_target_rate_after_ramp_up(self):
+        # given
+        parameters = LoadGeneratorParameters(url=self.URL, rate=10, ramp_up=4, duration=3)
+
+        # when
+        schedule = list(parameters.send_schedule())
+
+        # then
+        self.assertEqual(list(range(50)), [sequence_number for sequence_number, _ in schedule])
+        offsets = [offset for _, offset in schedule]
+        self.assertEqual(sorted(offsets), offsets)
+        self.assertEqual(0, offsets[0])
+        self.assertLess(offsets[19], 4)
+        self.assertAlmostEqual(4, offsets[20])
+        self.assertAlmostEqual(0.1, offsets[21] - offsets[20])
+        self.assertAlmostEqual(4 + 2.9, offsets[-1])
+
+    def test_send_schedule_without_ramp_up(self):
+        # given
+        parameters = LoadGeneratorParameters(url=self.URL, rate=2, duration=2)
+
+        # when
+        schedule = list(parameters.send_schedule())
+
+        # then
+        self.assertEqual([(0, 0), (1, 0.5), (2, 1), (3, 1.5)], schedule)
+
+
+if __name__ == '__main__':
+    unittest.main()
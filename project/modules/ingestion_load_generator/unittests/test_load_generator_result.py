@@ -0,0 +1,59 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from modules.ingestion_load_generator.load_generator_result import LoadGeneratorResultBuilder
+
+
+class TestLoadGeneratorResultBuilder(unittest.TestCase):
+    """Unit: LoadGeneratorResultBuilder."""
+
+    def test_build_should_return_result_in_gatling_format(self):
+        # given
+        samples = [(100, True), (200, True), (300, True), (900, True), (1500, True), (50, False), (None, False)]
+
+        # when
+        result = LoadGeneratorResultBuilder(samples, elapsed_time=7).build()
+
+        # then
+        self.assertEqual((7, 5, 2), (result.number_of_requests.total, result.number_of_requests.ok,
+                                     result.number_of_requests.ko))
+        self.assertEqual((50, 100, 50), (result.min_response_time.total, result.min_response_time.ok,
+                                         result.min_response_time.ko))
+        self.assertEqual(1500, result.max_response_time.ok)
+        self.assertEqual(600, result.mean_response_time.ok)
+        self.assertEqual(300, result.percentiles1.ok)
+        self.assertEqual(1500, result.percentiles4.ok)
+        fast_requests = result.number_of_fast_requests
+        self.assertEqual(("t < 800 ms", 3, 43), (fast_requests.name, fast_requests.count, fast_requests.percentage))
+        self.assertEqual(1, result.number_of_average_requests.count)
+        self.assertEqual(1, result.number_of_slow_requests.count)
+        self.assertEqual(("failed", 2), (result.number_of_failed_requests.name, result.number_of_failed_requests.count))
+        self.assertEqual(1, result.mean_number_of_requests_per_second.total)
+
+    def test_build_should_handle_no_samples(self):
+        # when
+        result = LoadGeneratorResultBuilder([], elapsed_time=0).build()
+
+        # then
+        self.assertEqual(0, result.number_of_requests.total)
+        self.assertEqual(0, result.number_of_fast_requests.percentage)
+        self.assertEqual(0, result.mean_number_of_requests_per_second.total)
+
+
+if __name__ == '__main__':
+    unittest.main()
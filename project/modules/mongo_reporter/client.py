@@ -15,7 +15,7 @@
 #
 
 from bson import ObjectId
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument
 
 from modules.tap_logger import get_logger
 
@@ -39,3 +39,26 @@ class DBClient(object):
         data_filter = {"_id": document_id}
         self.database[collection_name].replace_one(data_filter, new_document)
         logger.debug("Updated document with id {}".format(collection_name, document_id))
+
+    def find(self, collection_name: str, data_filter: dict, fields=None, sort=None):
+        """Return cursor over documents matching the filter, with only given fields if specified."""
+        return self.database[collection_name].find(data_filter, projection=fields, sort=sort)
+
+    def update(self, collection_name: str, document_id: ObjectId, update: dict, upsert=False) -> dict:
+        """Apply update operators atomically, so that the document can be updated by many processes at once."""
+        document = self.find_and_update(collection_name, {"_id": document_id}, update, upsert=upsert)
+        logger.debug("Updated document with id {}".format(document_id))
+        return document
+
+    def find_and_update(self, collection_name: str, data_filter: dict, update: dict, sort=None, upsert=False):
+        """Atomically update first document matching the filter and return it updated, None if there is none."""
+        return self.database[collection_name].find_one_and_update(data_filter, update, sort=sort, upsert=upsert,
+                                                                  return_document=ReturnDocument.AFTER)
+
+    def create_index(self, collection_name: str, keys: list):
+        """Create index on keys (list of (field, direction) tuples), nothing is done if it already exists."""
+        return self.database[collection_name].create_index(keys)
+
+    def delete(self, collection_name: str, document_id: ObjectId):
+        self.database[collection_name].delete_one({"_id": document_id})
+        logger.debug("Deleted document with id {}".format(document_id))
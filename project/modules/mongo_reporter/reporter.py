@@ -18,6 +18,7 @@ from datetime import datetime
 import socket
 
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
 
 from .client import DBClient
 
@@ -36,11 +37,10 @@ class MongoReporter(object):
     def __new__(cls, mongo_uri, run_id=None):
         if cls._instance is None:
             cls._instance = object.__new__(cls)
-            if run_id is not None:
-                run_id = ObjectId(run_id)
+            # run document is shared by parallel test processes, which all get the same run_id
+            run_id = ObjectId() if run_id is None else ObjectId(run_id)
             cls._instance._db_client = DBClient(uri=mongo_uri)
             cls._instance._run_id = run_id
-            cls._instance._test_counter = 0
             cls._instance._mongo_run_document = {
                 "end_date": None,
                 "environment": None,
@@ -48,6 +48,7 @@ class MongoReporter(object):
                 "finished": False,
                 "log": "",
                 "platform_components": [],
+                "collection_time": None,
                 "result": {cls.PASS: 0, cls.FAIL: 0, cls.SKIPPED: 0},
                 "start_date": None,
                 "started_by": None,
@@ -57,8 +58,10 @@ class MongoReporter(object):
             }
         return cls._instance
 
-    def on_run_start(self, environment, environment_version, platform_components, tests_to_run_count):
+    def on_run_start(self, environment, environment_version, platform_components, tests_to_run_count,
+                     collection_time=None):
         mongo_run_document = {
+            "collection_time": collection_time,
             "environment": environment,
             "environment_version": environment_version,
             "platform_components": platform_components,
@@ -66,31 +69,41 @@ class MongoReporter(object):
             "started_by": socket.gethostname(),
             "total_test_count": tests_to_run_count
         }
-        self._mongo_run_document.update(mongo_run_document)
-        self._save_test_run()
+        defaults = {k: v for k, v in self._mongo_run_document.items() if k not in mongo_run_document}
+        self._update_test_run({"$set": mongo_run_document, "$setOnInsert": defaults})
 
     def on_run_end(self):
         mongo_run_document = {
             "end_date": datetime.now().isoformat(),
             "finished": True
         }
-        self._mongo_run_document.update(mongo_run_document)
-        self._save_test_run()
+        self._update_test_run({"$set": mongo_run_document})
 
     def log_report(self, report, item):
         name = item.obj.__doc__.strip() if item.obj.__doc__ else report.nodeid
-        if report.when == "call":
-            self._on_test_end(
+        if report.when == "setup" and report.passed:
+            item.setup_duration = report.duration  # saved with test result, used to predict duration of test
+        elif report.when == "call":
+            item.test_result_id = self._on_test_end(
                 components=self._marker_args_from_item(item, "components"),
                 defects=self._marker_args_from_item(item, "bugs"),
                 duration=report.duration,
                 log="",
                 name=name,
+                nodeid=report.nodeid,
+                setup_duration=getattr(item, "setup_duration", None),
                 priority=self._priority_from_report(report),
                 stacktrace=self._stacktrace_from_report(report),
                 status=self.test_status_from_report(report),
-                tags=report.keywords
+                tags=report.keywords,
+                http_requests=getattr(item, "http_requests", None),
+                resource_usage=getattr(item, "resource_usage", None)
             )
+        elif report.when == "teardown" and report.passed:
+            teardown_usage = getattr(item, "resource_usage", {}).get("teardown")
+            test_result_id = getattr(item, "test_result_id", None)
+            if teardown_usage is not None and test_result_id is not None:
+                self._on_test_teardown(test_result_id=test_result_id, teardown_usage=teardown_usage)
         elif report.failed:
             self._on_fixture_error(
                 log="",
@@ -129,12 +142,16 @@ class MongoReporter(object):
         return test_status
 
     def _on_test_end(self, components: tuple, defects: tuple, duration: float, log: str, name: str, priority: str,
-                     stacktrace: str, status: str, tags: tuple):
+                     stacktrace: str, status: str, tags: tuple, http_requests=None, nodeid=None,
+                     setup_duration=None, resource_usage=None):
+        run_document = self._update_run_status(test_status=status)
         mongo_test_document = {
             "run_id": self._run_id,
             "name": name,
+            "nodeid": nodeid,
             "duration": duration,
-            "order": self._test_counter,
+            "setup_duration": setup_duration,
+            "order": run_document["test_count"] - 1,
             "priority": priority,
             "components": ", ".join(components),
             "defects": ", ".join(defects),
@@ -142,10 +159,15 @@ class MongoReporter(object):
             "status": status,
             "stacktrace": stacktrace,
             "log": log,
+            "http_requests": http_requests or [],
+            "resource_usage": resource_usage or {},
         }
-        self._db_client.insert(collection_name=self._test_result_collection_name, document=mongo_test_document)
-        self._update_run_status(test_status=status)
-        self._test_counter += 1
+        return self._db_client.insert(collection_name=self._test_result_collection_name, document=mongo_test_document)
+
+    def _on_test_teardown(self, test_result_id, teardown_usage: dict):
+        """Teardown runs after the test result is saved, so its resource usage is added to the saved document."""
+        self._db_client.update(collection_name=self._test_result_collection_name, document_id=test_result_id,
+                               update={"$set": {"resource_usage.teardown": teardown_usage}})
 
     def _on_fixture_error(self, name: str, stacktrace: str, log: str):
         fixture_mongo_document = {
@@ -158,17 +180,68 @@ class MongoReporter(object):
         self._db_client.insert(collection_name=self._test_result_collection_name, document=fixture_mongo_document)
 
     def _update_run_status(self, test_status, increment_test_count=True):
-        if self._mongo_run_document["status"] == self.PASS and test_status == self.FAIL:
-            self._mongo_run_document["status"] = self.FAIL
+        """Update run status with atomic operators, as tests can be reported by many processes at once."""
+        update = {}
+        if test_status == self.FAIL:
+            update["$set"] = {"status": self.FAIL}
         if increment_test_count:
-            self._mongo_run_document["test_count"] += 1
-            self._mongo_run_document["result"][test_status] += 1
-        self._save_test_run()
-
-    def _save_test_run(self):
-        if self._run_id is None:
-            self._run_id = self._db_client.insert(collection_name=self._test_run_collection_name,
-                                                  document=self._mongo_run_document)
-        else:
-            self._db_client.replace(collection_name=self._test_run_collection_name, document_id=self._run_id,
-                                    new_document=self._mongo_run_document)
+            update["$inc"] = {"test_count": 1, "result.{}".format(test_status): 1}
+        return self._update_test_run(update)
+
+    def _update_test_run(self, update):
+        return self._db_client.update(collection_name=self._test_run_collection_name, document_id=self._run_id,
+                                      update=update, upsert=True)
+
+
+class DurationHistory(object):
+    """Durations of tests in previous runs, read from test results saved by MongoReporter."""
+
+    INDEX = [("nodeid", ASCENDING), ("_id", DESCENDING)]
+    QUERY_CHUNK_SIZE = 500
+
+    def __init__(self, mongo_uri, history_size):
+        self._db_client = DBClient(uri=mongo_uri)
+        self._db_client.create_index(MongoReporter._test_result_collection_name, self.INDEX)
+        self._history_size = history_size
+
+    def get(self, nodeids) -> dict:
+        """
+        Return dict nodeid -> durations (including setup) of the latest results of the test, latest first.
+        Histories are read with one query per QUERY_CHUNK_SIZE nodeids, sorted with the (nodeid, _id) index.
+        """
+        nodeids = sorted(set(nodeids))
+        durations = {}
+        for start in range(0, len(nodeids), self.QUERY_CHUNK_SIZE):
+            chunk = nodeids[start:start + self.QUERY_CHUNK_SIZE]
+            documents = self._db_client.find(collection_name=MongoReporter._test_result_collection_name,
+                                             data_filter={"nodeid": {"$in": chunk}, "duration": {"$ne": None}},
+                                             fields=["nodeid", "duration", "setup_duration"], sort=self.INDEX)
+            for document in documents:
+                samples = durations.setdefault(document["nodeid"], [])
+                if len(samples) < self._history_size:
+                    samples.append(document["duration"] + (document.get("setup_duration") or 0))
+        return durations
+
+
+class PlatformComponentsHistory(object):
+    """Platform component versions saved with previous runs by MongoReporter."""
+
+    def __init__(self, mongo_uri):
+        self._db_client = DBClient(uri=mongo_uri)
+
+    def get_previous(self, environment) -> tuple:
+        """
+        Return id of the latest finished and passed run on the environment which saved platform component versions,
+        and dict component name -> version from that run. Return (None, None) if there is no such run.
+        Failed runs are skipped, so that tests of a component which failed after it changed are selected again until
+        they pass.
+        """
+        documents = self._db_client.find(collection_name=MongoReporter._test_run_collection_name,
+                                         data_filter={"environment": environment, "finished": True,
+                                                      "status": MongoReporter.PASS,
+                                                      "platform_components": {"$ne": []}},
+                                         fields=["platform_components"], sort=[("_id", DESCENDING)])
+        document = next(iter(documents.limit(1)), None)
+        if document is None:
+            return None, None
+        return document["_id"], {c["name"]: c["version"] for c in document["platform_components"]}
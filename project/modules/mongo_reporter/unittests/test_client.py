@@ -54,6 +54,18 @@ class TestMongoClient:
         test_document.update({"_id": document_id})
         assert test_document == documents[0]
 
+    def test_update(self):
+        db_client = client.DBClient(uri=self.uri)
+        document_id = db_client.insert(collection_name=self.test_collection_name, document=self.test_document.copy())
+        document = db_client.update(collection_name=self.test_collection_name, document_id=document_id,
+                                    update={"$inc": {"int": 2}, "$set": {"bool": False}})
+        assert document["int"] == 3
+        assert document["bool"] is False
 
-
-
+    def test_update_upsert(self):
+        db_client = client.DBClient(uri=self.uri)
+        document_id = ObjectId()
+        db_client.update(collection_name=self.test_collection_name, document_id=document_id,
+                         update={"$inc": {"int": 1}}, upsert=True)
+        documents = list(db_client.database[self.test_collection_name].find({}))
+        assert documents == [{"_id": document_id, "int": 1}]
@@ -122,7 +122,8 @@ class TestReporter(TestCase):
             expected_run_document["environment"],
             expected_run_document["environment_version"],
             expected_run_document["platform_components"],
-            expected_run_document["total_test_count"]
+            expected_run_document["total_test_count"],
+            expected_run_document["collection_time"]
         )
         return expected_run_document
 
@@ -191,12 +192,50 @@ class TestReporter(TestCase):
         )
         self.assertTestDocument(result_documents[0], expected_document)
 
+    def test_reporter_adds_teardown_resource_usage_to_test_result(self):
+        # given
+        self.start_run()
+        call_usage, teardown_usage = {"wall_time": 1.5}, {"wall_time": 0.5}
+        item = mock.Mock(obj=MockPassingItem.obj, get_marker=MockPassingItem.get_marker,
+                         resource_usage={"call": call_usage}, http_requests=None, setup_duration=None)
+        self.mongo_reporter.log_report(MockPassingReport, item)
+        teardown_report = mock.Mock(when="teardown", passed=True, failed=False, nodeid=MockPassingReport.nodeid)
+        item.resource_usage["teardown"] = teardown_usage
+        # when
+        self.mongo_reporter.log_report(teardown_report, item)
+        # then
+        result_documents = self.get_result_documents()
+        self.assertEqual(len(result_documents), 1)
+        self.assertEqual(result_documents[0]["resource_usage"], {"call": call_usage, "teardown": teardown_usage})
+
+    def test_reporters_of_parallel_processes_share_run_document(self):
+        # given
+        self.start_run()
+        run_id = self.get_run_documents()[0]["_id"]
+        db_client = self.mongo_reporter._db_client
+        reporter.MongoReporter._instance = None
+        with mock.patch.object(reporter, "DBClient", lambda uri: db_client):
+            other_reporter = reporter.MongoReporter(mongo_uri=None, run_id=str(run_id))
+        # when
+        self.mongo_reporter.log_report(MockPassingReport, MockPassingItem)
+        other_reporter.log_report(MockFailingReport, MockFailingItem)
+        # then
+        run_documents = self.get_run_documents()
+        self.assertEqual(len(run_documents), 1)
+        self.assertEqual(run_documents[0]["test_count"], 2)
+        self.assertEqual(run_documents[0]["status"], reporter.MongoReporter.FAIL)
+        self.assertEqual(run_documents[0]["result"][reporter.MongoReporter.PASS], 1)
+        self.assertEqual(run_documents[0]["result"][reporter.MongoReporter.FAIL], 1)
+        self.assertEqual(sorted(d["order"] for d in self.get_result_documents()), [0, 1])
+
     def get_expected_test_document(self, run_id, test_name, duration, order, priority, components, defects,
                                    tags, status, stacktrace, log):
         return {
             "run_id": run_id,
             "name": test_name,
+            "nodeid": test_name,
             "duration": duration,
+            "setup_duration": None,
             "order": order,
             "priority": priority,
             "components": ", ".join(components),
@@ -205,11 +244,14 @@ class TestReporter(TestCase):
             "status": status,
             "stacktrace": stacktrace,
             "log": log,
+            "http_requests": [],
+            "resource_usage": {},
         }
 
     def get_expected_run_document(self, pass_count=0, fail_count=0, skipped_count=0, test_count=0, finished=False,
                                   status="PASS"):
         expected_run = {
+            "collection_time": 1.5,
             "environment": "test_environment",
             "environment_version": "0.7",
             "finished": finished,
@@ -226,3 +268,81 @@ class TestReporter(TestCase):
             "total_test_count": 100
         }
         return expected_run
+
+
+class TestDurationHistory(TestCase):
+    """Unit: DurationHistory."""
+
+    @mock.patch.object(reporter, "DBClient", MockClient)
+    def setUp(self):
+        self.history = reporter.DurationHistory(mongo_uri=None, history_size=2)
+        self.results = self.history._db_client.database[reporter.MongoReporter._test_result_collection_name]
+
+    def test_get_returns_latest_durations_including_setup(self):
+        # given
+        for duration in (1.0, 2.0, 3.0):
+            self.results.insert_one({"nodeid": "a", "duration": duration, "setup_duration": 0.5})
+        self.results.insert_one({"nodeid": "b", "duration": 4.0, "setup_duration": None})
+        self.results.insert_one({"nodeid": "c", "duration": 5.0})
+        self.results.insert_one({"name": "fixture error"})
+        # when
+        durations = self.history.get(["a", "b", "d"])
+        # then
+        self.assertEqual(durations, {"a": [3.5, 2.5], "b": [4.0]})
+
+    def test_get_queries_history_in_chunks_of_nodeids(self):
+        # given
+        for nodeid in ("a", "b", "c"):
+            self.results.insert_one({"nodeid": nodeid, "duration": 1.0})
+        # when
+        with mock.patch.object(reporter.DurationHistory, "QUERY_CHUNK_SIZE", 2), \
+                mock.patch.object(self.history._db_client, "find", wraps=self.history._db_client.find) as mock_find:
+            durations = self.history.get(["c", "b", "a", "a"])
+        # then
+        self.assertEqual(durations, {"a": [1.0], "b": [1.0], "c": [1.0]})
+        self.assertEqual(mock_find.call_count, 2)
+
+    @mock.patch.object(reporter, "DBClient", MockClient)
+    def test_history_is_indexed_by_nodeid(self):
+        # when
+        with mock.patch.object(MockClient, "create_index") as mock_create_index:
+            reporter.DurationHistory(mongo_uri=None, history_size=2)
+        # then
+        mock_create_index.assert_called_once_with(reporter.MongoReporter._test_result_collection_name,
+                                                  [("nodeid", 1), ("_id", -1)])
+
+
+class TestPlatformComponentsHistory(TestCase):
+    """Unit: PlatformComponentsHistory."""
+
+    @mock.patch.object(reporter, "DBClient", MockClient)
+    def setUp(self):
+        self.history = reporter.PlatformComponentsHistory(mongo_uri=None)
+        self.runs = self.history._db_client.database[reporter.MongoReporter._test_run_collection_name]
+
+    def test_get_previous_returns_components_of_latest_finished_passed_run(self):
+        # given
+        components = [{"name": "console", "version": "1"}]
+        passed = reporter.MongoReporter.PASS
+        self.runs.insert_one({"environment": "a", "finished": True, "status": passed,
+                              "platform_components": components})
+        latest_id = self.runs.insert_one({"environment": "a", "finished": True, "status": passed,
+                                          "platform_components": [{"name": "console", "version": "2"}]}).inserted_id
+        self.runs.insert_one({"environment": "a", "finished": True, "status": passed, "platform_components": []})
+        self.runs.insert_one({"environment": "a", "finished": True, "status": reporter.MongoReporter.FAIL,
+                              "platform_components": [{"name": "console", "version": "3"}]})
+        self.runs.insert_one({"environment": "a", "finished": False, "status": passed,
+                              "platform_components": components})
+        self.runs.insert_one({"environment": "b", "finished": True, "status": passed,
+                              "platform_components": components})
+        # when
+        run_id, versions = self.history.get_previous("a")
+        # then
+        self.assertEqual(run_id, latest_id)
+        self.assertEqual(versions, {"console": "2"})
+
+    def test_get_previous_without_runs(self):
+        # when
+        run_id, versions = self.history.get_previous("a")
+        # then
+        self.assertEqual((run_id, versions), (None, None))
@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Run service instance lifecycle (create, check, delete) for many (service, plan) pairs concurrently, with a limit of
+lifecycles run at once against one broker.
+"""
+
+from collections import deque, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
+import os
+import threading
+import time
+
+import config
+from .tap_logger import get_logger
+from .tap_object_model import ServiceType
+
+
+logger = get_logger(__name__)
+
+
+class PlanMatrix(object):
+    """
+    Executor of lifecycle(service_type, plan) for (service, plan) pairs. Pairs are run by max_workers threads, at
+    most broker_concurrency pairs of services of one broker at once. Each pair is run once, no matter how many times
+    it's submitted, so that parametrized tests can submit all pairs and then wait for the result of their own.
+    """
+
+    def __init__(self, lifecycle, max_workers=None, broker_concurrency=None):
+        if config.cassette_mode is not None:
+            max_workers = 1  # recorded interactions must not depend on timing
+        self._lifecycle = lifecycle
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or config.plan_matrix_max_workers)
+        self._broker_concurrency = broker_concurrency or config.plan_matrix_broker_concurrency
+        self._lock = threading.Lock()
+        self._futures = OrderedDict()  # (service label, plan name) -> Future
+        self._pending = OrderedDict()  # broker -> deque of (future, service_type, plan) waiting for a free slot
+        self._running = {}  # broker -> number of running lifecycles
+
+    @staticmethod
+    def key(service_type, plan):
+        return service_type.label, plan["name"]
+
+    def submit(self, service_type, plan) -> Future:
+        """Schedule lifecycle of the pair, unless it was already scheduled. Return future of its result."""
+        key = self.key(service_type, plan)
+        with self._lock:
+            if key not in self._futures:
+                self._futures[key] = Future()
+                broker = service_type.broker_guid or service_type.label
+                self._pending.setdefault(broker, deque()).append((self._futures[key], service_type, plan))
+                self._dispatch()
+            return self._futures[key]
+
+    def result(self, service_type, plan):
+        """Wait for lifecycle of the pair and return its result, or raise its exception."""
+        return self.submit(service_type, plan).result()
+
+    def errors(self) -> list:
+        """Wait for all submitted lifecycles and return list of errors, as strings."""
+        with self._lock:
+            futures = list(self._futures.items())
+        errors = []
+        for (label, plan_name), future in futures:
+            exception = future.exception()
+            if exception is not None:
+                errors.append("{} {}: {}".format(label, plan_name, exception))
+        return errors
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+    @classmethod
+    def run(cls, lifecycle, pairs, **kwargs) -> list:
+        """Run lifecycle for all (service_type, plan) pairs concurrently, return list of errors."""
+        matrix = cls(lifecycle, **kwargs)
+        try:
+            for service_type, plan in pairs:
+                matrix.submit(service_type, plan)
+            return matrix.errors()
+        finally:
+            matrix.shutdown()
+
+    def _dispatch(self):
+        """Start pending lifecycles of brokers which have free slots. Must be called with lock acquired."""
+        for broker, pending in self._pending.items():
+            while pending and self._running.get(broker, 0) < self._broker_concurrency:
+                future, service_type, plan = pending.popleft()
+                self._running[broker] = self._running.get(broker, 0) + 1
+                self._executor.submit(self._run, broker, future, service_type, plan)
+
+    def _run(self, broker, future, service_type, plan):
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(self._lifecycle(service_type, plan))
+            except BaseException as e:
+                logger.warning("{} {} failed: {}".format(service_type.label, plan["name"], e))
+                future.set_exception(e)
+        with self._lock:
+            self._running[broker] -= 1
+            self._dispatch()
+
+
+def get_marketplace(space_guid_provider, cache_path, max_age) -> list:
+    """
+    Return marketplace services, read from cache file if it was written less than max_age seconds ago, otherwise
+    get them from api for space with guid returned by space_guid_provider and write them to the cache file.
+    Cached marketplace is shared by test collection in all test processes and test execution, so that parametrized
+    tests are the same everywhere.
+    """
+    from .http_calls.platform import service_catalog
+    try:
+        if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < max_age:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            return [ServiceType._from_details(cached["space_guid"], data) for data in cached["services"]]
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Cannot read marketplace cache {}: {}".format(cache_path, e))
+    space_guid = space_guid_provider()
+    response = service_catalog.api_get_marketplace_services(space_guid=space_guid)
+    temporary_path = "{}.{}".format(cache_path, os.getpid())
+    with open(temporary_path, "w") as f:
+        json.dump({"space_guid": space_guid, "services": response}, f)
+    os.replace(temporary_path, cache_path)  # atomic, other test processes never read partially written file
+    return [ServiceType._from_details(space_guid, data) for data in response]
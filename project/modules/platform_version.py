@@ -14,8 +14,6 @@
 # limitations under the License.
 #
 
-import yaml
-
 from .constants import TapComponent, TapGitHub
 from .app_sources import github_get_file_content
 import config
@@ -46,4 +44,5 @@ def get_appstack_yml(github_org_name=None):
         appstack_file = github_get_file_content(repository=TapGitHub.apployer, file_path=TapGitHub.appstack_path,
                                                 owner=github_org_name, ref=config.appstack_version,
                                                 github_auth=config.github_credentials())
+    import yaml  # imported on first use, it's slow to import
     return yaml.load(appstack_file)
@@ -0,0 +1,307 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Pool of test organizations provisioned ahead of time. Each organization has a space, optionally with sample python
+app and shared service instances used by ingestion tests. Test runs lease an organization instead of creating one,
+and return it after deleting what the tests left in it: apps and service instances in the space, other spaces and
+users added to the organization or space.
+Pool state is kept in database, so it is shared by test runs on all agents. Test runs renew their leases while they
+run. Pool is refilled and leases of crashed runs, which stopped renewing them, are garbage-collected by a separate
+process (cf cli target is global, so apps are not pushed from test runs):
+    python -m modules.resource_pool refill  # e.g. in a CI stage before tests
+    python -m modules.resource_pool reaper  # refill and garbage-collect every reaper interval
+    python -m modules.resource_pool drain   # delete all free organizations
+"""
+
+import argparse
+from collections import namedtuple
+import os
+import socket
+import sys
+import threading
+import time
+
+import config
+from .constants import ApplicationPath, ServiceLabels, ServicePlan
+from .exceptions import UnexpectedResponseError
+from .http_calls import cloud_foundry as cf
+from .mongo_reporter.client import DBClient
+from .tap_logger import get_logger
+from .tap_object_model import Application, Organization, ServiceInstance, Space, User
+from .test_names import worker_id
+
+logger = get_logger(__name__)
+
+
+PoolLease = namedtuple("PoolLease", ["id", "org", "space", "apps", "service_instances", "org_users", "space_users"])
+
+
+class _ProvisioningContext(object):
+    """Objects created while provisioning pool entry, deleted if provisioning fails."""
+
+    def __init__(self):
+        self.orgs = []
+        self.apps = []
+        self.service_instances = []
+
+    def cleanup(self):
+        for item in self.apps + self.service_instances + self.orgs:
+            try:
+                item.cleanup()
+            except UnexpectedResponseError as e:
+                logger.warning("Error while deleting {}: {}".format(item, e))
+
+
+class ResourcePool(object):
+
+    COLLECTION = "resource_pool"
+    PROVISIONING = "provisioning"
+    FREE = "free"
+    LEASED = "leased"
+
+    # (label, plan, name) - names are the ones used by ingestion tests, so that they use pooled instances
+    SERVICE_INSTANCES = (
+        (ServiceLabels.KAFKA, ServicePlan.SHARED, "kafka-inst"),
+        (ServiceLabels.ZOOKEEPER, ServicePlan.SHARED, "zookeeper-inst"),
+        (ServiceLabels.HDFS, ServicePlan.SHARED, "hdfs-inst"),
+        (ServiceLabels.KERBEROS, ServicePlan.SHARED, "kerberos-service"),
+    )
+
+    def __init__(self, mongo_uri=None, size=None, lease_timeout=None):
+        self._db_client = DBClient(uri=mongo_uri or config.database_url)
+        self.size = config.resource_pool_size if size is None else size
+        self.lease_timeout = config.resource_pool_lease_timeout if lease_timeout is None else lease_timeout
+
+    @staticmethod
+    def _owner():
+        owner = "{}:{}".format(socket.gethostname(), os.getpid())
+        return owner if worker_id() is None else "{}:{}".format(owner, worker_id())
+
+    # ------------------------------------------------- test runs ------------------------------------------------- #
+
+    def lease(self):
+        """Lease the oldest free organization, return PoolLease or None if the pool is empty."""
+        document = self._db_client.find_and_update(
+            self.COLLECTION, {"state": self.FREE},
+            {"$set": {"state": self.LEASED, "leased_at": time.time(), "leased_by": self._owner()}},
+            sort=[("created_at", 1)]
+        )
+        if document is None:
+            logger.warning("Resource pool is empty")
+            return None
+        logger.info("Leased {} from resource pool".format(document["org"]["name"]))
+        return self._lease_from_document(document)
+
+    def renew(self, lease: PoolLease) -> bool:
+        """Refresh lease time, so that the lease is not reaped. Return False if the lease was already reaped."""
+        document = self._db_client.find_and_update(self.COLLECTION, {"_id": lease.id, "state": self.LEASED},
+                                                   {"$set": {"leased_at": time.time()}})
+        if document is None:
+            logger.warning("Lease of {} expired and was reaped".format(lease.org.name))
+        return document is not None
+
+    def keep_leased(self, lease: PoolLease, interval=None) -> threading.Event:
+        """
+        Renew lease every interval seconds (config.resource_pool_lease_renew_interval by default) in a background
+        thread. Return event which stops renewing when set.
+        """
+        interval = config.resource_pool_lease_renew_interval if interval is None else interval
+        stop = threading.Event()
+
+        def renew():
+            while not stop.wait(interval):
+                try:
+                    if not self.renew(lease):
+                        return
+                except Exception as e:
+                    logger.warning("Failed to renew lease of {}: {}".format(lease.org.name, e))
+
+        threading.Thread(target=renew, name="resource-pool-lease", daemon=True).start()
+        return stop
+
+    def release(self, lease: PoolLease):
+        """Delete objects created by tests and return organization to the pool."""
+        try:
+            self._reset(lease)
+        except (UnexpectedResponseError, ResourcePoolResetException) as e:
+            logger.warning("Failed to reset {}, deleting it: {}".format(lease.org, e))
+            self._destroy(lease.id, lease.org)
+            return
+        self._db_client.update(self.COLLECTION, lease.id, {"$set": {"state": self.FREE, "leased_by": None}})
+        logger.info("Returned {} to resource pool".format(lease.org.name))
+
+    @staticmethod
+    def _lease_from_document(document):
+        org = Organization(name=document["org"]["name"], guid=document["org"]["guid"])
+        space = Space(name=document["space"]["name"], guid=document["space"]["guid"], org_guid=org.guid)
+        app_guids = {app["guid"] for app in document["apps"]}
+        instance_guids = {instance["guid"] for instance in document["service_instances"]}
+        apps = [app for app in Application.api_get_list(space.guid) if app.guid in app_guids] if app_guids else []
+        instances = [i for i in ServiceInstance.api_get_list(space.guid) if i.guid in instance_guids] \
+            if instance_guids else []
+        return PoolLease(id=document["_id"], org=org, space=space, apps=apps, service_instances=instances,
+                         org_users=document.get("org_users"), space_users=document.get("space_users"))
+
+    @staticmethod
+    def _reset(lease):
+        if lease.org_users is None or lease.space_users is None:
+            raise ResourcePoolResetException("entry was provisioned without list of pooled users")
+        pooled_apps = {app.guid for app in lease.apps}
+        pooled_instances = {instance.guid for instance in lease.service_instances}
+        apps = Application.api_get_list(lease.space.guid)
+        for app in apps:
+            if app.guid not in pooled_apps:
+                app.api_delete()
+        instances = ServiceInstance.api_get_list(lease.space.guid)
+        for instance in instances:
+            if instance.guid not in pooled_instances:
+                instance.api_delete()
+        if pooled_apps - {app.guid for app in apps} or pooled_instances - {i.guid for i in instances}:
+            raise ResourcePoolResetException("pooled app or service instance was deleted")
+        for space in Space.api_get_list_in_org(lease.org.guid):
+            if space.guid != lease.space.guid:
+                space.api_delete()
+        for user in User.api_get_list_via_space(lease.space.guid):
+            if user.guid not in lease.space_users:
+                user.api_delete_from_space(lease.space.guid)
+        for user in User.api_get_list_via_organization(lease.org.guid):
+            if user.guid not in lease.org_users:
+                user.api_delete_from_organization(lease.org.guid)
+        for app in apps:
+            if app.guid in pooled_apps and not app.is_started:
+                app.api_start()
+
+    # ----------------------------------------------- maintenance ------------------------------------------------ #
+
+    def provision(self, sample_app=None, service_instances=None):
+        """Create organization with a space and pooled objects and add it to the pool as free."""
+        sample_app = config.resource_pool_sample_app if sample_app is None else sample_app
+        service_instances = config.resource_pool_service_instances if service_instances is None \
+            else service_instances
+        document_id = self._db_client.insert(self.COLLECTION, {"state": self.PROVISIONING, "created_at": time.time(),
+                                                               "leased_by": self._owner()})
+        context = _ProvisioningContext()
+        try:
+            org = Organization.api_create(context)
+            # saved right away, so that reaper deletes the organization if provisioning process crashes
+            self._db_client.update(self.COLLECTION, document_id,
+                                   {"$set": {"org": {"name": org.name, "guid": org.guid}}})
+            space = Space.api_create(org)
+            instances = []
+            if service_instances:
+                for label, plan, name in self.SERVICE_INSTANCES:
+                    instances.append(ServiceInstance.api_create_with_plan_name(
+                        org_guid=org.guid, space_guid=space.guid, service_label=label, name=name,
+                        service_plan_name=plan, context=context))
+            apps = []
+            if sample_app:
+                cf.cf_login(org.name, space.name)
+                apps.append(Application.push(context=context, space_guid=space.guid,
+                                             source_directory=ApplicationPath.SAMPLE_PYTHON_APP))
+            org_users = User.api_get_list_via_organization(org.guid)
+            space_users = User.api_get_list_via_space(space.guid)
+        except Exception:
+            context.cleanup()
+            self._db_client.delete(self.COLLECTION, document_id)
+            raise
+        self._db_client.update(self.COLLECTION, document_id, {"$set": {
+            "state": self.FREE,
+            "leased_by": None,
+            "org": {"name": org.name, "guid": org.guid},
+            "space": {"name": space.name, "guid": space.guid},
+            "apps": [{"name": app.name, "guid": app.guid} for app in apps],
+            "service_instances": [{"name": i.name, "guid": i.guid, "label": label, "plan": plan}
+                                  for i, (label, plan, _) in zip(instances, self.SERVICE_INSTANCES)],
+            "org_users": [user.guid for user in org_users],
+            "space_users": [user.guid for user in space_users]
+        }})
+        logger.info("Provisioned {} in resource pool".format(org.name))
+
+    def refill(self):
+        """Provision organizations until there are pool size free (or being provisioned) organizations."""
+        stock = self._db_client.find(self.COLLECTION, {"state": {"$in": [self.FREE, self.PROVISIONING]}},
+                                     fields=["_id"])
+        for _ in range(self.size - len(list(stock))):
+            self.provision()
+
+    def reap(self):
+        """
+        Delete organizations whose lease was not renewed within lease timeout, or stuck in provisioning, e.g. by
+        crashed runs.
+        """
+        expired = {"$or": [{"state": self.LEASED, "leased_at": {"$lt": time.time() - self.lease_timeout}},
+                           {"state": self.PROVISIONING, "created_at": {"$lt": time.time() - self.lease_timeout}}]}
+        for document in list(self._db_client.find(self.COLLECTION, expired)):
+            org = document.get("org")
+            logger.info("Reaping expired pool entry {}".format(org["name"] if org else document["_id"]))
+            self._destroy(document["_id"], Organization(name=org["name"], guid=org["guid"]) if org else None)
+
+    def drain(self):
+        """Delete all free organizations."""
+        for document in list(self._db_client.find(self.COLLECTION, {"state": self.FREE})):
+            self._destroy(document["_id"], Organization(name=document["org"]["name"], guid=document["org"]["guid"]))
+
+    def _destroy(self, document_id, org):
+        if org is not None:
+            try:
+                org.cleanup()
+            except UnexpectedResponseError as e:
+                logger.warning("Error while deleting {}: {}".format(org, e))
+        self._db_client.delete(self.COLLECTION, document_id)
+
+    def run_reaper(self, interval=None):
+        """Garbage-collect and refill the pool every interval seconds."""
+        interval = config.resource_pool_reaper_interval if interval is None else interval
+        while True:
+            try:
+                self.reap()
+                self.refill()
+            except Exception as e:
+                logger.exception("Resource pool maintenance failed: {}".format(e))
+            time.sleep(interval)
+
+
+class ResourcePoolResetException(Exception):
+    TEMPLATE = "Resource pool entry could not be reset: {}"
+
+    def __init__(self, message=None):
+        super().__init__(self.TEMPLATE.format(message))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain pool of test organizations.")
+    parser.add_argument("action", choices=["refill", "reap", "reaper", "drain"])
+    parser.add_argument("--size", type=int, help="number of free organizations, default PT_RESOURCE_POOL_SIZE")
+    args = parser.parse_args()
+    if config.database_url is None:
+        parser.error("PT_DATABASE_URL is required to keep pool state")
+    pool = ResourcePool(size=args.size)
+    if pool.size is None and args.action in ("refill", "reaper"):
+        parser.error("pool size is required, use --size or PT_RESOURCE_POOL_SIZE")
+    if args.action == "refill":
+        pool.refill()
+    elif args.action == "reap":
+        pool.reap()
+    elif args.action == "reaper":
+        pool.run_reaper()
+    else:
+        pool.drain()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import cProfile
+from collections import namedtuple
+import os
+import re
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+class PhaseUsage(namedtuple("PhaseUsage", ["wall_time", "cpu_time", "sleep_time", "retry_sleep_time", "http_time",
+                                           "http_request_count", "peak_rss", "rss_growth"])):
+    """
+    Resources used by one test phase (setup, call or teardown). Times are in seconds.
+    peak_rss -- process high-water mark of resident memory at the end of the phase, in kilobytes
+    rss_growth -- how much the phase raised the high-water mark, in kilobytes
+    """
+
+    def to_dict(self):
+        return dict(self._asdict())
+
+
+class ResourceProfiler(object):
+    """
+    Measure resources used between start and stop: wall time, CPU time, time spent in time.sleep (including retry
+    decorator delays) and in HTTP requests sent through HttpSession.
+    Once installed, the profiler is an HttpSession request hook and replaces time.sleep with a measuring wrapper.
+    Sleeps and requests are counted only in the thread which started the measurement, so that background threads
+    (e.g. keep-alive) do not inflate results. Sleeps of modules which imported the function directly
+    (from time import sleep) are missed.
+    """
+
+    RETRY_MODULE = "retry"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._original_sleep = None
+        self._thread_id = None
+        self._start = None
+        self._sleep_time = 0
+        self._retry_sleep_time = 0
+        self._http_time = 0
+        self._http_request_count = 0
+
+    @property
+    def is_running(self):
+        return self._start is not None
+
+    def install(self):
+        from modules.http_client.client_auth.http_session import HttpSession
+        HttpSession.add_request_hook(self)
+        if self._original_sleep is None:
+            self._original_sleep = time.sleep
+            time.sleep = self._sleep
+
+    def uninstall(self):
+        from modules.http_client.client_auth.http_session import HttpSession
+        HttpSession.remove_request_hook(self)
+        if self._original_sleep is not None:
+            time.sleep = self._original_sleep
+            self._original_sleep = None
+
+    def start(self):
+        with self._lock:
+            self._thread_id = threading.get_ident()
+            self._sleep_time = self._retry_sleep_time = self._http_time = 0
+            self._http_request_count = 0
+            self._start = (time.perf_counter(), time.process_time(), self._max_rss())
+
+    def stop(self) -> PhaseUsage:
+        wall_time, cpu_time = time.perf_counter(), time.process_time()
+        max_rss = self._max_rss()
+        with self._lock:
+            start_wall_time, start_cpu_time, start_max_rss = self._start
+            self._start = None
+            return PhaseUsage(wall_time=wall_time - start_wall_time, cpu_time=cpu_time - start_cpu_time,
+                              sleep_time=self._sleep_time, retry_sleep_time=self._retry_sleep_time,
+                              http_time=self._http_time, http_request_count=self._http_request_count,
+                              peak_rss=max_rss, rss_growth=max_rss - start_max_rss)
+
+    def __call__(self, timing):
+        """HttpSession request hook, timing is a RequestTiming. Requests of background threads are not counted."""
+        with self._lock:
+            if self.is_running and threading.get_ident() == self._thread_id:
+                self._http_time += timing.total_time
+                self._http_request_count += 1
+
+    def _sleep(self, seconds):
+        caller = sys._getframe(1).f_globals.get("__name__", "")
+        start_time = time.perf_counter()
+        try:
+            self._original_sleep(seconds)
+        finally:
+            slept = time.perf_counter() - start_time
+            with self._lock:
+                if self.is_running and threading.get_ident() == self._thread_id:
+                    self._sleep_time += slept
+                    if caller.split(".")[0] == self.RETRY_MODULE:
+                        self._retry_sleep_time += slept
+
+    @staticmethod
+    def _max_rss():
+        """Return maximum resident set size of the process in kilobytes, 0 if it cannot be measured."""
+        if resource is None:
+            return 0
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss // 1024 if sys.platform == "darwin" else max_rss  # bytes on OS X
+
+
+class PhaseProfile(object):
+    """
+    cProfile profile of a test phase, written to directory only if the phase took longer than threshold seconds.
+    Use as a context manager; path is set after exit if the profile was saved.
+    """
+
+    FILE_NAME_FORMAT = "{}-{}.prof"
+    UNSAFE_CHARACTERS = re.compile(r"[^\w.-]+")
+
+    def __init__(self, name, phase, threshold, directory):
+        self.name = name
+        self.phase = phase
+        self.threshold = threshold
+        self.directory = directory
+        self.path = None
+        self._profile = cProfile.Profile()
+        self._start_time = None
+
+    def __enter__(self):
+        self._start_time = time.perf_counter()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profile.disable()
+        if time.perf_counter() - self._start_time > self.threshold:
+            os.makedirs(self.directory, exist_ok=True)
+            file_name = self.FILE_NAME_FORMAT.format(self.UNSAFE_CHARACTERS.sub("_", self.name), self.phase)
+            self.path = os.path.join(self.directory, file_name)
+            self._profile.dump_stats(self.path)
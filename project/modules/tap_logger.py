@@ -107,8 +107,12 @@ def log_command(command, replace=None):
 
 
 def log_http_request(prepared_request, username, password=None, description="", data=None):
-    prepared_body = prepared_request.body[:5000] if prepared_request.body else prepared_request.body
-    body = prepared_body if not data else json.dumps(data)
+    if prepared_request.body is not None and not isinstance(prepared_request.body, (str, bytes)):
+        # streamed body is sent while being read, so it can't be logged
+        body = "[streamed body, {} bytes]".format(prepared_request.headers.get("Content-Length", "unknown"))
+    else:
+        prepared_body = prepared_request.body[:5000] if prepared_request.body else prepared_request.body
+        body = prepared_body if not data else json.dumps(data)
     if body is None:
         body = ""
     msg = [
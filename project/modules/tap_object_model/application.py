@@ -15,27 +15,32 @@
 #
 
 import json
+import operator
 import os
 
 import requests
 from retry import retry
-import yaml
 
 import config
 from ..exceptions import UnexpectedResponseError
 from ..http_calls import cloud_foundry as cf
 from ..http_calls.platform import service_catalog
+from ..http_client.cassette import Cassette
 from ..tap_logger import log_http_request, log_http_response
 from ..test_names import generate_test_object_name
+from .lazy_view import LazyView
 
 
 class Application(object):
 
+    __slots__ = ("name", "guid", "space_guid", "_state", "instances", "urls", "_request_session")
+
     STATUS = {"restage": "RESTAGING", "start": "STARTED", "stop": "STOPPED"}
 
     MANIFEST_NAME = "manifest.yml"
 
     COMPARABLE_ATTRIBUTES = ["name", "guid", "space_guid", "is_running", "is_started"]
+    _IDENTITY = operator.attrgetter(*COMPARABLE_ATTRIBUTES)
 
     def __init__(self, name, guid, space_guid, state, instances, urls):
         """local_path - directory where application manifest is located"""
@@ -45,10 +50,10 @@ class Application(object):
         self._state = state
         self.instances = instances
         self.urls = tuple(urls)
-        self.request_session = requests.session()
+        self._request_session = None
 
     def __eq__(self, other):
-        return all([getattr(self, attribute) == getattr(other, attribute) for attribute in self.COMPARABLE_ATTRIBUTES])
+        return self._IDENTITY(self) == self._IDENTITY(other)
 
     def __hash__(self):
         return hash((self.name, self.guid))
@@ -59,6 +64,13 @@ class Application(object):
     def __repr__(self):
         return "{0} (name={1}, guid={2})".format(self.__class__.__name__, self.name, self.guid)
 
+    @property
+    def request_session(self):
+        """Session used to call application api, created on first use."""
+        if self._request_session is None:
+            self._request_session = requests.session()
+        return self._request_session
+
     @property
     def is_started(self):
         if self._state is None:
@@ -101,6 +113,7 @@ class Application(object):
         bound_services -- iterable with bound service names to be included in manifest
         env -- dict with app's env values to be added to manifest
         """
+        import yaml  # imported on first push, it's slow to import
         name = generate_test_object_name(short=True) if name is None else name
         # read manifest
         manifest_path = os.path.normpath(os.path.join(source_directory, cls.MANIFEST_NAME))
@@ -141,7 +154,7 @@ class Application(object):
             json=body
         ))
         log_http_request(request, "")
-        response = self.request_session.send(request)
+        response = Cassette.send_request(self.request_session, request)
         log_http_response(response)
         if not response.ok:
             raise UnexpectedResponseError(response.status_code, response.text)
@@ -225,9 +238,11 @@ class Application(object):
         return cls.from_cf_api_space_summary_response(response, space_guid)
 
     @classmethod
-    def cf_api_get_list(cls):
-        """Get list of applications from Cloud Foundry API"""
+    def cf_api_get_list(cls, lazy=False):
+        """Get list of applications from Cloud Foundry API, lazy=True returns list of ApplicationView"""
         cf_applications = cf.cf_api_get_apps()
+        if lazy:
+            return ApplicationView.from_list(cf_applications)
         apps = []
         for data in cf_applications:
             app = cls(name=data["entity"]["name"], space_guid=None, state=data["entity"]["state"],
@@ -259,4 +274,17 @@ class Application(object):
         return env["VCAP_SERVICES"][service_name][i]["credentials"]
 
 
+class ApplicationView(LazyView):
+    """Lazy view of application from Cloud Foundry API apps list."""
+
+    __slots__ = ()
 
+    MODEL = Application
+    FIELDS = {
+        "name": lambda data: data["entity"]["name"],
+        "guid": lambda data: data["metadata"]["guid"],
+        "space_guid": lambda data: None,
+        "state": lambda data: data["entity"]["state"],
+        "instances": lambda data: (None, data["entity"]["instances"]),
+        "urls": lambda data: data["metadata"]["url"],
+    }
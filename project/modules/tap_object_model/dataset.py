@@ -16,11 +16,13 @@
 
 import functools
 import datetime
+import operator
 from enum import Enum
 
 from retry import retry
 
 from ..http_calls.platform import data_catalog, dataset_publisher
+from .lazy_view import LazyView
 
 
 class DatasetAccess(Enum):
@@ -31,8 +33,12 @@ class DatasetAccess(Enum):
 @functools.total_ordering
 class DataSet(object):
 
+    __slots__ = ("category", "creation_time", "data_sample", "format", "is_public", "id", "org_guid", "record_count",
+                 "size", "source_uri", "target_uri", "title", "object_store_id")
+
     COMPARABLE_ATTRIBUTES = ["category", "creation_time", "data_sample", "format", "is_public", "id",
                              "org_guid", "record_count", "size", "source_uri", "target_uri", "title"]
+    _IDENTITY = operator.attrgetter(*COMPARABLE_ATTRIBUTES)
     CATEGORIES = ["other", "agriculture", "climate", "science", "energy", "business", "consumer", "education",
                   "finance", "manufacturing", "ecosystems", "health"]
     FILE_FORMATS = ["CSV"]
@@ -45,7 +51,10 @@ class DataSet(object):
         self.object_store_id = None if self.target_uri is None else self.target_uri.split("/")[8]
 
     def __eq__(self, other):
-        return all([getattr(self, attribute) == getattr(other, attribute) for attribute in self.COMPARABLE_ATTRIBUTES])
+        return self._IDENTITY(self) == self._IDENTITY(other)
+
+    def __hash__(self):
+        return hash(self._IDENTITY(self))
 
     def __lt__(self, other):
         return self.id < other.id
@@ -55,12 +64,15 @@ class DataSet(object):
 
     @classmethod
     def api_get_list(cls, org_list=None, query="", filters=(), size=100, time_from=0, only_private=False,
-                     only_public=False, client=None):
+                     only_public=False, client=None, lazy=False):
+        """lazy=True returns list of DataSetView"""
         org_guids = None
         if org_list is not None:
             org_guids = [org.guid for org in org_list]
         response = data_catalog.api_get_datasets(org_guids, query, filters, size, time_from, only_private, only_public,
                                                  client=client)
+        if lazy:
+            return DataSetView.from_list(response["hits"])
         data_sets = []
         for data in response["hits"]:
             data_set = cls(id=data["id"], category=data["category"], title=data["title"], format=data["format"],
@@ -123,3 +135,28 @@ class DataSet(object):
                     dataSample=self.data_sample, isPublic=self.is_public,
                     creationTime=datetime.datetime.strptime(self.creation_time, "%Y-%m-%dT%H:%M:%S.%f")
                     .strftime("%Y-%m-%dT%H:%M"))
+
+
+class DataSetView(LazyView):
+    """Lazy view of data set from data catalog list."""
+
+    __slots__ = ()
+
+    MODEL = DataSet
+    FIELDS = {
+        "id": lambda data: data["id"],
+        "category": lambda data: data["category"],
+        "title": lambda data: data["title"],
+        "format": lambda data: data["format"],
+        "creation_time": lambda data: data["creationTime"],
+        "is_public": lambda data: data["isPublic"],
+        "org_guid": lambda data: data["orgUUID"],
+        "data_sample": lambda data: data["dataSample"],
+        "record_count": lambda data: data["recordCount"],
+        "size": lambda data: data["size"],
+        "source_uri": lambda data: data["sourceUri"],
+        "target_uri": lambda data: data["targetUri"],
+    }
+
+    def __repr__(self):
+        return "{} ({})".format(self.__class__.__name__, self.raw.get("id"))
@@ -14,7 +14,19 @@
 # limitations under the License.
 #
 
+from collections import namedtuple
+import time
+
+import requests
+
+from ...exceptions import UnexpectedResponseError
+from ...tap_logger import get_logger
 from .. import DataSet, Transfer
+from ..transfer import TransferError, TransferState
+
+logger = get_logger(__name__)
+
+POLLING_ERRORS = (UnexpectedResponseError, requests.RequestException)
 
 
 def create_dataset_from_link(context, org, source, is_public=False, category=DataSet.CATEGORIES[0],
@@ -33,9 +45,110 @@ def create_dataset_from_file(context, org, file_path, client=None) -> tuple:
     return transfer, data_set
 
 
+class DatasetCreationResult(namedtuple("DatasetCreationResult", ["source", "transfer", "data_set", "error"])):
+    """Outcome of creating a data set from one link - error is None if data set was created."""
+
+
+def create_datasets_from_links_batch(context, org, source_list, is_public=False, category=DataSet.CATEGORIES[0],
+                                     client=None, timeout=150, data_set_timeout=60, interval=3) -> list:
+    """
+    Create data sets from all links concurrently and return list of DatasetCreationResult in source_list order.
+    All transfers are submitted up front, then each tick a single transfer list request tracks unfinished transfers
+    (those not found on the list are fetched by id) and a single data set list request resolves data sets of finished
+    ones. Transfers have to finish within timeout and their data sets have to appear within data_set_timeout seconds
+    from transfer end.
+    Failures, including errors of polling requests, are reported per item and do not stop creation of other data sets.
+    """
+    results = [None] * len(source_list)
+    unfinished_transfers = {}  # source index -> transfer
+    finished_transfers = {}  # source index -> transfer waiting for its data set
+    data_set_deadlines = {}  # source index -> time by which data set has to be found
+    polling_errors = {}  # source index -> last error raised when polling
+    for i, source in enumerate(source_list):
+        try:
+            unfinished_transfers[i] = Transfer.api_create(context, org_guid=org.guid, source=source,
+                                                          category=category, is_public=is_public, client=client)
+        except POLLING_ERRORS as e:
+            results[i] = DatasetCreationResult(source, None, None, e)
+    deadline = time.time() + timeout
+    while True:
+        if unfinished_transfers:
+            _update_transfers(org, unfinished_transfers, finished_transfers, results, source_list, polling_errors,
+                              client)
+            for i in finished_transfers:
+                data_set_deadlines.setdefault(i, time.time() + data_set_timeout)
+        if finished_transfers:
+            _resolve_data_sets(org, finished_transfers, results, source_list, polling_errors, client)
+        now = time.time()
+        if now > deadline:
+            for i in list(unfinished_transfers):
+                transfer = unfinished_transfers.pop(i)
+                error = AssertionError("Transfer did not finish. State: {}".format(transfer.state))
+                results[i] = DatasetCreationResult(source_list[i], transfer, None, polling_errors.get(i, error))
+        for i in [i for i in finished_transfers if now > data_set_deadlines[i]]:
+            transfer = finished_transfers.pop(i)
+            error = AssertionError("Dataset {} was not found".format(transfer.title))
+            results[i] = DatasetCreationResult(source_list[i], transfer, None, polling_errors.get(i, error))
+        if not (unfinished_transfers or finished_transfers):
+            break
+        time.sleep(interval)
+    return results
+
+
+def _update_transfers(org, unfinished_transfers, finished_transfers, results, source_list, polling_errors, client):
+    """Refresh state of all unfinished transfers, move finished ones to finished_transfers."""
+    batch_ids = {transfer.id for transfer in unfinished_transfers.values()}
+    try:
+        transfers = Transfer.api_get_list(org_guid_list=[org.guid], client=client, size=len(batch_ids))
+        transfers_by_id = {transfer.id: transfer for transfer in transfers if transfer.id in batch_ids}
+    except POLLING_ERRORS as e:
+        logger.warning("Failed to get transfer list, transfers will be fetched one by one: {}".format(e))
+        transfers_by_id = {}
+    for i, transfer in list(unfinished_transfers.items()):
+        current = transfers_by_id.get(transfer.id)
+        if current is None:
+            # pushed out of the list by other transfers created in the organization in the meantime
+            try:
+                current = Transfer.api_get(transfer.id, client=client)
+            except POLLING_ERRORS as e:
+                polling_errors[i] = e
+                continue
+        polling_errors.pop(i, None)
+        transfer.state = current.state
+        transfer.id_in_object_store = current.id_in_object_store
+        transfer.timestamps = current.timestamps
+        if transfer.state == TransferState.ERROR:
+            error = TransferError("Transfer finished in state: {}".format(TransferState.ERROR))
+            results[i] = DatasetCreationResult(source_list[i], transfer, None, error)
+            del unfinished_transfers[i]
+        elif transfer.state == TransferState.FINISHED:
+            finished_transfers[i] = unfinished_transfers.pop(i)
+
+
+def _resolve_data_sets(org, finished_transfers, results, source_list, polling_errors, client):
+    """Find data sets of all finished transfers with one request."""
+    titles = [transfer.title for transfer in finished_transfers.values()]
+    try:
+        data_sets = DataSet.api_get_matching_to_transfer_list(transfer_title_list=titles, org_list=[org],
+                                                              client=client)
+    except POLLING_ERRORS as e:
+        for i in finished_transfers:
+            polling_errors[i] = e
+        return
+    data_sets_by_title = {data_set.title: data_set for data_set in data_sets}
+    for i, transfer in list(finished_transfers.items()):
+        polling_errors.pop(i, None)
+        data_set = data_sets_by_title.get(transfer.title)
+        if data_set is not None:
+            results[i] = DatasetCreationResult(source_list[i], transfer, data_set, None)
+            del finished_transfers[i]
+
+
 def create_datasets_from_links(context, org, source_list, client=None):
-    datasets = []
-    for source in source_list:
-        _, dataset = create_dataset_from_link(context, org, source, client=client)
-        datasets.append(dataset)
-    return datasets
+    results = create_datasets_from_links_batch(context, org, source_list, client=client)
+    failed = [result for result in results if result.error is not None]
+    for result in failed:
+        logger.error("Failed to create data set from {}: {}".format(result.source, result.error))
+    if failed:
+        raise failed[0].error
+    return [result.data_set for result in results]
@@ -51,10 +51,12 @@ def register(context, code, username, password=None, org_name=None):
     except UnexpectedResponseError as e:
         # If exception occurred, other than conflict, check whether org and user are on the list and if so, delete it.
         if e.status != HttpStatus.CODE_CONFLICT:
-            user = next((u for u in User.cf_api_get_all_users() if u.username == username), None)
-            if user is not None:
-                user.cleanup()
-            org = next((o for o in Organization.api_get_list() if o.name == org_name), None)
+            # without username, the user list is not filtered and an arbitrary user would be deleted
+            if username is not None:
+                user = next(iter(User.cf_api_get_all_users(username=username)), None)
+                if user is not None:
+                    user.cleanup()
+            org = next(iter(Organization.cf_api_get_list(name=org_name)), None)
             if org is not None:
                 org.cleanup()
         raise
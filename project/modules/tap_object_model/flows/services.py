@@ -25,6 +25,19 @@ def get_service_keys(instance):
     return summary[instance]
 
 
+def create_instance_then_delete_instance(context, org_guid, space_guid, service_type, plan):
+    step("Create instance ({} - {})".format(service_type.label, plan["name"]))
+    instance = ServiceInstance.api_create(org_guid=org_guid, space_guid=space_guid, service_label=service_type.label,
+                                          service_plan_guid=plan["guid"], context=context)
+    step("Check that the instance was created ({} - {})".format(service_type.label, plan["name"]))
+    instance.ensure_created()
+    step("Delete the instance ({} - {})".format(service_type.label, plan["name"]))
+    instance.api_delete()
+    step("Check that the instance was deleted ({} - {})".format(service_type.label, plan["name"]))
+    instances = ServiceInstance.api_get_list(space_guid=space_guid, service_type_guid=service_type.guid)
+    assert instance not in instances
+
+
 def create_instance_and_key_then_delete_key_and_instance(org_guid, space_guid, service_label, plan_guid, plan_name):
     step("Create instance ({} - {})".format(service_label, plan_name))
     instance = ServiceInstance.api_create(
@@ -0,0 +1,61 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+class LazyView(object):
+    """
+    Read-only view of one resource from an api response. Fields are decoded from the raw json only when they are
+    accessed, so scanning long lists does not pay for fields nobody reads.
+    Subclasses define FIELDS - dict mapping model constructor arguments to functions extracting them from raw json,
+    and MODEL - tap_object_model class built by materialize().
+    """
+
+    __slots__ = ("raw", "_decoded")
+
+    FIELDS = {}
+    MODEL = None
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+        self._decoded = None
+
+    def __getattr__(self, name):
+        # called only for names which are not slots, i.e. model fields
+        try:
+            extract = self.FIELDS[name]
+        except KeyError:
+            raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
+        if self._decoded is None:
+            self._decoded = {}
+        if name not in self._decoded:
+            self._decoded[name] = extract(self.raw)
+        return self._decoded[name]
+
+    def __repr__(self):
+        return "{} ({})".format(self.__class__.__name__, self.raw.get("metadata", {}).get("guid"))
+
+    def materialize(self):
+        """Return model object with all fields decoded."""
+        return self.build(self.raw)
+
+    @classmethod
+    def build(cls, raw: dict):
+        """Return model object built directly from raw json, without creating a view."""
+        return cls.MODEL(**{name: extract(raw) for name, extract in cls.FIELDS.items()})
+
+    @classmethod
+    def from_list(cls, raw_list):
+        return [cls(raw) for raw in raw_list]
@@ -15,6 +15,7 @@
 #
 
 import functools
+import operator
 
 from retry import retry
 
@@ -22,11 +23,16 @@ from ..exceptions import UnexpectedResponseError
 from ..http_calls import cloud_foundry as cf
 from ..http_calls.platform import metrics_provider, user_management
 from ..test_names import generate_test_object_name
+from .lazy_view import LazyView
 
 
 @functools.total_ordering
 class Organization(object):
 
+    __slots__ = ("name", "guid", "metrics")
+
+    _IDENTITY = operator.attrgetter("name", "guid")
+
     def __init__(self, name, guid=None):
         self.name = name
         self.guid = guid
@@ -36,7 +42,10 @@ class Organization(object):
         return "{} (name={}, guid={})".format(self.__class__.__name__, self.name, self.guid)
 
     def __eq__(self, other):
-        return self.name == other.name and self.guid == other.guid
+        return self._IDENTITY(self) == self._IDENTITY(other)
+
+    def __hash__(self):
+        return hash(self._IDENTITY(self))
 
     def __lt__(self, other):
         return self.guid < other.guid
@@ -78,8 +87,11 @@ class Organization(object):
         self.metrics = metrics_provider.api_get_org_metrics(self.guid, client=client)
 
     @classmethod
-    def cf_api_get_list(cls):
-        response = cf.cf_api_get_orgs()
+    def cf_api_get_list(cls, lazy=False, name=None):
+        """Get list of organizations from Cloud Foundry API, lazy=True returns list of OrganizationView"""
+        response = cf.cf_api_get_orgs(name=name)
+        if lazy:
+            return OrganizationView.from_list(response)
         org_list = []
         for org_info in response:
             org_list.append(cls(name=org_info["entity"]["name"], guid=org_info["metadata"]["guid"]))
@@ -91,3 +103,15 @@ class Organization(object):
 
     def cleanup(self):
         self.cf_api_delete()
+
+
+class OrganizationView(LazyView):
+    """Lazy view of organization from Cloud Foundry API organizations list."""
+
+    __slots__ = ()
+
+    MODEL = Organization
+    FIELDS = {
+        "name": lambda data: data["entity"]["name"],
+        "guid": lambda data: data["metadata"]["guid"],
+    }
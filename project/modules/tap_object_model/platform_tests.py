@@ -23,9 +23,11 @@ from modules.http_calls.platform import platform_tests
 class TestSuite(object):
 
     IN_PROGRESS = "IN_PROGRESS"
+    QUEUED = "QUEUED"
+    CANCELLED = "CANCELLED"
 
     def __init__(self, suite_id, state=None, start_date=None, end_date=None, tests_all=None, tests_finished=None,
-                 tests=None):
+                 tests=None, queue_position=None, eta=None):
         self.suite_id = suite_id
         self.state = state
         self.start_date = start_date
@@ -33,6 +35,8 @@ class TestSuite(object):
         self.tests_all = tests_all
         self.tests_finished = tests_finished
         self.tests = tests
+        self.queue_position = queue_position
+        self.eta = eta
 
     @classmethod
     def _from_api_response(cls, suite_info):
@@ -43,7 +47,9 @@ class TestSuite(object):
             end_date=suite_info.get("endDate"),
             tests_all=suite_info.get("testsAll"),
             tests_finished=suite_info.get("testsFinished"),
-            tests=suite_info.get("tests", [])
+            tests=suite_info.get("tests", []),
+            queue_position=suite_info.get("queuePosition"),
+            eta=suite_info.get("eta")
         )
 
     @classmethod
@@ -73,3 +79,7 @@ class TestSuite(object):
         new_suite = next((t for t in tests if t.suite_id == suite_id), None)
         assert new_suite is not None, "No suite returned with id {}".format(suite_id)
         return new_suite
+
+    def api_cancel(self, client=None):
+        response = platform_tests.api_cancel_test_suite(self.suite_id, client=client)
+        return self._from_api_response(response)
@@ -15,6 +15,7 @@
 #
 
 import functools
+import operator
 import uuid
 
 from retry import retry
@@ -25,6 +26,7 @@ from ..http_calls import cloud_foundry as cf, application_broker as app
 from ..http_calls.platform import app_launcher_helper as app_launcher, service_catalog, service_exposer
 from ..test_names import generate_test_object_name
 from . import ServiceKey
+from .lazy_view import LazyView
 
 
 class ServiceInstanceLastOperationState(object):
@@ -39,7 +41,10 @@ class ServiceInstanceCreationFailed(Exception):
 
 @functools.total_ordering
 class ServiceInstance(object):
+    __slots__ = ("guid", "name", "space_guid", "service_label", "bound_apps", "credentials", "last_operation")
+
     COMPARABLE_ATTRS = ["guid", "name", "space_guid", "service_label"]
+    _IDENTITY = operator.attrgetter(*COMPARABLE_ATTRS)
 
     def __init__(self, guid, name, space_guid, service_label, bound_apps=None, credentials=None, last_operation=None):
         self.guid = guid
@@ -51,7 +56,7 @@ class ServiceInstance(object):
         self.last_operation = last_operation
 
     def __eq__(self, other):
-        return all((getattr(self, a) == getattr(other, a) for a in self.COMPARABLE_ATTRS))
+        return self._IDENTITY(self) == self._IDENTITY(other)
 
     def __lt__(self, other):
         return self.guid < other.guid
@@ -60,7 +65,7 @@ class ServiceInstance(object):
         return "{} (name={}, guid={})".format(self.__class__.__name__, self.name, self.guid)
 
     def __hash__(self):
-        return hash(tuple(getattr(self, a) for a in self.COMPARABLE_ATTRS))
+        return hash(self._IDENTITY(self))
 
     @property
     def last_operation_type(self):
@@ -214,8 +219,11 @@ class ServiceInstance(object):
         return cls(guid=response["metadata"]["guid"], service_label=service_label, name=name, space_guid=space_guid)
 
     @classmethod
-    def cf_api_get_list(cls):
+    def cf_api_get_list(cls, lazy=False):
+        """Get list of service instances from Cloud Foundry API, lazy=True returns list of ServiceInstanceView"""
         si_data = cf.cf_api_get_service_instances()
+        if lazy:
+            return ServiceInstanceView.from_list(si_data)
         services = []
         for data in si_data:
             services.append(cls(guid=data["metadata"]["guid"], name=data["entity"]["name"], service_label=None,
@@ -246,7 +254,23 @@ class ServiceInstance(object):
         return cls(guid=instance_guid, name=instance_name, service_label=None, space_guid=space_guid)
 
 
+class ServiceInstanceView(LazyView):
+    """Lazy view of service instance from Cloud Foundry API service instances list."""
+
+    __slots__ = ()
+
+    MODEL = ServiceInstance
+    FIELDS = {
+        "guid": lambda data: data["metadata"]["guid"],
+        "name": lambda data: data["entity"]["name"],
+        "space_guid": lambda data: data["entity"]["space_guid"],
+        "service_label": lambda data: None,
+    }
+
+
 class AtkInstance(ServiceInstance):
+    __slots__ = ("state", "scoring_engine", "org_guid", "creator_guid", "creator_name")
+
     started_status = "STARTED"
 
     def __init__(self, guid, name, space_guid, org_guid=None, scoring_engine=None, state=None, creator_guid=None,
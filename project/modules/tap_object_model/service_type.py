@@ -16,18 +16,25 @@
 
 import functools
 import json
+import operator
 
 from ..http_calls import cloud_foundry as cf, application_broker, kubernetes_broker
 from ..http_calls.platform import service_catalog
 from ..test_names import generate_test_object_name
+from .lazy_view import LazyView
 
 
 @functools.total_ordering
 class ServiceType(object):
 
+    __slots__ = ("label", "guid", "description", "space_guid", "service_plans", "tags", "display_name", "image",
+                 "broker_guid")
+
     COMPARABLE_ATTRIBUTES = ["label", "guid", "description", "space_guid"]
+    _IDENTITY = operator.attrgetter(*COMPARABLE_ATTRIBUTES)
 
-    def __init__(self, label, guid, description, space_guid, service_plans, tags=None, display_name=None, image=None):
+    def __init__(self, label, guid, description, space_guid, service_plans, tags=None, display_name=None, image=None,
+                 broker_guid=None):
         self.label = label
         self.guid = guid
         self.description = description
@@ -36,15 +43,16 @@ class ServiceType(object):
         self.tags = tags
         self.display_name = display_name
         self.image = image
+        self.broker_guid = broker_guid
 
     def __eq__(self, other):
-        return all([getattr(self, ca) == getattr(other, ca) for ca in self.COMPARABLE_ATTRIBUTES])
+        return self._IDENTITY(self) == self._IDENTITY(other)
 
     def __lt__(self, other):
         return self.guid < other.guid
 
     def __hash__(self):
-        return hash(tuple([getattr(self, ca) for ca in self.COMPARABLE_ATTRIBUTES]))
+        return hash(self._IDENTITY(self))
 
     def __repr__(self):
         return "{} (label={}, guid={})".format(self.__class__.__name__, self.label, self.guid)
@@ -55,16 +63,12 @@ class ServiceType(object):
 
     @classmethod
     def _from_details(cls, space_guid, details):
-        metadata = details["metadata"]
         entity = details["entity"]
-        service_plans = entity.get("service_plans")
-        if service_plans is not None:  # in cf response there are no service plans, but an url
-            service_plans = [{"guid": sp["metadata"]["guid"], "name": sp["entity"]["name"]}
-                             for sp in entity["service_plans"]]
-        extra = json.loads(entity.get("extra") or "{}")
-        return cls(label=entity["label"], guid=metadata["guid"], description=entity["description"],
-                   space_guid=space_guid, service_plans=service_plans, tags=entity.get("tags"),
-                   display_name=extra.get("displayName"), image=extra.get("imageUrl"))
+        extra = _extra(entity)
+        return cls(label=entity["label"], guid=details["metadata"]["guid"], description=entity["description"],
+                   space_guid=space_guid, service_plans=_service_plans(entity), tags=entity.get("tags"),
+                   display_name=extra.get("displayName"), image=extra.get("imageUrl"),
+                   broker_guid=entity.get("service_broker_guid"))
 
     @classmethod
     def api_get_list_from_marketplace(cls, space_guid, client=None):
@@ -107,12 +111,16 @@ class ServiceType(object):
         return [cls._from_details(space_guid, data) for data in response["resources"]]
 
     @classmethod
-    def cf_api_get_list(cls, name=None, get_plans=False):
-        response = cf.cf_api_get_services(service_name=name)
+    def cf_api_get_list(cls, name=None, get_plans=False, lazy=False):
+        """Get list of services from Cloud Foundry API, lazy=True returns list of ServiceTypeView"""
+        # with inline relations, plans of most services are already in the response
+        response = cf.cf_api_get_services(service_name=name, inline_relations_depth=1 if get_plans else None)
+        if lazy:
+            return ServiceTypeView.from_list(response)
         services = []
         for service_info in response:
             service = cls._from_details(space_guid=None, details=service_info)
-            if get_plans:
+            if get_plans and service.service_plans is None:
                 plans_response = cf.cf_api_get_service_plans(service_guid=service.guid)
                 service.service_plans = []
                 for plan_info in plans_response["resources"]:
@@ -162,3 +170,33 @@ class ServiceType(object):
         if plan is None:
             plan = self.service_plans[0]
         cf.cf_api_update_service_access(plan["guid"], enable_service=False)
+
+
+def _service_plans(entity):
+    service_plans = entity.get("service_plans")
+    if service_plans is not None:  # in cf response there are no service plans, but an url
+        service_plans = [{"guid": sp["metadata"]["guid"], "name": sp["entity"]["name"]} for sp in service_plans]
+    return service_plans
+
+
+def _extra(entity):
+    return json.loads(entity.get("extra") or "{}")
+
+
+class ServiceTypeView(LazyView):
+    """Lazy view of service from Cloud Foundry API services list - extra json is parsed only when needed."""
+
+    __slots__ = ()
+
+    MODEL = ServiceType
+    FIELDS = {
+        "label": lambda data: data["entity"]["label"],
+        "guid": lambda data: data["metadata"]["guid"],
+        "description": lambda data: data["entity"]["description"],
+        "space_guid": lambda data: None,
+        "service_plans": lambda data: _service_plans(data["entity"]),
+        "tags": lambda data: data["entity"].get("tags"),
+        "display_name": lambda data: _extra(data["entity"]).get("displayName"),
+        "image": lambda data: _extra(data["entity"]).get("imageUrl"),
+        "broker_guid": lambda data: data["entity"].get("service_broker_guid"),
+    }
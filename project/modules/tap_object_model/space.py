@@ -15,18 +15,23 @@
 #
 
 import functools
+import operator
 
 from ..tap_logger import get_logger
 from ..test_names import generate_test_object_name
 from ..http_calls import cloud_foundry as cf
 from ..http_calls.platform import user_management
+from .lazy_view import LazyView
 
 logger = get_logger(__name__)
 
 
 @functools.total_ordering
 class Space(object):
+    __slots__ = ("name", "guid", "org_guid")
+
     NAME_PREFIX = "test_space_"
+    _IDENTITY = operator.attrgetter("name", "guid")
 
     def __init__(self, name, guid=None, org_guid=None):
         self.name = name
@@ -37,7 +42,10 @@ class Space(object):
         return "{0} (name={1}, guid={2})".format(self.__class__.__name__, self.name, self.guid)
 
     def __eq__(self, other):
-        return self.name == other.name and self.guid == other.guid
+        return self._IDENTITY(self) == self._IDENTITY(other)
+
+    def __hash__(self):
+        return hash(self._IDENTITY(self))
 
     def __lt__(self, other):
         return self.guid < other.guid
@@ -77,8 +85,11 @@ class Space(object):
     # -------------------------------- cf api -------------------------------- #
 
     @classmethod
-    def cf_api_get_list(cls):
+    def cf_api_get_list(cls, lazy=False):
+        """Get list of spaces from Cloud Foundry API, lazy=True returns list of SpaceView"""
         response = cf.cf_api_get_spaces()
+        if lazy:
+            return SpaceView.from_list(response)
         spaces = []
         for space_data in response:
             org_guid = space_data["entity"]["organization_guid"]
@@ -101,3 +112,16 @@ class Space(object):
 
     def cleanup(self):
         self.cf_api_delete()
+
+
+class SpaceView(LazyView):
+    """Lazy view of space from Cloud Foundry API spaces list."""
+
+    __slots__ = ()
+
+    MODEL = Space
+    FIELDS = {
+        "name": lambda data: data["entity"]["name"],
+        "guid": lambda data: data["metadata"]["guid"],
+        "org_guid": lambda data: data["entity"]["organization_guid"],
+    }
@@ -15,11 +15,13 @@
 #
 
 import functools
+import operator
 
 from retry import retry
 
 from ..http_calls.platform import das, hdfs_uploader
 from ..test_names import generate_test_object_name
+from .lazy_view import LazyView
 
 
 class TransferState(object):
@@ -36,7 +38,11 @@ class TransferError(Exception):
 @functools.total_ordering
 class Transfer(object):
 
+    __slots__ = ("title", "category", "source", "id", "id_in_object_store", "is_public", "state", "timestamps",
+                 "organization_guid", "user_id")
+
     COMPARABLE_ATTRIBUTES = ["category", "id", "is_public", "organization_guid", "source", "state", "title", "user_id"]
+    _IDENTITY = operator.attrgetter(*COMPARABLE_ATTRIBUTES)
 
     def __init__(self, category=None, id=None, id_in_object_store=None, is_public=None, org_guid=None, source=None,
                  state=None, timestamps=None, title=None, user_id=None):
@@ -52,7 +58,10 @@ class Transfer(object):
         self.user_id = user_id
 
     def __eq__(self, other):
-        return all([getattr(self, attribute) == getattr(other, attribute) for attribute in self.COMPARABLE_ATTRIBUTES])
+        return self._IDENTITY(self) == self._IDENTITY(other)
+
+    def __hash__(self):
+        return hash(self._IDENTITY(self))
 
     def __lt__(self, other):
         return self.id < other.id
@@ -80,17 +89,21 @@ class Transfer(object):
 
     @classmethod
     def api_create_by_file_upload(cls, context, org_guid, file_path, category="other", is_public=False, title=None,
-                                  client=None):
+                                  client=None, progress_callback=None):
         title = generate_test_object_name() if title is None else title
         hdfs_uploader.api_create_transfer_by_file_upload(org_guid, source=file_path, category=category,
-                                                         is_public=is_public, title=title, client=client)
+                                                         is_public=is_public, title=title, client=client,
+                                                         progress_callback=progress_callback)
         new_transfer = next(t for t in cls.api_get_list(org_guid_list=[org_guid]) if t.title == title)
         context.transfers.append(new_transfer)
         return new_transfer
 
     @classmethod
-    def api_get_list(cls, org_guid_list=None, client=None):
-        response = das.api_get_transfers(org_guid_list, client=client)
+    def api_get_list(cls, org_guid_list=None, client=None, size=12, lazy=False):
+        """lazy=True returns list of TransferView"""
+        response = das.api_get_transfers(org_guid_list, size=size, client=client)
+        if lazy:
+            return TransferView.from_list(response)
         return [cls._from_api_response(transfer_data) for transfer_data in response]
 
     @classmethod
@@ -113,3 +126,26 @@ class Transfer(object):
         if self.state == TransferState.ERROR:
             raise TransferError("Transfer finished in state: {}".format(TransferState.ERROR))
         assert self.state == TransferState.FINISHED, "Transfer did not finish. State: {}".format(self.state)
+
+
+class TransferView(LazyView):
+    """Lazy view of transfer from das api response."""
+
+    __slots__ = ()
+
+    MODEL = Transfer
+    FIELDS = {
+        "category": lambda data: data["category"],
+        "id": lambda data: data["id"],
+        "id_in_object_store": lambda data: data["idInObjectStore"],
+        "is_public": lambda data: data["publicRequest"],
+        "org_guid": lambda data: data["orgUUID"],
+        "source": lambda data: data["source"],
+        "state": lambda data: data["state"],
+        "timestamps": lambda data: data["timestamps"],
+        "title": lambda data: data["title"],
+        "user_id": lambda data: data["userId"],
+    }
+
+    def __repr__(self):
+        return "{} ({})".format(self.__class__.__name__, self.raw.get("id"))
@@ -0,0 +1,154 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from collections import Counter
+from types import SimpleNamespace
+import unittest
+from unittest import mock
+
+from modules.exceptions import UnexpectedResponseError
+from modules.tap_object_model import DataSet, Organization, Transfer
+from modules.tap_object_model.flows import data_catalog
+from modules.tap_object_model.transfer import TransferError, TransferState
+
+
+class FakeDataCatalog(object):
+    """Transfers and data sets of one organization, with a clock advanced by sleep."""
+
+    def __init__(self, states, listed=None, data_sets=None, get_errors=()):
+        self.states = states  # source -> states returned by successive polls, the last one is repeated
+        self.listed = set(states) if listed is None else listed  # sources of transfers on the transfer list
+        self.data_sets = data_sets or {}  # source -> time when data set of the transfer appears
+        self.get_errors = get_errors  # sources of transfers which cannot be fetched by id
+        self.now = 0
+        self.transfers = {}
+        self.polls = Counter()
+
+    def create(self, context, org_guid, source, category, is_public, client):
+        transfer_id = len(self.transfers) + 1
+        self.transfers[transfer_id] = source
+        return Transfer(id=transfer_id, source=source, title="title-{}".format(source), state=TransferState.NEW)
+
+    def get_list(self, org_guid_list, client, size):
+        return [self._poll(i) for i, source in self.transfers.items() if source in self.listed]
+
+    def get(self, transfer_id, client):
+        if self.transfers[transfer_id] in self.get_errors:
+            raise UnexpectedResponseError(500, "Internal Server Error")
+        return self._poll(transfer_id)
+
+    def get_data_sets(self, transfer_title_list, org_list, client):
+        return [SimpleNamespace(title="title-{}".format(source)) for source, time in self.data_sets.items()
+                if self.now >= time and "title-{}".format(source) in transfer_title_list]
+
+    def sleep(self, interval):
+        self.now += interval
+
+    def _poll(self, transfer_id):
+        source = self.transfers[transfer_id]
+        states = self.states[source]
+        state = states[min(self.polls[transfer_id], len(states) - 1)]
+        self.polls[transfer_id] += 1
+        return Transfer(id=transfer_id, source=source, title="title-{}".format(source), state=state)
+
+
+class TestCreateDatasetsFromLinksBatch(unittest.TestCase):
+    """Unit: create_datasets_from_links_batch."""
+
+    ORG = Organization(name="org", guid="org-guid")
+    NEW = TransferState.NEW
+    FINISHED = TransferState.FINISHED
+
+    def _create(self, catalog, sources):
+        with mock.patch.object(Transfer, "api_create", side_effect=catalog.create), \
+                mock.patch.object(Transfer, "api_get_list", side_effect=catalog.get_list), \
+                mock.patch.object(Transfer, "api_get", side_effect=catalog.get) as mock_get, \
+                mock.patch.object(DataSet, "api_get_matching_to_transfer_list", side_effect=catalog.get_data_sets), \
+                mock.patch.object(data_catalog, "time", SimpleNamespace(time=lambda: catalog.now,
+                                                                        sleep=catalog.sleep)):
+            results = data_catalog.create_datasets_from_links_batch(
+                context=None, org=self.ORG, source_list=sources, timeout=30, data_set_timeout=10, interval=3)
+        return results, mock_get
+
+    def test_results_should_be_in_source_list_order(self):
+        # given
+        catalog = FakeDataCatalog(states={"a": [self.NEW, self.NEW, self.FINISHED], "b": [self.FINISHED]},
+                                  data_sets={"a": 0, "b": 6})
+        # when
+        results, _ = self._create(catalog, ["a", "b"])
+        # then
+        self.assertEqual(["a", "b"], [result.source for result in results])
+        self.assertEqual(["title-a", "title-b"], [result.data_set.title for result in results])
+        self.assertEqual([None, None], [result.error for result in results])
+
+    def test_transfer_finished_with_error_should_be_reported(self):
+        # given
+        catalog = FakeDataCatalog(states={"a": [TransferState.ERROR], "b": [self.FINISHED]}, data_sets={"b": 0})
+        # when
+        results, _ = self._create(catalog, ["a", "b"])
+        # then
+        self.assertIsInstance(results[0].error, TransferError)
+        self.assertIsNone(results[0].data_set)
+        self.assertIsNone(results[1].error)
+
+    def test_transfer_which_did_not_finish_should_time_out(self):
+        # given
+        catalog = FakeDataCatalog(states={"a": [self.NEW], "b": [self.FINISHED]}, data_sets={"b": 0})
+        # when
+        results, _ = self._create(catalog, ["a", "b"])
+        # then
+        self.assertRegex(str(results[0].error), "Transfer did not finish. State: NEW")
+        self.assertGreater(catalog.now, 30)
+        self.assertIsNone(results[1].error)
+
+    def test_data_set_which_did_not_appear_should_time_out(self):
+        # given
+        catalog = FakeDataCatalog(states={"a": [self.FINISHED], "b": [self.FINISHED]}, data_sets={"b": 0})
+        # when
+        results, _ = self._create(catalog, ["a", "b"])
+        # then
+        self.assertEqual(results[0].transfer.state, self.FINISHED)
+        self.assertRegex(str(results[0].error), "Dataset title-a was not found")
+        self.assertGreater(catalog.now, 10)
+        self.assertLess(catalog.now, 30)
+        self.assertIsNone(results[1].error)
+
+    def test_transfer_missing_from_list_should_be_fetched_by_id(self):
+        # given
+        catalog = FakeDataCatalog(states={"a": [self.FINISHED], "b": [self.FINISHED]}, listed={"b"},
+                                  data_sets={"a": 0, "b": 0})
+        # when
+        results, mock_get = self._create(catalog, ["a", "b"])
+        # then
+        self.assertEqual([None, None], [result.error for result in results])
+        mock_get.assert_called_once_with(1, client=None)
+
+    def test_polling_error_should_be_reported_per_item(self):
+        # given
+        catalog = FakeDataCatalog(states={"a": [self.FINISHED], "b": [self.FINISHED]}, listed={"b"},
+                                  data_sets={"a": 0, "b": 0}, get_errors={"a"})
+        # when
+        results, _ = self._create(catalog, ["a", "b"])
+        # then
+        self.assertIsInstance(results[0].error, UnexpectedResponseError)
+        self.assertEqual(self.NEW, results[0].transfer.state)
+        self.assertEqual("title-b", results[1].data_set.title)
+        self.assertIsNone(results[1].error)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+from unittest import mock
+
+from modules.tap_object_model import Organization, ServiceType
+from modules.tap_object_model.organization import OrganizationView
+from modules.tap_object_model.service_type import ServiceTypeView
+
+
+class TestLazyView(unittest.TestCase):
+    """Unit: LazyView."""
+
+    ORG_RESPONSE = {"metadata": {"guid": "org-guid"}, "entity": {"name": "org-name"}}
+    SERVICE_RESPONSE = {"metadata": {"guid": "service-guid"},
+                        "entity": {"label": "label", "description": "description", "tags": ["tag"],
+                                   "extra": '{"displayName": "Service", "imageUrl": "image"}'}}
+
+    def test_fields_should_be_decoded_on_access(self):
+        # given
+        view = OrganizationView(self.ORG_RESPONSE)
+        # then
+        self.assertIsNone(view._decoded)
+        self.assertEqual("org-name", view.name)
+        self.assertEqual({"name": "org-name"}, view._decoded)
+
+    def test_decoded_fields_should_be_cached(self):
+        # given
+        view = ServiceTypeView(self.SERVICE_RESPONSE)
+        # when
+        with mock.patch("modules.tap_object_model.service_type._extra", return_value={"displayName": "x"}) as extra:
+            view.display_name
+            view.display_name
+        # then
+        extra.assert_called_once_with(self.SERVICE_RESPONSE["entity"])
+
+    def test_unknown_field_should_raise_attribute_error(self):
+        # given
+        view = OrganizationView(self.ORG_RESPONSE)
+        # then
+        self.assertRaises(AttributeError, getattr, view, "kitten")
+
+    def test_materialize_should_return_model_object(self):
+        # when
+        service_type = ServiceTypeView(self.SERVICE_RESPONSE).materialize()
+        # then
+        self.assertEqual(ServiceType._from_details(space_guid=None, details=self.SERVICE_RESPONSE), service_type)
+        self.assertEqual("Service", service_type.display_name)
+        self.assertEqual("image", service_type.image)
+
+    def test_model_should_be_hashable_and_slotted(self):
+        # given
+        organization = OrganizationView(self.ORG_RESPONSE).materialize()
+        # then
+        self.assertEqual({Organization("org-name", "org-guid")}, {organization})
+        self.assertRaises(AttributeError, setattr, organization, "kitten", True)
+
+
+if __name__ == '__main__':
+    unittest.main()
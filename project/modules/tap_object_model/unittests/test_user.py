@@ -0,0 +1,55 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+from unittest import mock
+
+from modules.exceptions import NoSuchUserException
+from modules.tap_object_model import User
+
+
+class TestUser(unittest.TestCase):
+    """Unit: User."""
+
+    USERS = [{"metadata": {"guid": "guid-{}".format(i)}, "entity": {"username": "user-{}".format(i)}}
+             for i in range(2)]
+
+    @mock.patch("modules.tap_object_model.user.cf.cf_api_get_users")
+    def test_cf_api_get_user_should_return_user_with_username(self, mock_get_users):
+        # given
+        mock_get_users.return_value = self.USERS[1:]
+        # when
+        user = User.cf_api_get_user("user-1")
+        # then
+        self.assertEqual("guid-1", user.guid)
+        mock_get_users.assert_called_once_with(username="user-1")
+
+    @mock.patch("modules.tap_object_model.user.cf.cf_api_get_users")
+    def test_cf_api_get_user_should_raise_exception_if_user_does_not_exist(self, mock_get_users):
+        # given
+        mock_get_users.return_value = []
+        # then
+        self.assertRaises(NoSuchUserException, User.cf_api_get_user, "user-2")
+
+    @mock.patch("modules.tap_object_model.user.cf.cf_api_get_users")
+    def test_cf_api_get_user_should_require_username(self, mock_get_users):
+        # then
+        self.assertRaisesRegex(ValueError, "username has to be supplied", User.cf_api_get_user, None)
+        mock_get_users.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
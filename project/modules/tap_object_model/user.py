@@ -15,6 +15,7 @@
 #
 
 import functools
+import operator
 import random
 import string
 
@@ -24,14 +25,19 @@ from ..http_calls import cloud_foundry as cf
 from ..http_calls.platform import user_management
 from ..http_client.configuration_provider.console_no_auth import ConsoleNoAuthConfigurationProvider
 from ..http_client.http_client_factory import HttpClientFactory
+from ..http_client.http_client_pool import HttpClientPool
 from ..http_client.configuration_provider.console import ConsoleConfigurationProvider
 from ..test_names import generate_test_object_name
+from .lazy_view import LazyView
 
 
 @functools.total_ordering
 class User(object):
 
+    __slots__ = ("guid", "username", "password", "org_roles", "space_roles", "client", "client_configuration")
+
     __ADMIN = None
+    _IDENTITY = operator.attrgetter("username", "guid")
 
     ORG_ROLES = {
         "manager": {"managers"},
@@ -57,13 +63,13 @@ class User(object):
         return "{} (username={}, guid={})".format(self.__class__.__name__, self.username, self.guid)
 
     def __eq__(self, other):
-        return self.username == other.username and self.guid == other.guid
+        return self._IDENTITY(self) == self._IDENTITY(other)
 
     def __lt__(self, other):
         return self.guid < other.guid
 
     def __hash__(self):
-        return hash((self.guid, self.username))
+        return hash(self._IDENTITY(self))
 
     @staticmethod
     def generate_password(length=20):
@@ -125,9 +131,19 @@ class User(object):
     def login(self):
         """Return a logged-in API client for this user."""
         self.client_configuration = ConsoleConfigurationProvider.get(self.username, self.password)
-        self.client = HttpClientFactory.get(self.client_configuration)
+        self.client = HttpClientPool.checkout(self.client_configuration)
         return self.client
 
+    @classmethod
+    def login_all(cls, users):
+        """Log in users concurrently and return their API clients, in the same order."""
+        configurations = [ConsoleConfigurationProvider.get(user.username, user.password) for user in users]
+        clients = HttpClientPool.warm_up(configurations)
+        for user, configuration, client in zip(users, configurations, clients):
+            user.client_configuration = configuration
+            user.client = client
+        return clients
+
     def get_client(self):
         """Return API client for this user."""
         if self.client is not None:
@@ -167,14 +183,19 @@ class User(object):
         return users
 
     @classmethod
-    def cf_api_get_all_users(cls):
-        response = cf.cf_api_get_users()
+    def cf_api_get_all_users(cls, lazy=False, username=None):
+        """Get list of all users from Cloud Foundry API, lazy=True returns list of UserView"""
+        response = cf.cf_api_get_users(username=username)
+        if lazy:
+            return UserView.from_list(response)
         return cls._get_user_list_from_cf_api_response(response)
 
     @classmethod
     def cf_api_get_user(cls, username):
-        users = User.cf_api_get_all_users()
-        user = next((user for user in users if user.username == username), None)
+        if username is None:
+            raise ValueError("username has to be supplied, use cf_api_get_all_users to get all users")
+        users = User.cf_api_get_all_users(username=username)
+        user = next(iter(users), None)
         if not user:
             raise NoSuchUserException(username)
         return user
@@ -186,3 +207,17 @@ class User(object):
 
     def cleanup(self):
         cf.cf_api_delete_user(self.guid)
+        if self.client_configuration is not None:
+            HttpClientPool.remove(self.client_configuration)
+
+
+class UserView(LazyView):
+    """Lazy view of user from Cloud Foundry API users list."""
+
+    __slots__ = ()
+
+    MODEL = User
+    FIELDS = {
+        "guid": lambda data: data["metadata"].get("guid"),
+        "username": lambda data: data["entity"].get("username"),
+    }
@@ -15,12 +15,22 @@
 #
 
 from datetime import datetime
+import itertools
+import os
 import re
 import socket
 
 import config
 
 
+_NAME_COUNTER = itertools.count()
+
+
+def worker_id():
+    """Return id of pytest-xdist worker running tests in this process (e.g. gw0), None if tests are not parallel."""
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
 def is_test_object_name(name):
     """Return True if object's name matches pattern for test names, False otherwise."""
     if name is None:
@@ -30,13 +40,20 @@ def is_test_object_name(name):
 
 
 def generate_test_object_name(email=False, short=False, prefix=None):
-    """Return string with hostname/prefix and date for use as name of test org, user, transfer, etc."""
-    # TODO add global counter
+    """
+    Return string with hostname/prefix and date for use as name of test org, user, transfer, etc.
+    Names generated in parallel test processes include worker id, and a counter distinguishes names generated
+    within the same second (or microsecond).
+    """
     str_format = "%Y%m%d_%H%M%S" if short else "%Y%m%d_%H%M%S_%f"
     now = datetime.now().strftime(str_format)
     name_format = config.test_user_email.replace('@', '+{}_{}@') if email else "{}_{}"
     if prefix is None:
         prefix = socket.gethostname().replace("-", "_").lower()
+    worker = worker_id()
+    if worker is not None:
+        prefix = "{}_{}".format(prefix, worker)
+    prefix = "{}_{}".format(prefix, next(_NAME_COUNTER))
     return name_format.format(prefix, now)
 
 
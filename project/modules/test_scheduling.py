@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from collections import namedtuple, OrderedDict
+import heapq
+import statistics
+
+
+Shard = namedtuple("Shard", ["index", "predicted_duration", "nodeids"])
+
+
+def work_scope(nodeid):
+    """
+    Return id of the unit of work the test belongs to - its class, or its module for tests outside classes.
+    Tests from one unit are run by one worker, so that class- and module-scoped fixtures are created once and
+    tests in incremental classes run in order.
+    """
+    path = nodeid.split("[", 1)[0]  # drop parameter ids, they may contain anything
+    parts = [part for part in path.split("::") if part != "()"]  # "()" is instance node in older pytest ids
+    if len(parts) > 2:
+        return "::".join(parts[:2])
+    return parts[0]
+
+
+def work_units(nodeids) -> OrderedDict:
+    """Return OrderedDict work scope -> nodeids of tests in the scope, in collection order."""
+    units = OrderedDict()
+    for nodeid in nodeids:
+        units.setdefault(work_scope(nodeid), []).append(nodeid)
+    return units
+
+
+def predict_durations(nodeids, history: dict, default_duration) -> dict:
+    """
+    Return dict nodeid -> predicted duration, which is median of historical durations of the test.
+    Tests without history are predicted to take median of predictions for other tests, or default_duration.
+    """
+    predicted = {nodeid: statistics.median(history[nodeid]) for nodeid in nodeids if history.get(nodeid)}
+    if predicted:
+        default_duration = statistics.median(predicted.values())
+    return {nodeid: predicted.get(nodeid, default_duration) for nodeid in nodeids}
+
+
+def split_into_shards(nodeids, durations: dict, shard_count) -> list:
+    """
+    Split tests into shards of balanced predicted duration, using longest-processing-time-first: work units, from
+    the longest, are assigned one by one to the shard with the lowest predicted duration so far.
+    Tests of one unit are kept together in collection order, units in a shard are ordered from the longest.
+    """
+    unit_durations = [(sum(durations[nodeid] for nodeid in unit), scope, unit)
+                      for scope, unit in work_units(nodeids).items()]
+    unit_durations.sort(key=lambda unit: (-unit[0], unit[1]))
+    shards = [Shard(index=index, predicted_duration=0, nodeids=[]) for index in range(shard_count)]
+    heap = [(0, index) for index in range(shard_count)]
+    for duration, _, unit in unit_durations:
+        total, index = heapq.heappop(heap)
+        shards[index].nodeids.extend(unit)
+        heapq.heappush(heap, (total + duration, index))
+    for total, index in heap:
+        shards[index] = shards[index]._replace(predicted_duration=total)
+    return shards
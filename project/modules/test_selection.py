@@ -0,0 +1,84 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from collections import OrderedDict
+
+from .constants import TapComponent
+from .test_scheduling import work_units
+
+
+PLATFORM_VERSION_KEYS = ("platform_version", "cf_version", "cdh_version")
+APPLICATION_VERSION_KEYS = ("version", "image", "updated_at")
+TAP_COMPONENT_NAMES = frozenset(c.name for c in TapComponent)
+
+
+def component_versions(snapshot) -> dict:
+    """
+    Return dict name -> version of the platform itself (platform, cf and cdh version) and of each TapComponent
+    application found in the platform snapshot.
+    """
+    versions = {key: getattr(snapshot, key) for key in PLATFORM_VERSION_KEYS}
+    component_names = {c.value: c.name for c in TapComponent}
+    for application in snapshot.applications or []:
+        name = component_names.get(application.get("name"))
+        if name is not None:
+            versions[name] = next((str(application[key]) for key in APPLICATION_VERSION_KEYS
+                                   if application.get(key) is not None), None)
+    return versions
+
+
+def changed_components(previous: dict, current: dict):
+    """
+    Return set of names of TapComponents which were added, removed or changed version between two results of
+    component_versions. Return None, which means that any component could have changed, if there is no previous
+    result or the platform version changed.
+    """
+    if previous is None or any(previous.get(key) != current.get(key) for key in PLATFORM_VERSION_KEYS):
+        return None
+    names = (set(previous) | set(current)) & TAP_COMPONENT_NAMES
+    return {name for name in names if previous.get(name) != current.get(name)}
+
+
+def marked_components(item) -> set:
+    """Return names of TapComponents the test item is marked with."""
+    return {name for name in TAP_COMPONENT_NAMES if item.get_marker(name) is not None}
+
+
+def select_tests(components: OrderedDict, changed: set, smoke_prefixes=()) -> tuple:
+    """
+    Select tests affected by changed components.
+    components -- OrderedDict nodeid -> names of TapComponents the test is marked with, in collection order
+    changed -- names of changed components, None if any component could have changed
+    smoke_prefixes -- tests with nodeid starting with any of them are always selected
+    Tests without component markers are always selected. Tests of one class (or module) are selected together,
+    so that incremental classes are not broken.
+    Return list of selected nodeids and dict nodeid -> reason why the test was not selected.
+    """
+    if changed is None:
+        return list(components), {}
+    selected = []
+    reasons = {}
+    for unit_nodeids in work_units(components).values():
+        if any(_is_affected(nodeid, components[nodeid], changed, smoke_prefixes) for nodeid in unit_nodeids):
+            selected.extend(unit_nodeids)
+        else:
+            for nodeid in unit_nodeids:
+                reasons[nodeid] = "none of its components changed: {}".format(", ".join(sorted(components[nodeid])))
+    return selected, reasons
+
+
+def _is_affected(nodeid, components, changed, smoke_prefixes):
+    return nodeid.startswith(tuple(smoke_prefixes)) or len(components) == 0 or len(components & changed) > 0
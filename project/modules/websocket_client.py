@@ -78,5 +78,10 @@ class WebsocketClient:
     def send(self, msg):
         asyncio.get_event_loop().run_until_complete(self._send(msg))
 
+    @asyncio.coroutine
+    def send_async(self, msg):
+        """Coroutine sending a message - use it to send through many connections on one event loop."""
+        yield from self._send(msg)
+
     def recieve(self):
         return asyncio.get_event_loop().run_until_complete(self._recieve())
@@ -14,20 +14,34 @@
 # limitations under the License.
 #
 
+import time
+
 import pytest
-import requests
 
 import config
 from modules.constants import Path, ParametrizedService
-from modules.mongo_reporter.reporter import MongoReporter
+from modules.http_calls.platform import user_management
+from modules.http_client.cassette import Cassette
+from modules.http_client.configuration_provider.console import ConsoleConfigurationProvider
+from modules.http_client.http_client_factory import HttpClientFactory
+from modules.http_client.http_client_pool import HttpClientPool
+from modules.plan_matrix import get_marketplace
 from modules.tap_logger import get_logger
-from modules.tap_object_model import ServiceType
 import tests.fixtures.fixtures as fixtures
+import tests.fixtures.health_probe as health_probe
+from tests.fixtures.parallel import is_controller
 
 pytest_plugins = ["tests.fixtures.context",
                   "tests.fixtures.db_logging",
                   "tests.fixtures.fixtures",
-                  "tests.fixtures.remote_logging"]
+                  "tests.fixtures.health_probe",
+                  "tests.fixtures.impact_selection",
+                  "tests.fixtures.parallel",
+                  "tests.fixtures.remote_logging",
+                  "tests.fixtures.request_timing",
+                  "tests.fixtures.resource_profiling",
+                  "tests.fixtures.sharding",
+                  "tests.fixtures.cassette"]
 
 
 logger = get_logger(__name__)
@@ -38,13 +52,45 @@ INCREMENTAL_KEYWORD = "incremental"
 
 def pytest_sessionstart(session):
     """ Check environment viability. If the check fails, don't start test session. """
-    try:
-        requests.get(config.console_url, verify=config.ssl_validation).raise_for_status()
-        cf_api_url = "{}/info".format(config.cf_api_url_full)
-        requests.get(cf_api_url, verify=config.ssl_validation).raise_for_status()
-    except requests.HTTPError as e:
-        logger.error("Environment {} is unavailable - status {}".format(config.console_url, e.response.status_code))
-        raise
+    if session.config.option.collectonly:
+        return
+    if config.cassette_mode != Cassette.REPLAY:
+        health_probe.probe_environment(session.config)
+    if is_controller(session.config):
+        return  # tests are run by xdist workers
+    HttpClientPool.warm_up([ConsoleConfigurationProvider.get()] +
+                           [ConsoleConfigurationProvider.get(username, password)
+                            for username, password in config.client_pool_users])
+    if config.cassette_mode is None:
+        # keepalive requests would make recorded interactions depend on timing
+        HttpClientPool.start_keepalive(interval=config.client_pool_keepalive_interval,
+                                       ping=lambda client: user_management.api_get_organizations(client=client))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    HttpClientPool.stop_keepalive()
+    _log_http_client_statistics()
+
+
+def _log_http_client_statistics(limit=10):
+    """Log clients which spent most time on requests."""
+    statistics = sorted(HttpClientFactory.statistics().items(), key=lambda item: item[1].total_time, reverse=True)
+    logger.info("==================== http client statistics ====================")
+    for configuration, client_statistics in statistics[:limit]:
+        logger.info("{}: {} requests ({} failed), sent {} B, received {} B, total {:.2f}s, mean {:.3f}s, "
+                    "max {:.3f}s".format(configuration, client_statistics.request_count,
+                                         client_statistics.error_count, client_statistics.bytes_sent,
+                                         client_statistics.bytes_received, client_statistics.total_time,
+                                         client_statistics.mean_time, client_statistics.max_time))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection(session):
+    """Measure how long it takes to import test modules and collect tests."""
+    start_time = time.perf_counter()
+    yield
+    session.config.collection_time = time.perf_counter() - start_time
+    logger.info("Collected {} tests in {:.2f}s".format(len(session.items), session.config.collection_time))
 
 
 def pytest_collection_finish(session):
@@ -67,6 +113,7 @@ def pytest_runtest_makereport(item, call):
     report = outcome.get_result()
 
     if config.database_url is not None:
+        from modules.mongo_reporter.reporter import MongoReporter  # pymongo is slow to import, so only if needed
         mongo_reporter = MongoReporter(mongo_uri=config.database_url, run_id=config.test_run_id)
         mongo_reporter.log_report(report, item)
 
@@ -92,8 +139,9 @@ def pytest_runtest_logstart(nodeid, location):
 def pytest_generate_tests(metafunc):
     """Parametrize marketplace fixture with tuples of ServiceType and plan dict."""
     if "non_parametrized_marketplace_services" in metafunc.funcargnames:
-        core_space = fixtures.core_space()
-        marketplace = ServiceType.api_get_list_from_marketplace(space_guid=core_space.guid)
+        # cached, so that tests are parametrized the same way in all test processes without listing marketplace again
+        max_age = config.marketplace_cache_max_age if config.cassette_mode is None else 0
+        marketplace = get_marketplace(lambda: fixtures.core_space().guid, config.marketplace_cache_path, max_age)
         test_cases = []
         ids = []
         for service_type in marketplace:
@@ -0,0 +1,47 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+import config
+from modules.http_client.cassette import Cassette
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """Activate cassette before any request is sent, including environment checks."""
+    if config.cassette_mode is not None:
+        Cassette.activate(Cassette(config.cassette_path, config.cassette_mode))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    cassette = Cassette.active()
+    if cassette is not None and cassette.mode == Cassette.RECORD:
+        cassette.save()
+
+
+def pytest_unconfigure(config):
+    """Deactivate cassette after session finished, replayed sessions sleep again."""
+    Cassette.deactivate()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report requests which were not found in replayed cassette."""
+    cassette = Cassette.active()
+    if cassette is None or not cassette.unmatched:
+        return
+    terminalreporter.write_sep("=", "requests not recorded in cassette {}".format(cassette.path))
+    for key in sorted(set(cassette.unmatched)):
+        terminalreporter.write_line("{} x{}".format(key, cassette.unmatched.count(key)))
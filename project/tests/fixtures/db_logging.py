@@ -17,18 +17,41 @@
 import pytest
 
 import config
-from modules.mongo_reporter.reporter import MongoReporter
+from .parallel import is_controller, worker_input
 
 
 @pytest.fixture(scope="session", autouse=True)
 def log_test_run_in_database(request):
     if config.database_url is not None:
+        from modules.mongo_reporter.reporter import MongoReporter  # pymongo is slow to import, so only if needed
+        parallel_run = worker_input(request.config)
+        if parallel_run is not None:
+            config.test_run_id = parallel_run["test_run_id"]
         mongo_reporter = MongoReporter(mongo_uri=config.database_url, run_id=config.test_run_id)
         mongo_reporter.on_run_start(environment=config.tap_domain,
                                     environment_version=config.appstack_version,
-                                    platform_components=[],
-                                    tests_to_run_count=len(request.session.items))
+                                    platform_components=getattr(request.config, "platform_components", []),
+                                    tests_to_run_count=len(request.session.items),
+                                    collection_time=getattr(request.config, "collection_time", None))
 
-        def finalizer():
-            mongo_reporter.on_run_end()
-        request.addfinalizer(finalizer)
\ No newline at end of file
+        # in parallel run, the run is ended by xdist controller when all workers are done
+        if parallel_run is None:
+            def finalizer():
+                mongo_reporter.on_run_end()
+            request.addfinalizer(finalizer)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Send test run id to xdist worker, so that all workers report results to the same run document."""
+    if config.database_url is not None:
+        if config.test_run_id is None:
+            from bson import ObjectId
+            config.test_run_id = str(ObjectId())
+        worker_input(node)["test_run_id"] = config.test_run_id
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if config.database_url is not None and is_controller(session.config) and config.test_run_id is not None:
+        from modules.mongo_reporter.reporter import MongoReporter
+        MongoReporter(mongo_uri=config.database_url, run_id=config.test_run_id).on_run_end()
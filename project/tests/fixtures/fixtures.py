@@ -15,6 +15,7 @@
 #
 
 import base64
+import functools
 import os
 import io
 
@@ -28,9 +29,11 @@ from modules.exceptions import UnexpectedResponseError
 from modules.http_calls import cloud_foundry as cf
 from modules.http_client.configuration_provider.console import ConsoleConfigurationProvider
 from modules.http_client.http_client_factory import HttpClientFactory
+from modules.plan_matrix import PlanMatrix
 from modules.tap_logger import log_fixture, log_finalizer
-from modules.tap_object_model import Application, Organization, ServiceType, ServiceInstance, Space, User
-from modules.tap_object_model.flows import data_catalog
+from modules.tap_object_model import Application, Organization, ServiceBinding, ServiceType, ServiceInstance, Space, \
+    User
+from modules.tap_object_model.flows import data_catalog, services
 from .context import Context
 from .test_data import TestData
 
@@ -44,6 +47,20 @@ from .test_data import TestData
 @pytest.fixture(scope="session")
 @retry(UnexpectedResponseError, tries=3, delay=15)
 def test_org(request):
+    lease = _lease_from_resource_pool()
+    if lease is not None:
+        log_fixture("test_org: Lease test organization from resource pool")
+        TestData.pool_lease = lease
+        TestData.test_org = lease.org
+        stop_renewing = _resource_pool().keep_leased(lease)
+
+        def release():
+            log_finalizer("test_org: Return test organization to resource pool")
+            stop_renewing.set()
+            _resource_pool().release(lease)
+        request.addfinalizer(release)
+        return lease.org
+
     context = Context()
     log_fixture("test_org: Create test organization")
     test_org = Organization.api_create(context)
@@ -60,6 +77,9 @@ def test_org(request):
 
 @pytest.fixture(scope="session")
 def test_space(request, test_org):
+    if TestData.pool_lease is not None:
+        TestData.test_space = TestData.pool_lease.space
+        return TestData.test_space
     log_fixture("test_space: Create test space")
     TestData.test_space = Space.api_create(test_org)
     return TestData.test_space
@@ -95,6 +115,11 @@ def login_to_cf(test_org, test_space):
 
 @pytest.fixture(scope="class")
 def sample_python_app(request, test_org, test_space):
+    pooled_app = _unchanged_pooled_sample_app(test_space)
+    if pooled_app is not None:
+        log_fixture("sample_python_app: Use sample app leased with test organization")
+        cf.cf_login(test_org.name, test_space.name)
+        return pooled_app
     context = Context()
     log_fixture("sample_python_app: Push app to cf")
     cf.cf_login(test_org.name, test_space.name)
@@ -170,10 +195,9 @@ def admin_client():
 def space_users_clients(request, test_org, test_space, admin_client):
     context = Context()
     log_fixture("clients: Create clients")
-    clients = {}
-    for role, value in User.SPACE_ROLES.items():
-        clients[role] = User.api_create_by_adding_to_space(context, org_guid=test_org.guid, space_guid=test_space.guid,
-                                                           roles=value).login()
+    users = {role: User.api_create_by_adding_to_space(context, org_guid=test_org.guid, space_guid=test_space.guid,
+                                                      roles=value) for role, value in User.SPACE_ROLES.items()}
+    clients = dict(zip(users.keys(), User.login_all(list(users.values()))))
     clients["admin"] = admin_client
 
     def fin():
@@ -214,12 +238,75 @@ def core_space():
     return TestData.core_space
 
 
+@pytest.fixture(scope="module")
+def marketplace_plan_matrix(request, core_org, core_space):
+    """
+    Create and delete instances of all marketplace (service, plan) pairs which parametrize tests of the module
+    concurrently, so that each parametrized test only waits for the result of its own pair.
+    """
+    log_fixture("marketplace_plan_matrix: Create and delete instances of all marketplace plans")
+    context = Context()
+    request.addfinalizer(context.cleanup)
+    matrix = PlanMatrix(lifecycle=functools.partial(services.create_instance_then_delete_instance, context,
+                                                    core_org.guid, core_space.guid))
+    request.addfinalizer(matrix.shutdown)
+    for item in request.session.items:
+        params = getattr(getattr(item, "callspec", None), "params", {})
+        if item.module is request.module and "non_parametrized_marketplace_services" in params:
+            matrix.submit(*params["non_parametrized_marketplace_services"])
+    return matrix
+
+
 @pytest.fixture(scope="session")
 def test_marketplace(test_space):
     log_finalizer("test_marketplace: Get list of marketplace services in test space")
     return ServiceType.api_get_list_from_marketplace(space_guid=test_space.guid)
 
 
+def get_or_create_service_instance(instances: list, test_org, test_space, service_label, name, service_plan_name):
+    """
+    Return service instance leased from resource pool with test organization, if there is one with this label and
+    name. Otherwise create the instance and append it to instances, which are torn down by the caller.
+    """
+    if TestData.pool_lease is not None:
+        instance = next((i for i in TestData.pool_lease.service_instances
+                         if i.name == name and i.service_label == service_label), None)
+        if instance is not None:
+            return instance
+    instance = ServiceInstance.api_create_with_plan_name(org_guid=test_org.guid, space_guid=test_space.guid,
+                                                         service_label=service_label, name=name,
+                                                         service_plan_name=service_plan_name)
+    instances.append(instance)
+    return instance
+
+
+def _unchanged_pooled_sample_app(test_space):
+    """
+    Return sample app leased from resource pool, if it's still running and has no bindings. Tests of other classes
+    may have deleted the app or left bindings, then None is returned and a fresh app has to be pushed.
+    """
+    if TestData.pool_lease is None or not TestData.pool_lease.apps:
+        return None
+    app = TestData.pool_lease.apps[0]
+    current = next((a for a in Application.api_get_list(test_space.guid) if a.guid == app.guid), None)
+    if current is None or not current.is_started or len(ServiceBinding.api_get_list(app.guid)) > 0:
+        log_fixture("sample_python_app: Sample app leased with test organization was changed by tests")
+        return None
+    return app
+
+
+def _resource_pool():
+    from modules.resource_pool import ResourcePool  # pymongo is slow to import, so only if needed
+    return ResourcePool()
+
+
+def _lease_from_resource_pool():
+    """Return lease of test organization from resource pool, None if pool is not configured or empty."""
+    if config.resource_pool_size is None or config.database_url is None:
+        return None
+    return _resource_pool().lease()
+
+
 def delete_or_not_found(delete_method, *args, **kwargs):
     try:
         delete_method(*args, **kwargs)
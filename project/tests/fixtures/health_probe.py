@@ -0,0 +1,83 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+import config
+from modules.health_probe import application_probes, endpoint_probes, EnvironmentUnavailableException, \
+    format_matrix, run_probes, TCP, unhealthy_components
+from modules.tap_logger import get_logger
+from modules.test_selection import marked_components
+
+
+logger = get_logger(__name__)
+
+
+def _core_space_probes():
+    from modules.tap_object_model import Application, Space
+    try:
+        core_space = next(s for s in Space.cf_api_get_list() if s.name == config.core_space_name)
+        return application_probes(Application.cf_api_get_list_by_space(core_space.guid))
+    except Exception as e:
+        logger.warning("Cannot list core space applications, their health is not checked: {}".format(e))
+        return [], []
+
+
+def _check_critical(results):
+    critical = [r for r in results if r.probe.critical and not r.is_healthy]
+    if len(critical) > 0:
+        _log_matrix(results)
+        raise EnvironmentUnavailableException(", ".join("{} ({})".format(r.probe.name, r.detail) for r in critical))
+
+
+def _log_matrix(results):
+    logger.info("==================== environment health ====================")
+    for line in format_matrix(results):
+        logger.info(line)
+
+
+def probe_environment(pytest_config):
+    """
+    Check configured endpoints and core space applications concurrently and log component health matrix.
+    Endpoints needed by all tests are checked first, and EnvironmentUnavailableException is raised if any of them is
+    unhealthy, before core space applications are listed.
+    """
+    probes = endpoint_probes()
+    results = run_probes([p for p in probes if p.critical], config.health_probe_timeout)
+    _check_critical(results)
+    if config.health_probe:
+        app_probes, app_results = _core_space_probes()
+        results += app_results
+        results += run_probes([p for p in probes if not p.critical] + app_probes, config.health_probe_timeout)
+    _log_matrix(results)
+    if any(r.probe.kind == TCP and not r.is_healthy for r in results):
+        logger.warning("Logsearch is unavailable, logs will not be collected")
+        config.collect_logsearch_logs = False
+    pytest_config.unhealthy_components = unhealthy_components(results)
+
+
+def pytest_collection_modifyitems(session, items):
+    """Skip tests marked with components which are unhealthy, so that they don't fail after long retries."""
+    unhealthy = getattr(session.config, "unhealthy_components", {})
+    if not config.health_probe_skip_unhealthy or len(unhealthy) == 0:
+        return
+    skipped = 0
+    for item in items:
+        reasons = [unhealthy[name] for name in sorted(marked_components(item)) if name in unhealthy]
+        if len(reasons) > 0:
+            item.add_marker(pytest.mark.skip(reason="; ".join(reasons)))
+            skipped += 1
+    logger.info("Skipping {} tests of unhealthy components: {}".format(skipped, ", ".join(sorted(unhealthy))))
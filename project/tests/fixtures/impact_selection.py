@@ -0,0 +1,72 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Test impact selection - after a deployment, run only tests of platform components which changed, e.g.
+    PT_IMPACT_SELECTION=True ./run_tests.sh tests/test_functional
+compares component versions from the current platform snapshot with the ones saved by the latest passed run in
+database, so tests of components changed since then are run until they pass.
+"""
+
+from collections import OrderedDict
+import time
+
+import pytest
+
+import config
+from modules.tap_logger import get_logger
+from modules.test_selection import changed_components, component_versions, marked_components, select_tests
+
+
+logger = get_logger(__name__)
+
+
+def _previous_versions():
+    if config.database_url is None:
+        logger.warning("Database url is not configured, there are no previous runs to compare with")
+        return None, None
+    from modules.mongo_reporter.reporter import PlatformComponentsHistory  # pymongo is slow to import
+    return PlatformComponentsHistory(mongo_uri=config.database_url).get_previous(config.tap_domain)
+
+
+@pytest.hookimpl(tryfirst=True)  # before tests are split into shards
+def pytest_collection_modifyitems(session, items):
+    if not config.impact_selection:
+        return
+    start_time = time.time()
+    from modules.tap_object_model import PlatformSnapshot
+    try:
+        current = component_versions(PlatformSnapshot.api_get_version())
+    except Exception as e:
+        logger.warning("Cannot get platform snapshot, all tests are selected: {}".format(e))
+        return
+    # saved with the run by MongoReporter, to be compared with by the next run
+    session.config.platform_components = [{"name": name, "version": version}
+                                          for name, version in sorted(current.items())]
+    previous_run_id, previous = _previous_versions()
+    changed = changed_components(previous, current)
+    if changed is None:
+        logger.info("No passed run to compare with or platform version changed, all tests are selected")
+        return
+    logger.info("Components changed since run {}: {}".format(previous_run_id, ", ".join(sorted(changed)) or "none"))
+    components = OrderedDict((item.nodeid, marked_components(item)) for item in items)
+    selected, reasons = select_tests(components, changed, config.impact_smoke_tests)
+    for nodeid, reason in reasons.items():
+        logger.info("Deselected {}: {}".format(nodeid, reason))
+    selected = set(selected)
+    session.config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in selected])
+    items[:] = [item for item in items if item.nodeid in selected]
+    logger.info("Selected {} of {} tests in {:.2f}s".format(len(items), len(components), time.time() - start_time))
@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Support for running tests in parallel with pytest-xdist, e.g. py.test -n 4.
+Each worker creates its own session-scoped resources (test org, space, users), names of created objects include
+worker id. Tests are distributed in units of whole classes (see modules.test_scheduling.work_scope).
+"""
+
+import pytest
+
+import config
+from modules.test_scheduling import work_scope
+
+# WorkScopeScheduling overrides private LoadScheduling._send_tests of pytest-xdist 1.17.1, which is pinned in
+# requirements.txt - check the override when upgrading pytest-xdist (from 1.19 LoadScheduling is in xdist.scheduler)
+from xdist.dsession import LoadScheduling
+
+
+def worker_input(pytest_config):
+    """Return data sent by controller to xdist worker (or node in controller), None if not run by xdist worker."""
+    return getattr(pytest_config, "workerinput", None) or getattr(pytest_config, "slaveinput", None)
+
+
+def is_controller(pytest_config):
+    """Return True in the xdist process which distributes tests to workers and does not run them."""
+    return pytest_config.pluginmanager.hasplugin("dsession")
+
+
+class WorkScopeScheduling(LoadScheduling):
+    """Load scheduling which sends tests to workers in whole units of work, for pytest-xdist 1.17.1."""
+
+    def _send_tests(self, node, num):
+        """Send at least num tests, rounded up to the end of work unit of the last one."""
+        end = min(num, len(self.pending))
+        if end > 0:
+            last_scope = work_scope(self.collection[self.pending[end - 1]])
+            while end < len(self.pending) and work_scope(self.collection[self.pending[end]]) == last_scope:
+                end += 1
+        super()._send_tests(node, end)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getvalue("dist") == "load":
+        return WorkScopeScheduling(config, log)
+
+
+def pytest_sessionstart(session):
+    if is_controller(session.config) and config.cassette_mode is not None:
+        raise pytest.UsageError("Cassette can't be recorded or replayed by parallel workers")
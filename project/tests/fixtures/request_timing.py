@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+
+import pytest
+
+import config
+from modules.http_client.client_auth.http_session import HttpSession
+from modules.http_client.request_timing import EndpointHistogramSink, RequestCollectorSink, RequestTimingFileSink
+from modules.test_names import worker_id
+
+SUMMARY_HEADER = "{:<7} {:<70} {:>6} {:>9} {:>8} {:>8} {:>8}"
+SUMMARY_ROW = "{method:<7} {endpoint:<70} {count:>6} {total_time:>9.2f} {p50:>8.3f} {p95:>8.3f} {p99:>8.3f}"
+
+endpoint_histogram = EndpointHistogramSink()
+test_requests = RequestCollectorSink()
+_file_sink = None
+
+
+def pytest_sessionstart(session):
+    global _file_sink
+    HttpSession.add_request_hook(endpoint_histogram)
+    HttpSession.add_request_hook(test_requests)
+    if config.request_timing_file is not None:
+        path = config.request_timing_file
+        if worker_id() is not None:
+            # parallel workers write to separate files, e.g. timing_gw0.csv
+            path = "{1}_{0}{2}".format(worker_id(), *os.path.splitext(path))
+        _file_sink = RequestTimingFileSink(path)
+        HttpSession.add_request_hook(_file_sink)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Attach summary of requests sent by the test to the item, it's saved in test result document."""
+    test_requests.start()
+    yield
+    item.http_requests = test_requests.stop()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    global _file_sink
+    HttpSession.remove_request_hook(endpoint_histogram)
+    HttpSession.remove_request_hook(test_requests)
+    if _file_sink is not None:
+        HttpSession.remove_request_hook(_file_sink)
+        _file_sink.close()
+        _file_sink = None
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Show endpoints which took most time in total, with percentiles of request duration in seconds."""
+    summary = endpoint_histogram.summary()[:config.request_timing_summary_size]
+    if not summary:
+        return
+    terminalreporter.write_sep("=", "slowest http endpoints")
+    terminalreporter.write_line(SUMMARY_HEADER.format("method", "endpoint", "count", "total [s]", "p50", "p95",
+                                                      "p99"))
+    for endpoint_summary in summary:
+        terminalreporter.write_line(SUMMARY_ROW.format(**endpoint_summary))
@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Resource usage of each test phase (setup, call, teardown) - wall and CPU time, time spent sleeping (e.g. in retry),
+HTTP time and request count, peak RSS - is attached to the item and saved in test result document. With
+    PT_PROFILE_THRESHOLD=30 ./run_tests.sh tests/test_functional
+phases are profiled with cProfile and profiles of phases longer than 30 seconds are written to PT_PROFILE_DIRECTORY.
+"""
+
+import contextlib
+
+import pytest
+
+import config
+from modules.resource_profiler import PhaseProfile, ResourceProfiler
+from modules.tap_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+profiler = ResourceProfiler()
+
+
+def pytest_sessionstart(session):
+    if config.resource_profiling:
+        profiler.install()
+
+
+def _profile(item, phase):
+    if config.profile_threshold is None:
+        return contextlib.ExitStack()
+    return PhaseProfile(item.nodeid, phase, config.profile_threshold, config.profile_directory)
+
+
+def _measure(item, phase):
+    if not config.resource_profiling:
+        yield
+        return
+    if not hasattr(item, "resource_usage"):
+        item.resource_usage = {}
+    with _profile(item, phase) as profile:
+        profiler.start()
+        try:
+            yield
+        finally:
+            usage = profiler.stop()
+    item.resource_usage[phase] = usage.to_dict()
+    if getattr(profile, "path", None) is not None:
+        item.resource_usage[phase]["profile"] = profile.path
+        logger.info("{} {} took {:.1f}s, profile saved in {}".format(item.nodeid, phase, usage.wall_time,
+                                                                     profile.path))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    yield from _measure(item, "setup")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    yield from _measure(item, "call")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):
+    yield from _measure(item, "teardown")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if config.resource_profiling:
+        profiler.uninstall()
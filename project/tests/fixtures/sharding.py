@@ -0,0 +1,84 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Split tests into shards of balanced duration, so that they can be run by several test agents at once, e.g.
+    PT_SHARD_COUNT=4 PT_SHARD_MANIFEST=shards.json ./run_tests.sh tests/test_functional --collect-only
+writes manifest of 4 shards, and PT_SHARD_COUNT=4 PT_SHARD_INDEX=0 runs only tests of the first shard.
+"""
+
+import json
+
+import pytest
+
+import config
+from modules.tap_logger import get_logger
+from modules.test_names import worker_id
+from modules.test_scheduling import predict_durations, split_into_shards
+
+
+logger = get_logger(__name__)
+
+
+def pytest_sessionstart(session):
+    if config.shard_count is not None and config.shard_count < 1:
+        raise pytest.UsageError("PT_SHARD_COUNT has to be positive, got {}".format(config.shard_count))
+    if config.shard_index is not None:
+        if config.shard_count is None:
+            raise pytest.UsageError("PT_SHARD_INDEX requires PT_SHARD_COUNT")
+        if not 0 <= config.shard_index < config.shard_count:
+            raise pytest.UsageError("PT_SHARD_INDEX has to be between 0 and {} (PT_SHARD_COUNT - 1), got {}".format(
+                config.shard_count - 1, config.shard_index))
+
+
+def _history(nodeids):
+    if config.database_url is None:
+        logger.warning("Database url is not configured, all tests are predicted to take the same time")
+        return {}
+    from modules.mongo_reporter.reporter import DurationHistory  # pymongo is slow to import, so only if needed
+    return DurationHistory(mongo_uri=config.database_url, history_size=config.shard_history_size).get(nodeids)
+
+
+def _save_manifest(path, shards, durations):
+    manifest = {
+        "shard_count": len(shards),
+        "shards": [{
+            "index": shard.index,
+            "predicted_duration": shard.predicted_duration,
+            "tests": [{"nodeid": nodeid, "predicted_duration": durations[nodeid]} for nodeid in shard.nodeids]
+        } for shard in shards]
+    }
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def pytest_collection_modifyitems(session, items):
+    if config.shard_count is None:
+        return
+    items_by_nodeid = {item.nodeid: item for item in items}
+    nodeids = [item.nodeid for item in items]
+    durations = predict_durations(nodeids, _history(nodeids), config.shard_default_duration)
+    shards = split_into_shards(nodeids, durations, config.shard_count)
+    for shard in shards:
+        logger.info("Shard {}: {} tests, predicted duration {:.0f}s".format(shard.index, len(shard.nodeids),
+                                                                             shard.predicted_duration))
+    if config.shard_manifest is not None and worker_id() is None:
+        _save_manifest(config.shard_manifest, shards, durations)
+    if config.shard_index is not None:
+        selected = shards[config.shard_index].nodeids
+        selected_set = set(selected)
+        session.config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in selected_set])
+        items[:] = [items_by_nodeid[nodeid] for nodeid in selected]
@@ -24,3 +24,4 @@ class TestData:
     admin_client = None
     core_org = None
     core_space = None
+    pool_lease = None
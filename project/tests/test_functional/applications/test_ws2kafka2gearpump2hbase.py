@@ -48,7 +48,7 @@ class TestWs2kafka2gearpump2hbase:
     HBASE_TABLE_NAME = "pipeline"
     HBASE_INSTANCE_NAME = "hbase1"
     KAFKA_INSTANCE_NAME = "kafka-inst"
-    KERBEROS_INSTANCE_NAME = "kerberos-instance"
+    KERBEROS_INSTANCE_NAME = "kerberos-service"
     ZOOKEEPER_INSTANCE_NAME = "zookeeper-inst"
     ONE_WORKER_PLAN_NAME = ServicePlan.WORKER_1
     SHARED_PLAN_NAME = ServicePlan.SHARED
@@ -60,23 +60,13 @@ class TestWs2kafka2gearpump2hbase:
     def setup_kafka_zookeeper_hbase_instances(self, request, test_org, test_space):
         step("Create instances of kafka, zookeeper, hbase")
 
-        kafka = ServiceInstance.api_create_with_plan_name(org_guid=test_org.guid, space_guid=test_space.guid,
-                                                          service_label=ServiceLabels.KAFKA,
-                                                          name=self.KAFKA_INSTANCE_NAME,
-                                                          service_plan_name=self.SHARED_PLAN_NAME)
-        zookeeper = ServiceInstance.api_create_with_plan_name(org_guid=test_org.guid, space_guid=test_space.guid,
-                                                              service_label=ServiceLabels.ZOOKEEPER,
-                                                              name=self.ZOOKEEPER_INSTANCE_NAME,
-                                                              service_plan_name=self.SHARED_PLAN_NAME)
-        hbase = ServiceInstance.api_create_with_plan_name(org_guid=test_org.guid, space_guid=test_space.guid,
-                                                          service_label=ServiceLabels.HBASE,
-                                                          name=self.HBASE_INSTANCE_NAME,
-                                                          service_plan_name=self.BARE_PLAN_NAME)
-        kerberos = ServiceInstance.api_create_with_plan_name(org_guid=test_org.guid, space_guid=test_space.guid,
-                                                             service_label=ServiceLabels.KERBEROS,
-                                                             name=self.KERBEROS_INSTANCE_NAME,
-                                                             service_plan_name=self.SHARED_PLAN_NAME)
-        test_instances = [kafka, zookeeper, hbase, kerberos]
+        test_instances = []
+        for label, name, plan in ((ServiceLabels.KAFKA, self.KAFKA_INSTANCE_NAME, self.SHARED_PLAN_NAME),
+                                  (ServiceLabels.ZOOKEEPER, self.ZOOKEEPER_INSTANCE_NAME, self.SHARED_PLAN_NAME),
+                                  (ServiceLabels.HBASE, self.HBASE_INSTANCE_NAME, self.BARE_PLAN_NAME),
+                                  (ServiceLabels.KERBEROS, self.KERBEROS_INSTANCE_NAME, self.SHARED_PLAN_NAME)):
+            fixtures.get_or_create_service_instance(test_instances, test_org, test_space, service_label=label,
+                                                    name=name, service_plan_name=plan)
         request.addfinalizer(lambda: fixtures.tear_down_test_objects(test_instances))
 
     @classmethod
@@ -28,7 +28,7 @@ from modules.webhdfs_tools import WebhdfsTools
 from modules.ssh_client import SshTunnel
 from modules.markers import components, incremental, priority
 from modules.tap_logger import step
-from modules.tap_object_model import Application, ServiceInstance
+from modules.tap_object_model import Application
 from tests.fixtures import fixtures
 from modules.websocket_client import WebsocketClient
 
@@ -56,24 +56,13 @@ class TestWs2kafka2hdfs:
     def setup_kafka_zookeeper_hdfs_instances(self, request, test_org, test_space):
         step("Create instances for kafka, zookeeper, hdfs and kerberos")
 
-        kafka = ServiceInstance.api_create_with_plan_name(org_guid=test_org.guid, space_guid=test_space.guid,
-                                                          service_label=ServiceLabels.KAFKA,
-                                                          name=self.KAFKA_INSTANCE_NAME,
-                                                          service_plan_name=ServicePlan.SHARED)
-        zookeeper = ServiceInstance.api_create_with_plan_name(org_guid=test_org.guid, space_guid=test_space.guid,
-                                                              service_label=ServiceLabels.ZOOKEEPER,
-                                                              name=self.ZOOKEEPER_INSTANCE_NAME,
-                                                              service_plan_name=ServicePlan.SHARED)
-        hdfs = ServiceInstance.api_create_with_plan_name(org_guid=test_org.guid, space_guid=test_space.guid,
-                                                         service_label=ServiceLabels.HDFS,
-                                                         name=self.HDFS_INSTANCE_NAME,
-                                                         service_plan_name=ServicePlan.SHARED)
-        kerberos = ServiceInstance.api_create_with_plan_name(org_guid=test_org.guid, space_guid=test_space.guid,
-                                                             service_label=ServiceLabels.KERBEROS,
-                                                             name=self.KERBEROS_INSTANCE_NAME,
-                                                             service_plan_name=ServicePlan.SHARED)
-
-        instances = [kafka, zookeeper, hdfs, kerberos]
+        instances = []
+        for label, name in ((ServiceLabels.KAFKA, self.KAFKA_INSTANCE_NAME),
+                            (ServiceLabels.ZOOKEEPER, self.ZOOKEEPER_INSTANCE_NAME),
+                            (ServiceLabels.HDFS, self.HDFS_INSTANCE_NAME),
+                            (ServiceLabels.KERBEROS, self.KERBEROS_INSTANCE_NAME)):
+            fixtures.get_or_create_service_instance(instances, test_org, test_space, service_label=label, name=name,
+                                                    service_plan_name=ServicePlan.SHARED)
         request.addfinalizer(lambda: fixtures.tear_down_test_objects(instances))
 
     @retry(AssertionError, tries=5, delay=2)
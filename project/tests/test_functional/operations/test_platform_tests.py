@@ -35,11 +35,12 @@ class TestSelfTests:
             new_test = TestSuite.api_create()
             step("New test suite has been started")
             self.__class__.suite_id = new_test.suite_id
-            assert new_test.state == TestSuite.IN_PROGRESS, "New suite state is {}".format(new_test.state)
+            assert new_test.state in (TestSuite.IN_PROGRESS, TestSuite.QUEUED), \
+                "New suite state is {}".format(new_test.state)
         except UnexpectedResponseError as e:
-            step("Another suite is already in progress")
+            step("Run queue is full")
             assert e.status == PlatformTestsHttpStatus.CODE_TOO_MANY_REQUESTS
-            assert PlatformTestsHttpStatus.MSG_RUNNER_BUSY in e.error_message
+            assert PlatformTestsHttpStatus.MSG_QUEUE_FULL in e.error_message
             step("Get list of test suites and retrieve suite in progress")
             tests = TestSuite.api_get_list()
             test_in_progress = next((t for t in tests if t.state == TestSuite.IN_PROGRESS), None)
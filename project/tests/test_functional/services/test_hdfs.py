@@ -23,6 +23,7 @@ from modules.http_client.client_auth.http_method import HttpMethod
 from modules.http_client.http_client_configuration import HttpClientConfiguration
 from modules.http_client.http_client_type import HttpClientType
 from modules.markers import components, incremental ,priority
+from modules.plan_matrix import PlanMatrix
 from modules.tap_logger import step
 from modules.tap_object_model import ServiceInstance, ServiceKey
 from modules.tap_object_model.flows import services
@@ -48,21 +49,18 @@ class TestHdfsRegularPlans(object):
 
     @priority.high
     def test_create_hdfs_service_instance_and_keys(self, test_org, test_space, hdfs_service_offering):
-        failures = []
-        for plan in hdfs_service_offering.service_plans:
-            if plan["name"] in special_plan_names:
-                continue
-            try:
-                step("Testing service {} plan {}".format(label, plan["name"]))
-                services.create_instance_and_key_then_delete_key_and_instance(
-                    org_guid=test_org.guid,
-                    space_guid=test_space.guid,
-                    service_label=label,
-                    plan_guid=plan["guid"],
-                    plan_name=plan["name"]
-                )
-            except Exception as e:
-                failures.append("{}\n{}".format(plan["guid"], e))
+        step("Testing service {} plans concurrently".format(label))
+        plans = [p for p in hdfs_service_offering.service_plans if p["name"] not in special_plan_names]
+        failures = PlanMatrix.run(
+            lifecycle=lambda service_type, plan: services.create_instance_and_key_then_delete_key_and_instance(
+                org_guid=test_org.guid,
+                space_guid=test_space.guid,
+                service_label=label,
+                plan_guid=plan["guid"],
+                plan_name=plan["name"]
+            ),
+            pairs=[(hdfs_service_offering, plan) for plan in plans]
+        )
         assertions.assert_no_errors(failures)
 
 
@@ -34,13 +34,12 @@ class GetOrganizationUsers(TapTestCase):
     def users(cls, request, test_org, class_context):
         cls.step("Create test users")
         manager = User.api_create_by_adding_to_organization(class_context, org_guid=test_org.guid)
-        cls.manager_client = manager.login()
         auditor = User.api_create_by_adding_to_organization(class_context, org_guid=test_org.guid,
                                                             roles=User.ORG_ROLES["auditor"])
-        cls.auditor_client = auditor.login()
         billing_manager = User.api_create_by_adding_to_organization(class_context, org_guid=test_org.guid,
                                                                     roles=User.ORG_ROLES["billing_manager"])
-        cls.billing_manager_client = billing_manager.login()
+        cls.manager_client, cls.auditor_client, cls.billing_manager_client = User.login_all(
+            [manager, auditor, billing_manager])
 
     @pytest.fixture(scope="function")
     def setup_context(self, context):
@@ -61,14 +61,15 @@ class TestSpaceUserPermissions(object):
                                                              roles=User.ORG_ROLES["auditor"])
         other_org_manager = User.api_create_by_adding_to_organization(class_context, second_test_org.guid)
         other_user = User.api_create_by_adding_to_organization(class_context, second_test_org.guid, roles=[])
-        cls.user_clients = {
-            "admin": HttpClientFactory.get(ConsoleConfigurationProvider.get()),
-            "org_manager": org_manager.login(),
-            "space_manager_in_org": space_manager_in_org.login(),
-            "org_user": org_user.login(),
-            "other_org_manager": other_org_manager.login(),
-            "other_user": other_user.login()
+        users = {
+            "org_manager": org_manager,
+            "space_manager_in_org": space_manager_in_org,
+            "org_user": org_user,
+            "other_org_manager": other_org_manager,
+            "other_user": other_user
         }
+        cls.user_clients = dict(zip(users.keys(), User.login_all(list(users.values()))))
+        cls.user_clients["admin"] = HttpClientFactory.get(ConsoleConfigurationProvider.get())
 
     @staticmethod
     def _assert_user_in_space_with_roles(expected_user, space_guid):
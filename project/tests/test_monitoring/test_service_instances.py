@@ -19,6 +19,7 @@ from datetime import datetime
 import pytest
 
 from modules.constants.services import ServiceLabels
+from modules.plan_matrix import PlanMatrix
 from modules.runner.tap_test_case import TapTestCase
 from modules.tap_object_model import ServiceInstance, ServiceType
 from tests.fixtures.assertions import assert_no_errors
@@ -36,16 +37,11 @@ class ServiceInstancesMonitoring(TapTestCase):
 
     def test_service_instances(self):
         tested_service_types = [st for st in self.marketplace_services if st.label in self.TESTED_APP_NAMES]
-        errors = []
-        for service_type in tested_service_types:
-            for plan in service_type.service_plans:
-                try:
-                    self._create_instance(plan, service_type)
-                except Exception as e:
-                    errors.append(e)
+        errors = PlanMatrix.run(lifecycle=self._create_instance,
+                                pairs=[(st, plan) for st in tested_service_types for plan in st.service_plans])
         assert_no_errors(errors)
 
-    def _create_instance(self, plan, service_type):
+    def _create_instance(self, service_type, plan):
         self.step("Create instance of {} ({} plan). Check it exists.".format(service_type.label, plan["name"]))
         service_instance_name = service_type.label + datetime.now().strftime('%Y%m%d_%H%M%S_%f')
         instance = ServiceInstance.api_create(
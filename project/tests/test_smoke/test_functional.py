@@ -176,20 +176,11 @@ def test_add_and_delete_transfer_from_file(core_org, context):
 @components.yarn_broker
 @components.zookeeper_broker
 @components.zookeeper_wssb_broker
-def test_create_and_delete_marketplace_service_instances(core_org, core_space, context,
+def test_create_and_delete_marketplace_service_instances(marketplace_plan_matrix,
                                                          non_parametrized_marketplace_services):
     """Create and Delete Marketplace Service Instance"""
     service_type = non_parametrized_marketplace_services[0]
     plan = non_parametrized_marketplace_services[1]
 
-    step("Create instance {} {}".format(service_type.label, plan["name"]))
-    instance = ServiceInstance.api_create(org_guid=core_org.guid, space_guid=core_space.guid,
-                                          service_label=service_type.label, service_plan_guid=plan["guid"],
-                                          context=context)
-    step("Check that the instance was created")
-    instance.ensure_created()
-    step("Delete the instance")
-    instance.api_delete()
-    step("Check that the instance was deleted")
-    instances = ServiceInstance.api_get_list(space_guid=core_space.guid, service_type_guid=service_type.guid)
-    assert instance not in instances
+    step("Create and delete instance {} {}, run concurrently for all plans".format(service_type.label, plan["name"]))
+    marketplace_plan_matrix.result(service_type, plan)
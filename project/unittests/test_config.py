@@ -62,6 +62,18 @@ def test_get_int_incorrect_env_setting(env_key_name):
         config.get_int(env_key_name)
 
 
+def test_get_float(env_key_name):
+    os.environ[env_key_name] = "0.5"
+    value = config.get_float(env_key_name)
+    assert value == 0.5
+
+
+def test_get_float_incorrect_env_setting(env_key_name):
+    os.environ[env_key_name] = "kitten"
+    with pytest.raises(ValueError):
+        config.get_float(env_key_name)
+
+
 @pytest.mark.parametrize("env_value,expected_value", (("true", True), ("TRUE", True), ("True", True),
                                                       ("false", False), ("FALSE", False), ("False", False)))
 def test_get_bool_true(env_key_name, env_value, expected_value):
@@ -0,0 +1,106 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+
+# need to set required variables
+os.environ["PT_TAP_DOMAIN"] = "test"
+os.environ["PT_ADMIN_PASSWORD"] = "test"
+
+import config
+from benchmarks.fake_tap_server import FakeTapData, FakeTapServer
+from modules.http_calls import cloud_foundry
+from modules.http_client.client_auth.client_auth_login_page import ClientAuthLoginPage
+from modules.http_client.client_auth.http_session import HttpSession
+from modules.http_client.http_client import HttpClient
+from modules.http_client.http_client_factory import HttpClientFactory
+from modules.tap_object_model import DataSet, ServiceInstance, Transfer
+
+
+@pytest.yield_fixture(scope="module")
+def server():
+    data = FakeTapData(org_count=3, app_count=250, service_instance_count=2, data_set_count=5, transfer_count=5)
+    with FakeTapServer(data=data, password=config.admin_password) as fake_tap_server:
+        yield fake_tap_server
+
+
+@pytest.fixture
+def console_client(server):
+    session = HttpSession(config.admin_username, config.admin_password)
+    return HttpClient(server.url, ClientAuthLoginPage(server.url, session))
+
+
+@pytest.yield_fixture
+def cf_config(server):
+    environment = server.environment()
+    with mock.patch.multiple(config, cf_api_url_full=environment["PT_CF_API_URL"],
+                             cf_oauth_token_url=environment["PT_CF_OAUTH_TOKEN_URL"]):
+        yield
+    HttpClientFactory._INSTANCES.clear()
+
+
+def test_login_page_authentication(server, console_client):
+    assert console_client.auth.authenticated
+    assert len(console_client.cookies) == 1
+    assert requests.get("{}/rest/datasets".format(server.url)).status_code == 401
+
+
+def test_login_with_invalid_password_fails(server):
+    with pytest.raises(AssertionError):
+        ClientAuthLoginPage(server.url, HttpSession(config.admin_username, "invalid"))
+
+
+def test_cf_pagination_and_filter(server, cf_config):
+    apps = cloud_foundry.cf_api_get_apps()
+    assert len(apps) == 250
+    assert len({app["metadata"]["guid"] for app in apps}) == 250
+    assert [app["entity"]["name"] for app in cloud_foundry.cf_api_get_apps(name="app-000042")] == ["app-000042"]
+
+
+def test_cf_org_spaces(server, cf_config):
+    org_guid = server.data.organizations[1]["metadata"]["guid"]
+    spaces = cloud_foundry.cf_api_get_org_spaces(org_guid)
+    assert [space["entity"]["name"] for space in spaces] == ["space-000001"]
+    assert cloud_foundry.cf_api_get_org_spaces(org_guid, name="space-000000") == []
+    first_org_guid = server.data.organizations[0]["metadata"]["guid"]
+    assert cloud_foundry.cf_api_get_org_spaces(first_org_guid)[0]["metadata"]["guid"] == server.data.space_guid
+
+
+def test_console_object_model(server, console_client):
+    space_guid = server.data.space_guid
+    assert len(ServiceInstance.api_get_list(space_guid=space_guid, client=console_client)) == 2
+    instance = ServiceInstance.api_create(org_guid="org", space_guid=space_guid, service_label="fake",
+                                          service_plan_guid="plan", client=console_client)
+    assert instance.last_operation_state == "succeeded"
+    transfer = Transfer.api_get_list(client=console_client)[0]
+    assert transfer.state == "FINISHED"
+    data_sets = DataSet.api_get_list(client=console_client)
+    assert len(data_sets) == 10  # five generated, five created by finished transfers
+
+
+def test_error_injection_and_latency():
+    with FakeTapServer(data=FakeTapData(), latency=0.05, error_rate=1.0, error_status=503) as server:
+        session = HttpSession(config.admin_username, "password")
+        client = HttpClient(server.url, ClientAuthLoginPage(server.url, session))
+        start = time.perf_counter()
+        response = client.request("GET", "rest/das/requests", raw_response=True)
+        assert time.perf_counter() - start >= 0.05
+        assert response.status_code == 503
@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import csv
+import hashlib
+import io
+import os
+from unittest import mock
+
+import pytest
+
+
+# need to set required variables
+os.environ["PT_TAP_DOMAIN"] = "test"
+os.environ["PT_ADMIN_PASSWORD"] = "test"
+
+from modules.file_utils import CsvColumn, download_file, generate_csv_chunks, generate_csv_file, \
+    get_csv_record_count, tear_down_test_files, write_csv
+
+
+SCHEMA = [CsvColumn(CsvColumn.INT, width=6), CsvColumn(CsvColumn.FLOAT, width=8), CsvColumn(CsvColumn.DATE),
+          CsvColumn(CsvColumn.STRING, cardinality=3, width=4)]
+
+
+def _generate(**kwargs):
+    stream = io.BytesIO()
+    write_csv(stream, **kwargs)
+    return stream.getvalue().decode()
+
+
+def test_generate_csv_with_row_count():
+    rows = list(csv.reader(io.StringIO(_generate(column_count=3, row_count=5000))))
+    assert rows[0] == ["COL_0", "COL_1", "COL_2"]
+    assert len(rows) == 5001
+    assert all(len(row) == 3 and all(len(value) == 10 for value in row) for row in rows[1:])
+
+
+@pytest.mark.parametrize("size", [1, 100, 10000, 500000])
+def test_generate_csv_with_size(size):
+    content = _generate(schema=SCHEMA, size=size)
+    row_length = sum(column.width for column in SCHEMA) + len(SCHEMA)
+    assert size <= len(content) < size + row_length
+
+
+def test_generate_csv_with_zero_size():
+    assert _generate(size=0) == ""
+
+
+def test_generate_csv_is_reproducible_with_seed():
+    assert _generate(schema=SCHEMA, row_count=100, seed=1) == _generate(schema=SCHEMA, row_count=100, seed=1)
+    assert _generate(schema=SCHEMA, row_count=100, seed=1) != _generate(schema=SCHEMA, row_count=100, seed=2)
+
+
+def test_generate_csv_respects_schema():
+    rows = list(csv.reader(io.StringIO(_generate(schema=SCHEMA, row_count=1000, seed=1))))[1:]
+    int_value, float_value, date_value, _ = rows[0]
+    assert int_value.isdigit() and len(int_value) == 6
+    assert float(float_value) >= 0 and len(float_value) == 8
+    assert len(date_value.split("-")) == 3
+    assert len({row[3] for row in rows}) <= 3
+
+
+def test_generate_csv_chunks_are_large():
+    chunks = list(generate_csv_chunks(column_count=10, row_count=10000))
+    assert len(chunks) == 4
+
+
+def test_invalid_column_type():
+    with pytest.raises(ValueError):
+        CsvColumn("kitten")
+
+
+def test_generate_csv_file():
+    file_path = generate_csv_file(column_count=2, row_count=10, seed=1)
+    try:
+        assert get_csv_record_count(file_path) == 11
+    finally:
+        tear_down_test_files()
+
+
+@pytest.mark.parametrize("content", [
+    "",
+    "a,b\n1,2\n",
+    "a,b\n1,2",
+    "a,b\r\n1,2\r\n\r\n3,4\r\n",
+    "a,b\n\"multi\nline\",2\n\"x\"\"\ny\",3\n",
+    "a,b\n\"quoted\",\"no newline\"",
+])
+def test_get_csv_record_count(content, tmpdir):
+    file_path = str(tmpdir.join("records.csv"))
+    with open(file_path, "w", newline="") as f:
+        f.write(content)
+    with open(file_path, newline="") as f:
+        expected_count = sum(1 for _ in csv.reader(f))
+    assert get_csv_record_count(file_path) == expected_count
+
+
+def test_get_csv_record_count_with_quotes_spanning_blocks(tmpdir):
+    file_path = str(tmpdir.join("records.csv"))
+    with open(file_path, "w", newline="") as f:
+        f.write("a,b\n" + "\"multi\nline\nvalue\",2\n" * 50)
+    with mock.patch("modules.file_utils.CSV_COUNT_BLOCK_SIZE", 7):
+        assert get_csv_record_count(file_path) == 51
+
+
+def test_download_file_computes_checksum():
+    chunks = [b"a,b\n", b"1,2\n"]
+    response = mock.Mock()
+    response.iter_content.return_value = chunks
+    checksum = hashlib.md5()
+    with mock.patch("modules.file_utils.requests.get", return_value=response) as get:
+        file_path = download_file("http://test/file.csv", checksum=checksum)
+    try:
+        get.assert_called_once_with("http://test/file.csv", stream=True)
+        response.close.assert_called_once_with()
+        with open(file_path, "rb") as f:
+            assert f.read() == b"".join(chunks)
+        assert checksum.hexdigest() == hashlib.md5(b"".join(chunks)).hexdigest()
+    finally:
+        tear_down_test_files()
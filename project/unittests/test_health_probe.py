@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import requests
+
+# need to set required variables
+os.environ["PT_TAP_DOMAIN"] = "test"
+os.environ["PT_ADMIN_PASSWORD"] = "test"
+
+from modules import health_probe
+from modules.health_probe import application_probes, check, format_matrix, HEALTH, Probe, ProbeResult, \
+    REACHABLE, run_probes, TCP, unhealthy_components
+
+
+def _response(status_code):
+    return SimpleNamespace(status_code=status_code, ok=status_code < 400)
+
+
+def test_critical_endpoints_have_to_respond_with_success():
+    probes = [probe for probe in health_probe.endpoint_probes() if probe.critical]
+    assert sorted(probe.name for probe in probes) == ["cf api", "console", "uaa"]
+    assert {probe.kind for probe in probes} == {HEALTH}
+    with mock.patch.object(health_probe.requests, "get", return_value=_response(404)):
+        assert not any(check(probe, timeout=1).is_healthy for probe in probes)
+
+
+def test_reachable_endpoint_is_healthy_unless_server_error():
+    probe = Probe("demiurge", REACHABLE, "http://demiurge", ("demiurge",), False)
+    with mock.patch.object(health_probe.requests, "get", return_value=_response(404)):
+        assert check(probe, timeout=1).is_healthy
+    with mock.patch.object(health_probe.requests, "get", return_value=_response(502)):
+        assert check(probe, timeout=1).detail == "502"
+        assert not check(probe, timeout=1).is_healthy
+
+
+def test_health_endpoint_is_healthy_only_with_success():
+    probe = Probe("das", HEALTH, "http://das/health", ("das",), False)
+    with mock.patch.object(health_probe.requests, "get", return_value=_response(404)):
+        assert not check(probe, timeout=1).is_healthy
+    with mock.patch.object(health_probe.requests, "get", side_effect=requests.exceptions.ConnectTimeout()):
+        assert check(probe, timeout=1).detail == "ConnectTimeout"
+
+
+def test_tcp_endpoint():
+    probe = Probe("tunnel", TCP, ("jump", 22), (), False)
+    with mock.patch.object(health_probe.socket, "create_connection", side_effect=ConnectionRefusedError()):
+        assert not check(probe, timeout=1).is_healthy
+    with mock.patch.object(health_probe.socket, "create_connection"):
+        assert check(probe, timeout=1).is_healthy
+
+
+def test_probes_are_run_concurrently():
+    probes = [Probe(str(i), REACHABLE, "http://{}".format(i), (), False) for i in range(5)]
+
+    def slow_get(url, **kwargs):
+        time.sleep(0.2)
+        return _response(200)
+
+    start_time = time.time()
+    with mock.patch.object(health_probe.requests, "get", side_effect=slow_get):
+        results = run_probes(probes, timeout=1)
+    assert time.time() - start_time < 0.6
+    assert [r.probe for r in results] == probes
+
+
+def test_application_probes():
+    applications = [SimpleNamespace(name="das", is_running=True, urls=("das.test",)),
+                    SimpleNamespace(name="data-catalog", is_running=False, urls=("data-catalog.test",)),
+                    SimpleNamespace(name="my-app", is_running=True, urls=("my-app.test",))]
+    probes, results = application_probes(applications)
+    assert probes == [Probe("das", HEALTH, "http://das.test/health", ("das",), False)]
+    assert [(r.probe.name, r.is_healthy, r.probe.components) for r in results] == \
+        [("data-catalog", False, ("data_catalog",))]
+
+
+def test_unhealthy_components_and_matrix():
+    results = [ProbeResult(Probe("das", HEALTH, "http://das/health", ("das",), False), False, "503", 0.1),
+               ProbeResult(Probe("console", REACHABLE, "http://console", ("console",), True), True, "200", 0.2)]
+    assert unhealthy_components(results) == {"das": "das is unhealthy (503)"}
+    matrix = format_matrix(results)
+    assert len(matrix) == 3
+    assert matrix[1].split()[:2] == ["das", "UNHEALTHY"]
+    assert matrix[2].split()[:2] == ["console", "OK"]
@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from collections import OrderedDict
+from types import SimpleNamespace
+
+from modules.test_selection import changed_components, component_versions, marked_components, select_tests
+
+
+def _snapshot(platform_version="1.0", applications=()):
+    return SimpleNamespace(platform_version=platform_version, cf_version="cf", cdh_version="cdh",
+                           applications=list(applications))
+
+
+def test_component_versions_of_tap_applications():
+    snapshot = _snapshot(applications=[{"name": "console", "version": "0.8.1"},
+                                       {"name": "data-catalog", "updated_at": "2016-10-01"},
+                                       {"name": "my-app", "version": "1"}])
+    assert component_versions(snapshot) == {"platform_version": "1.0", "cf_version": "cf", "cdh_version": "cdh",
+                                            "console": "0.8.1", "data_catalog": "2016-10-01"}
+
+
+def test_changed_components():
+    previous = component_versions(_snapshot(applications=[{"name": "console", "version": "1"},
+                                                          {"name": "das", "version": "1"},
+                                                          {"name": "smtp", "version": "1"}]))
+    current = component_versions(_snapshot(applications=[{"name": "console", "version": "2"},
+                                                         {"name": "das", "version": "1"},
+                                                         {"name": "demiurge", "version": "1"}]))
+    assert changed_components(previous, current) == {"console", "smtp", "demiurge"}
+
+
+def test_any_component_could_change_without_previous_run_or_with_new_platform_version():
+    current = component_versions(_snapshot())
+    assert changed_components(None, current) is None
+    assert changed_components(component_versions(_snapshot(platform_version="0.9")), current) is None
+
+
+def test_marked_components():
+    markers = {"console", "priority_high", "das"}
+    item = SimpleNamespace(get_marker=lambda name: object() if name in markers else None)
+    assert marked_components(item) == {"console", "das"}
+
+
+def test_tests_of_changed_components_are_selected():
+    components = OrderedDict([
+        ("a.py::test_console", {"console"}),
+        ("b.py::test_das", {"das", "demiurge"}),
+        ("c.py::test_unmarked", set()),
+        ("d.py::test_smtp", {"smtp"}),
+        ("smoke/s.py::test_smtp", {"smtp"}),
+    ])
+    selected, reasons = select_tests(components, {"demiurge"}, smoke_prefixes=["smoke/"])
+    assert selected == ["b.py::test_das", "c.py::test_unmarked", "smoke/s.py::test_smtp"]
+    assert reasons == {"a.py::test_console": "none of its components changed: console",
+                       "d.py::test_smtp": "none of its components changed: smtp"}
+
+
+def test_tests_of_class_are_selected_together():
+    components = OrderedDict([("t.py::TestA::test_1", {"console"}), ("t.py::TestA::test_2", {"das"}),
+                              ("t.py::TestB::test_1", {"das"})])
+    selected, reasons = select_tests(components, {"console"})
+    assert selected == ["t.py::TestA::test_1", "t.py::TestA::test_2"]
+    assert list(reasons) == ["t.py::TestB::test_1"]
+
+
+def test_all_tests_are_selected_if_any_component_could_change():
+    components = OrderedDict([("t.py::test_console", {"console"}), ("t.py::test_das", {"das"})])
+    assert select_tests(components, None) == (list(components), {})
@@ -0,0 +1,40 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+
+# need to set required variables
+os.environ["PT_TAP_DOMAIN"] = "test"
+os.environ["PT_ADMIN_PASSWORD"] = "test"
+
+from benchmarks import microbenchmarks
+
+
+def _results(**medians):
+    return {"commit": None, "results": {name: {"median": median} for name, median in medians.items()}}
+
+
+def test_compare_reports_regressions_above_threshold():
+    comparison = microbenchmarks.compare(_results(a=13.0, b=10.0, c=1.0), _results(a=10.0, b=10.0), threshold=1.2)
+    assert comparison == [("a", 10.0, 13.0, 1.3, True), ("b", 10.0, 10.0, 1.0, False)]
+
+
+def test_run_saves_statistics_of_selected_benchmarks():
+    results = microbenchmarks.run("SimulationResultDecoder")
+    assert list(results["results"]) == ["SimulationResultDecoder.decode"]
+    result = results["results"]["SimulationResultDecoder.decode"]
+    assert result["rounds"] == microbenchmarks.ROUNDS
+    assert 0 < result["min"] <= result["median"]
@@ -0,0 +1,51 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+from unittest import mock
+
+import pytest
+
+# need to set required variables
+os.environ["PT_TAP_DOMAIN"] = "test"
+os.environ["PT_ADMIN_PASSWORD"] = "test"
+
+from modules.test_names import generate_test_object_name, is_test_object_name
+from modules.test_scheduling import work_scope
+
+
+@pytest.mark.parametrize("nodeid,scope", [
+    ("tests/test_a.py::test_function", "tests/test_a.py"),
+    ("tests/test_a.py::test_function[x::y]", "tests/test_a.py"),
+    ("tests/test_a.py::TestClass::test_method", "tests/test_a.py::TestClass"),
+    ("tests/test_a.py::TestClass::()::test_method", "tests/test_a.py::TestClass"),
+    ("tests/test_a.py::TestClass::()::test_method[param]", "tests/test_a.py::TestClass"),
+])
+def test_work_scope(nodeid, scope):
+    assert work_scope(nodeid) == scope
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"short": True}, {"email": True}, {"prefix": "jupyter"}])
+def test_generated_names_are_unique_test_object_names(kwargs):
+    names = [generate_test_object_name(**kwargs) for _ in range(100)]
+    assert len(set(names)) == len(names)
+    assert all(is_test_object_name(name) for name in names)
+
+
+def test_generated_name_contains_worker_id():
+    with mock.patch.dict(os.environ, {"PYTEST_XDIST_WORKER": "gw3"}):
+        name = generate_test_object_name(prefix="host")
+    assert name.startswith("host_gw3_")
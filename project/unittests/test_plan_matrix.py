@@ -0,0 +1,104 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+# need to set required variables
+os.environ["PT_TAP_DOMAIN"] = "test"
+os.environ["PT_ADMIN_PASSWORD"] = "test"
+
+from modules.plan_matrix import get_marketplace, PlanMatrix
+from modules.tap_object_model import ServiceType
+
+
+def _service_type(label, broker_guid=None, plan_names=("free",)):
+    return ServiceType(label=label, guid=label, description=None, space_guid="space",
+                       service_plans=[{"guid": name, "name": name} for name in plan_names], broker_guid=broker_guid)
+
+
+class RecordingLifecycle(object):
+    """Lifecycle which records how many pairs of each broker run at once."""
+
+    def __init__(self, duration=0.1, failing=()):
+        self.duration = duration
+        self.failing = failing
+        self.calls = []
+        self.running = {}
+        self.max_running = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, service_type, plan):
+        broker = service_type.broker_guid
+        with self.lock:
+            self.calls.append((service_type.label, plan["name"]))
+            self.running[broker] = self.running.get(broker, 0) + 1
+            self.max_running[broker] = max(self.max_running.get(broker, 0), self.running[broker])
+        time.sleep(self.duration)
+        with self.lock:
+            self.running[broker] -= 1
+        if plan["name"] in self.failing:
+            raise AssertionError("{} failed".format(plan["name"]))
+        return plan["name"]
+
+
+def test_pairs_are_run_concurrently_with_broker_limit():
+    lifecycle = RecordingLifecycle()
+    first = _service_type("a", broker_guid="broker-1", plan_names=("p1", "p2", "p3", "p4"))
+    second = _service_type("b", broker_guid="broker-2", plan_names=("p1", "p2"))
+    pairs = [(st, plan) for st in (first, second) for plan in st.service_plans]
+    start_time = time.time()
+    errors = PlanMatrix.run(lifecycle, pairs, max_workers=8, broker_concurrency=2)
+    assert errors == []
+    assert time.time() - start_time < 0.35
+    assert lifecycle.max_running == {"broker-1": 2, "broker-2": 2}
+    assert sorted(lifecycle.calls) == sorted((st.label, plan["name"]) for st, plan in pairs)
+
+
+def test_each_pair_is_run_once_and_results_map_to_pairs():
+    lifecycle = RecordingLifecycle(duration=0, failing=("bad",))
+    service_type = _service_type("a", plan_names=("good", "bad"))
+    good, bad = service_type.service_plans
+    matrix = PlanMatrix(lifecycle, max_workers=2, broker_concurrency=1)
+    try:
+        for plan in (good, bad, good):
+            matrix.submit(service_type, plan)
+        assert matrix.result(service_type, good) == "good"
+        with pytest.raises(AssertionError):
+            matrix.result(service_type, bad)
+        assert matrix.errors() == ["a bad: bad failed"]
+    finally:
+        matrix.shutdown()
+    assert len(lifecycle.calls) == 2
+
+
+def test_marketplace_is_cached(tmpdir):
+    cache_path = str(tmpdir.join("marketplace.json"))
+    response = [{"metadata": {"guid": "guid"},
+                 "entity": {"label": "a", "description": "", "service_broker_guid": "broker", "service_plans": []}}]
+    with mock.patch("modules.http_calls.platform.service_catalog.api_get_marketplace_services",
+                    return_value=response) as mock_api:
+        marketplace = get_marketplace(lambda: "space", cache_path, max_age=60)
+        cached_marketplace = get_marketplace(lambda: "other space", cache_path, max_age=60)
+        assert mock_api.call_count == 1
+        assert cached_marketplace == marketplace
+        assert cached_marketplace[0].broker_guid == "broker"
+        get_marketplace(lambda: "space", cache_path, max_age=0)
+        assert mock_api.call_count == 2
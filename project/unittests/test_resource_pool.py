@@ -0,0 +1,182 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import time
+from unittest import mock
+
+import mongomock
+import pytest
+
+# need to set required variables
+os.environ["PT_TAP_DOMAIN"] = "test"
+os.environ["PT_ADMIN_PASSWORD"] = "test"
+
+from modules import resource_pool
+from modules.mongo_reporter import client
+from modules.tap_object_model import Application, Organization, ServiceInstance, Space, User
+
+
+def _entry(name, created_at, state=resource_pool.ResourcePool.FREE, **kwargs):
+    entry = {"state": state, "created_at": created_at, "leased_by": None, "org": {"name": name, "guid": name},
+             "space": {"name": name, "guid": "space-" + name}, "apps": [{"name": "app", "guid": "app"}],
+             "service_instances": [{"name": "kafka-inst", "guid": "kafka", "label": "kafka", "plan": "shared"}],
+             "org_users": ["admin"], "space_users": ["admin"]}
+    entry.update(kwargs)
+    return entry
+
+
+def _app(guid, state="STARTED"):
+    return Application(name=guid, guid=guid, space_guid="space", state=state, instances=(1,), urls=("url",))
+
+
+def _instance(guid):
+    return ServiceInstance(guid=guid, name=guid, space_guid="space", service_label="kafka")
+
+
+@pytest.fixture
+def pool():
+    with mock.patch.object(client, "MongoClient", mongomock.MongoClient):
+        pool = resource_pool.ResourcePool(mongo_uri="mongodb://mockmongo:1234/test_db", size=2, lease_timeout=60)
+    pool.entries = pool._db_client.database[pool.COLLECTION]
+    return pool
+
+
+@pytest.yield_fixture
+def space_content():
+    content = {"apps": [_app("app")], "instances": [_instance("kafka")], "spaces": [],
+               "org_users": [User(guid="admin")], "space_users": [User(guid="admin")]}
+    with mock.patch.object(Application, "api_get_list", lambda space_guid: list(content["apps"])), \
+            mock.patch.object(ServiceInstance, "api_get_list", lambda space_guid: list(content["instances"])), \
+            mock.patch.object(Space, "api_get_list_in_org", lambda org_guid: list(content["spaces"])), \
+            mock.patch.object(User, "api_get_list_via_organization", lambda org_guid: list(content["org_users"])), \
+            mock.patch.object(User, "api_get_list_via_space", lambda space_guid: list(content["space_users"])):
+        yield content
+
+
+def test_lease_takes_oldest_free_organization(pool, space_content):
+    pool.entries.insert_many([_entry("new", 2), _entry("old", 1), _entry("leased", 0, state=pool.LEASED)])
+    lease = pool.lease()
+    assert lease.org.name == "old"
+    assert lease.space.guid == "space-old"
+    assert [app.guid for app in lease.apps] == ["app"]
+    assert [instance.guid for instance in lease.service_instances] == ["kafka"]
+    assert pool.entries.find_one({"_id": lease.id})["state"] == pool.LEASED
+    assert pool.lease().org.name == "new"
+    assert pool.lease() is None
+
+
+def test_release_deletes_objects_created_by_tests(pool, space_content):
+    pool.entries.insert_one(_entry("org", 1))
+    lease = pool.lease()
+    test_app, test_instance = _app("test-app"), _instance("test-instance")
+    space_content["apps"].append(test_app)
+    space_content["instances"].append(test_instance)
+    with mock.patch.object(Application, "api_delete") as delete_app, \
+            mock.patch.object(ServiceInstance, "api_delete") as delete_instance:
+        pool.release(lease)
+    assert delete_app.call_count == 1
+    assert delete_instance.call_count == 1
+    assert pool.entries.find_one({"_id": lease.id})["state"] == pool.FREE
+
+
+def test_release_deletes_spaces_and_users_added_by_tests(pool, space_content):
+    pool.entries.insert_one(_entry("org", 1))
+    lease = pool.lease()
+    space_content["spaces"].extend([lease.space, Space(name="test-space", guid="test-space", org_guid="org")])
+    space_content["org_users"].append(User(guid="org-user"))
+    space_content["space_users"].append(User(guid="space-user"))
+    with mock.patch.object(Space, "api_delete", autospec=True) as delete_space, \
+            mock.patch.object(User, "api_delete_from_space", autospec=True) as delete_space_user, \
+            mock.patch.object(User, "api_delete_from_organization", autospec=True) as delete_org_user:
+        pool.release(lease)
+    assert [call[0][0].guid for call in delete_space.call_args_list] == ["test-space"]
+    assert [call[0][0].guid for call in delete_space_user.call_args_list] == ["space-user"]
+    assert [call[0][0].guid for call in delete_org_user.call_args_list] == ["org-user"]
+    assert pool.entries.find_one({"_id": lease.id})["state"] == pool.FREE
+
+
+def test_release_destroys_organization_without_pooled_users(pool, space_content):
+    pool.entries.insert_one(_entry("org", 1, org_users=None))
+    lease = pool.lease()
+    with mock.patch.object(Organization, "cleanup") as delete_org:
+        pool.release(lease)
+    delete_org.assert_called_once_with()
+    assert pool.entries.count() == 0
+
+
+def test_release_destroys_organization_if_pooled_object_was_deleted(pool, space_content):
+    pool.entries.insert_one(_entry("org", 1))
+    lease = pool.lease()
+    space_content["instances"].clear()
+    with mock.patch.object(Organization, "cleanup") as delete_org:
+        pool.release(lease)
+    delete_org.assert_called_once_with()
+    assert pool.entries.count() == 0
+
+
+def test_renew_refreshes_lease_time(pool, space_content):
+    pool.entries.insert_one(_entry("org", 1))
+    lease = pool.lease()
+    pool.entries.update_one({"_id": lease.id}, {"$set": {"leased_at": 0}})
+    assert pool.renew(lease)
+    assert pool.entries.find_one({"_id": lease.id})["leased_at"] > time.time() - 60
+    pool.entries.delete_one({"_id": lease.id})
+    assert not pool.renew(lease)
+
+
+def test_keep_leased_renews_lease_until_stopped(pool, space_content):
+    pool.entries.insert_one(_entry("org", 1))
+    lease = pool.lease()
+    with mock.patch.object(pool, "renew", return_value=True) as renew:
+        stop = pool.keep_leased(lease, interval=0.01)
+        time.sleep(0.1)
+        stop.set()
+        time.sleep(0.05)
+        count = renew.call_count
+        time.sleep(0.05)
+    assert count > 1
+    assert renew.call_count == count
+
+
+def test_reap_destroys_organization_of_crashed_provisioning(pool):
+    # process killed while creating space, so the pool entry is not cleaned up
+    with mock.patch.object(Organization, "api_create", return_value=Organization(name="org", guid="org")), \
+            mock.patch.object(Space, "api_create", side_effect=KeyboardInterrupt()):
+        with pytest.raises(KeyboardInterrupt):
+            pool.provision(sample_app=False, service_instances=False)
+    pool.entries.update_many({}, {"$set": {"created_at": 0}})
+    with mock.patch.object(Organization, "cleanup") as delete_org:
+        pool.reap()
+    delete_org.assert_called_once_with()
+
+
+def test_reap_destroys_expired_leases(pool):
+    now = time.time()
+    pool.entries.insert_many([_entry("expired", 1, state=pool.LEASED, leased_at=now - 120),
+                              _entry("leased", 1, state=pool.LEASED, leased_at=now),
+                              _entry("free", 1)])
+    with mock.patch.object(Organization, "cleanup") as delete_org:
+        pool.reap()
+    assert delete_org.call_count == 1
+    assert sorted(entry["org"]["name"] for entry in pool.entries.find({})) == ["free", "leased"]
+
+
+def test_refill_provisions_missing_organizations(pool):
+    pool.entries.insert_one(_entry("free", 1))
+    with mock.patch.object(pool, "provision") as provision:
+        pool.refill()
+    assert provision.call_count == 1
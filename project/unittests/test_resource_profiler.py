@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+from retry import retry
+
+# need to set required variables
+os.environ["PT_TAP_DOMAIN"] = "test"
+os.environ["PT_ADMIN_PASSWORD"] = "test"
+
+from modules.http_client.client_auth.http_session import HttpSession
+from modules.resource_profiler import PhaseProfile, ResourceProfiler
+
+
+def _installed_profiler():
+    profiler = ResourceProfiler()
+    profiler.install()
+    return profiler
+
+
+def test_install_replaces_sleep_and_uninstall_restores_it():
+    original_sleep = time.sleep
+    profiler = _installed_profiler()
+    try:
+        assert time.sleep != original_sleep
+        assert profiler in HttpSession._REQUEST_HOOKS
+    finally:
+        profiler.uninstall()
+    assert time.sleep == original_sleep
+    assert profiler not in HttpSession._REQUEST_HOOKS
+
+
+def test_phase_usage_measures_sleep_and_retry_sleep():
+    calls = []
+
+    @retry(AssertionError, tries=2, delay=0.05)
+    def flaky():
+        calls.append(1)
+        assert len(calls) > 1
+
+    profiler = _installed_profiler()
+    try:
+        profiler.start()
+        time.sleep(0.05)
+        flaky()
+        usage = profiler.stop()
+    finally:
+        profiler.uninstall()
+    assert usage.sleep_time >= 0.1
+    assert 0.05 <= usage.retry_sleep_time < usage.sleep_time
+    assert usage.wall_time >= usage.sleep_time
+    assert usage.cpu_time < usage.sleep_time
+    assert usage.peak_rss >= 0 and usage.rss_growth >= 0
+
+
+def test_sleep_of_other_threads_is_not_counted():
+    profiler = _installed_profiler()
+    try:
+        profiler.start()
+        thread = threading.Thread(target=time.sleep, args=(0.05,))
+        thread.start()
+        thread.join()
+        usage = profiler.stop()
+    finally:
+        profiler.uninstall()
+    assert usage.sleep_time == 0
+
+
+def test_http_requests_are_counted_only_while_running():
+    profiler = ResourceProfiler()
+    profiler(SimpleNamespace(total_time=5.0))
+    profiler.start()
+    profiler(SimpleNamespace(total_time=0.25))
+    profiler(SimpleNamespace(total_time=0.5))
+    usage = profiler.stop()
+    assert usage.http_request_count == 2
+    assert usage.http_time == 0.75
+    assert usage.to_dict()["http_request_count"] == 2
+
+
+def test_http_requests_of_other_threads_are_not_counted():
+    profiler = ResourceProfiler()
+    profiler.start()
+    thread = threading.Thread(target=profiler, args=(SimpleNamespace(total_time=1.0),))
+    thread.start()
+    thread.join()
+    usage = profiler.stop()
+    assert usage.http_request_count == 0
+    assert usage.http_time == 0
+
+
+def test_profile_is_saved_only_for_phase_over_threshold(tmpdir):
+    directory = str(tmpdir.join("profiles"))
+    with PhaseProfile("tests/test_a.py::test_fast", "call", threshold=10, directory=directory) as profile:
+        pass
+    assert profile.path is None
+    with PhaseProfile("tests/test_a.py::test_slow[param]", "setup", threshold=0, directory=directory) as profile:
+        sum(range(1000))
+    assert os.path.basename(profile.path) == "tests_test_a.py_test_slow_param_-setup.prof"
+    assert os.path.isfile(profile.path)
@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from modules.test_scheduling import predict_durations, split_into_shards
+
+
+def test_predicted_duration_is_median_of_history():
+    durations = predict_durations(["a", "b"], {"a": [1, 100, 3], "b": [4]}, default_duration=30)
+    assert durations == {"a": 3, "b": 4}
+
+
+def test_tests_without_history_are_predicted_from_other_tests():
+    durations = predict_durations(["a", "b", "c", "d"], {"a": [1], "b": [2], "c": [10], "d": []},
+                                  default_duration=30)
+    assert durations["d"] == 2
+
+
+def test_default_duration_is_used_without_any_history():
+    assert predict_durations(["a", "b"], {}, default_duration=30) == {"a": 30, "b": 30}
+
+
+def test_shards_are_balanced_longest_first():
+    durations = {"t.py::a": 7, "t.py::b": 5, "t.py::c": 4, "t.py::d": 3, "t.py::e": 2, "u.py::f": 1}
+    durations = {"{}::T{}::test".format(*nodeid.split("::")): duration for nodeid, duration in durations.items()}
+    shards = split_into_shards(list(durations), durations, shard_count=2)
+    assert [shard.predicted_duration for shard in shards] == [11, 11]
+    assert [durations[nodeid] for nodeid in shards[0].nodeids] == [7, 3, 1]
+    assert [durations[nodeid] for nodeid in shards[1].nodeids] == [5, 4, 2]
+
+
+def test_tests_of_class_are_kept_together_in_collection_order():
+    nodeids = ["t.py::TestA::test_1", "t.py::TestA::test_2", "t.py::TestA::test_3", "t.py::test_b", "u.py::test_c"]
+    durations = {nodeids[0]: 1, nodeids[1]: 1, nodeids[2]: 1, nodeids[3]: 2, nodeids[4]: 2}
+    shards = split_into_shards(nodeids, durations, shard_count=3)
+    assert shards[0].nodeids == nodeids[:3]
+    assert sorted(nodeid for shard in shards for nodeid in shard.nodeids) == sorted(nodeids)
+
+
+def test_more_shards_than_units():
+    shards = split_into_shards(["t.py::test_a"], {"t.py::test_a": 1}, shard_count=3)
+    assert [shard.nodeids for shard in shards] == [["t.py::test_a"], [], []]
@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2016 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+# need to set required variables
+os.environ["PT_TAP_DOMAIN"] = "test"
+os.environ["PT_ADMIN_PASSWORD"] = "test"
+
+from benchmarks import startup_benchmark
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _json
+import time:      1500 |       1620 |   json
+import time:       300 |       1920 | config
+not an import time line
+"""
+
+
+def test_parse_importtime_returns_times_in_milliseconds_and_depth():
+    imports = startup_benchmark.parse_importtime(IMPORTTIME_OUTPUT)
+    assert imports == [("_json", 0.12, 0.12, 2), ("json", 1.5, 1.62, 1), ("config", 0.3, 1.92, 0)]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="python -X importtime requires python 3.7+")
+def test_profile_import_reports_imported_module():
+    imports = startup_benchmark.profile_import("config")
+    assert imports[-1][0] == "config"
+
+
+def test_profile_import_times_whole_import_without_importtime():
+    with mock.patch.object(startup_benchmark, "IMPORTTIME_SUPPORTED", False):
+        imports = startup_benchmark.profile_import("config")
+    assert len(imports) == 1
+    module, self_time, cumulative_time, depth = imports[0]
+    assert (module, depth) == ("config", 0)
+    assert self_time == cumulative_time > 0